@@ -0,0 +1,123 @@
+"""
+Offline micro-benchmarks for the benchmark harness itself.
+
+Runs the Executor (prediction loop + scoring) and the QAEnricher (query execution + result formatting) against
+the fake LLM and the in-process Neo4j stand-in, so the numbers reflect harness overhead only.
+
+    python benchmark_harness.py --sizes 1000 10000 100000 --llm-latency constant:0
+"""
+import argparse
+import contextlib
+import io
+import json
+import time
+from typing import Dict, List, Tuple
+
+from graph_agents_benchmark.src.executor import Executor
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+from graph_agents_benchmark.src.infrastucture.fake_neo4j import FakeNeo4jDriver
+from graph_agents_benchmark.src.solutions.fake import FakeSolution
+from graph_agents_benchmark.src.utils.latency import LatencyModel
+from graph_agents_benchmark.src.utils.qa_enricher import QAEnricher
+
+DB_USER = "neo4j"
+DB_PASSWORD = "neo4j_test_password"
+DB_NAME = "bench"
+DB_URL = "fake://"
+
+BENCH_CYPHER = "MATCH (m:Movie) WHERE m.released > 2000 RETURN m.title AS title, m.released AS released"
+BENCH_ROWS = [{"title": f"Movie {i}", "released": 2000 + i} for i in range(10)]
+
+
+def build_dataset(size: int) -> List[Tuple[str, str]]:
+    return [(f"Which movies were released after 2000? #{i}", json.dumps(BENCH_ROWS)) for i in range(size)]
+
+
+def calculate_accuracy(question, expected, actual):
+    return float(expected == actual)
+
+
+def bench_executor(size: int, llm_latency: str, db_latency: str) -> Dict[str, float]:
+    Neo4jDriverRegistry.register(
+        DB_URL, DB_USER, DB_PASSWORD, DB_NAME,
+        FakeNeo4jDriver(default_rows=BENCH_ROWS, latency=LatencyModel.parse(db_latency)),
+    )
+    solution = FakeSolution(
+        model_name=f"fake/{llm_latency}",
+        db_user=DB_USER,
+        db_password=DB_PASSWORD,
+        db_url=DB_URL,
+        db_name=DB_NAME,
+    )
+    executor = Executor(solution.predict, build_dataset(size), verbose=False)
+
+    start_time = time.perf_counter()
+    results = executor.execute(calculate_accuracy)
+    wall_time = time.perf_counter() - start_time
+
+    predict_time = sum(r["time_taken"] for r in results)
+    return {
+        "questions": size,
+        "wall_time": wall_time,
+        "questions_per_second": size / wall_time,
+        "overhead_us_per_question": (wall_time - predict_time) / size * 1e6,
+    }
+
+
+def bench_enricher(size: int, db_latency: str) -> Dict[str, float]:
+    Neo4jDriverRegistry.register(
+        DB_URL, DB_USER, DB_PASSWORD, DB_NAME,
+        FakeNeo4jDriver(results={BENCH_CYPHER: BENCH_ROWS}, latency=LatencyModel.parse(db_latency)),
+    )
+    enricher = QAEnricher(DB_NAME, neo4j_uri=DB_URL, neo4j_user=DB_USER, neo4j_password=DB_PASSWORD)
+    dataset = [{"question": f"q{i}", "cypher": BENCH_CYPHER} for i in range(size)]
+
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in enricher.enrich(dataset):
+            pass
+    wall_time = time.perf_counter() - start_time
+
+    return {
+        "questions": size,
+        "wall_time": wall_time,
+        "questions_per_second": size / wall_time,
+        "overhead_us_per_question": wall_time / size * 1e6,
+    }
+
+
+def print_report(name: str, rows: List[Dict[str, float]]) -> None:
+    print(f"\n{name}")
+    print(f"{'questions':>10} {'wall [s]':>10} {'q/s':>12} {'overhead [us/q]':>16}")
+    for row in rows:
+        print(
+            f"{row['questions']:>10} {row['wall_time']:>10.3f} "
+            f"{row['questions_per_second']:>12.1f} {row['overhead_us_per_question']:>16.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure benchmark harness throughput offline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Number of questions per run.")
+    parser.add_argument("--llm-latency", default="constant:0",
+                        help="Fake LLM latency spec <distribution>[:<mean>[:<spread>]] in seconds.")
+    parser.add_argument("--db-latency", default="constant:0",
+                        help="Fake Neo4j latency spec <distribution>[:<mean>[:<spread>]] in seconds.")
+    parser.add_argument("--output", help="Optional JSON file the report is written to.")
+    args = parser.parse_args()
+
+    report = {
+        "executor": [bench_executor(size, args.llm_latency, args.db_latency) for size in args.sizes],
+        "enricher": [bench_enricher(size, args.db_latency) for size in args.sizes],
+    }
+    print_report("Executor (predict + scoring)", report["executor"])
+    print_report("QAEnricher (query + formatting)", report["enricher"])
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compares two stored benchmark runs (see `main.py --runs-dir`) and exits with status 1 on a significant regression.
+
+    python compare_runs.py previous latest --solution langchain
+    python compare_runs.py 20250101T120000 results/runs/langchain/20250102T090000123456Z-1a2b3c4d
+
+Runs are referenced by directory, run id (or unique prefix), "latest" or "previous". Deltas are candidate minus
+baseline with bootstrap confidence intervals.
+"""
+import argparse
+import json
+import sys
+
+from graph_agents_benchmark.src.utils.run_store import RUNS_DIR, RunStore, compare_runs
+
+METADATA_KEYS = ("run_id", "git_sha", "git_dirty", "model", "dataset_hash", "questions", "batch_size", "workers")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two stored benchmark runs.")
+    parser.add_argument("baseline", help="Baseline run: directory, run id prefix, 'latest' or 'previous'.")
+    parser.add_argument("candidate", help="Candidate run: directory, run id prefix, 'latest' or 'previous'.")
+    parser.add_argument("--solution", default=None, help="Only consider runs of this solution when resolving ids.")
+    parser.add_argument("--runs-dir", default=RUNS_DIR, help="Directory of stored runs.")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level of the intervals.")
+    parser.add_argument("--resamples", type=int, default=2000, help="Number of bootstrap resamples.")
+    parser.add_argument("--latency-tolerance", type=float, default=0.05,
+                        help="Relative latency increase tolerated before it counts as a regression.")
+    parser.add_argument("--accuracy-tolerance", type=float, default=0.0,
+                        help="Absolute accuracy/BLEU decrease tolerated before it counts as a regression.")
+    parser.add_argument("--seed", type=int, default=0, help="Bootstrap seed.")
+    parser.add_argument("--output", default=None, help="Optional JSON file the comparison is written to.")
+    args = parser.parse_args()
+
+    store = RunStore(args.runs_dir)
+    baseline_results, baseline_metadata = RunStore.load(store.resolve(args.baseline, args.solution))
+    candidate_results, candidate_metadata = RunStore.load(store.resolve(args.candidate, args.solution))
+
+    print(f"{'':>14} {'baseline':>40} {'candidate':>40}")
+    for key in METADATA_KEYS:
+        print(f"{key:>14} {str(baseline_metadata.get(key)):>40} {str(candidate_metadata.get(key)):>40}")
+    if baseline_metadata.get("dataset_hash") != candidate_metadata.get("dataset_hash"):
+        print("⚠️ Runs used different datasets")
+
+    comparison = compare_runs(
+        baseline_results,
+        candidate_results,
+        resamples=args.resamples,
+        confidence=args.confidence,
+        latency_tolerance=args.latency_tolerance,
+        accuracy_tolerance=args.accuracy_tolerance,
+        seed=args.seed,
+    )
+
+    print(f"\n{'metric':>10} {'baseline':>10} {'candidate':>10} {'delta':>10} "
+          f"{f'{args.confidence:.0%} CI':>22} {'change':>8}")
+    for name, metric in comparison["metrics"].items():
+        relative = f"{metric['relative_delta']:+.1%}" if metric["relative_delta"] is not None else "-"
+        verdict = "❌ worse" if metric["regressed"] else "✅ better" if metric["improved"] else ""
+        print(f"{name:>10} {metric['baseline']:>10.4f} {metric['candidate']:>10.4f} {metric['delta']:>+10.4f} "
+              f"[{metric['ci_low']:>+9.4f}, {metric['ci_high']:>+9.4f}] {relative:>8} {verdict}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"baseline": baseline_metadata, "candidate": candidate_metadata, **comparison}, f, indent=4)
+
+    if comparison["regressions"]:
+        print(f"\n❌ Significant regression in: {', '.join(comparison['regressions'])}")
+        sys.exit(1)
+    print("\n✅ No significant regression")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,26 @@
+import argparse
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-import pandas as pd
-
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
 from graph_agents_benchmark.src.infrastucture.neo4jdocker import Neo4jComposeRunner
 from graph_agents_benchmark.src.models import Column
 from graph_agents_benchmark.src.utils.data_loaders import HuggingFaceDataLoader
+from graph_agents_benchmark.src.settings import ROOT_DIR
+from graph_agents_benchmark.src.utils.cypher_gate import CypherGate
+from graph_agents_benchmark.src.utils.dataset_manifest import DatasetManifest, EnrichedRowIndex, row_fingerprint
+from graph_agents_benchmark.src.utils.dataset_writer import (
+    COMPRESSIONS,
+    FORMATS,
+    MultiSinkWriter,
+    concat_outputs,
+    dataset_path,
+    read_rows,
+)
 from graph_agents_benchmark.src.utils.qa_enricher import QAEnricher
+from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+from graph_agents_benchmark.src.utils.schema_snapshot import SchemaStore
 
 DUMPS = [
     "twitch-50",
@@ -17,6 +32,58 @@ DUMPS = [
 
 DATABASES = [db_name.split("-")[0] for db_name in DUMPS]
 
+# EXPLAIN pre-validation of dataset Cypher: "reject" skips runaway queries, "flag" only reports them.
+CYPHER_GATE_MODE = "reject"
+MAX_ESTIMATED_ROWS = 1_000_000
+
+DUMPS_DIR = os.path.join(ROOT_DIR, "neo4j", "dumps")
+MANIFEST_PATH = "./datasets/manifest.json"
+
+parser = argparse.ArgumentParser(description="Create question/Cypher/answer datasets from the Neo4j dumps.")
+parser.add_argument(
+    "--incremental",
+    action="store_true",
+    help="Only re-enrich rows whose dump or question/Cypher changed since the last build (see datasets/manifest.json).",
+)
+parser.add_argument(
+    "--parallel",
+    type=int,
+    default=1,
+    help="Number of databases built concurrently, each on its own Neo4j container with dynamically allocated ports.",
+)
+parser.add_argument(
+    "--format",
+    choices=FORMATS,
+    default="jsonl",
+    help="Output format of the dataset files.",
+)
+parser.add_argument(
+    "--compression",
+    choices=COMPRESSIONS,
+    default="none",
+    help="Compression of JSONL output files.",
+)
+parser.add_argument(
+    "--profile-queries",
+    choices=QueryProfiler.MODES,
+    default=None,
+    help="Store each row's query cost ('summary' timings or full 'profile' db hits) and write a per-database report.",
+)
+parser.add_argument(
+    "--canonical-answers",
+    action="store_true",
+    help="Serialize record answers with sorted keys, so equal results always produce identical answer strings.",
+)
+parser.add_argument(
+    "--memory-limit",
+    default="5g",
+    help="Memory limit of each Neo4j container.",
+)
+args = parser.parse_args()
+
+manifest = DatasetManifest.load(MANIFEST_PATH)
+schema_store = SchemaStore()
+
 print(f"GOING TO CREATE DATASET FOR DUMPS {DUMPS} ( DATABASES : {DATABASES} )")
 
 ds_name = "neo4j/text2cypher-2025v1"
@@ -36,68 +103,140 @@ print(f"#### TOTAL ROWS IN Q&Cypher DATASET : {len(dictionaries)}")
 print("*" * 100)
 print("_" * 100)
 
-filtered_datasets_list = []
-unfiltered_datasets_list = []
 
-for dump_name, database_name in list(zip(DUMPS, DATABASES)):
+def build_database(dump_name: str, database_name: str):
     print("*" * 100)
     print(
         f"GOING TO CREATE QUESTION AND ANSWERS DATASET FOR DATABASE NAME: {database_name} WHERE DUMP NAME: {dump_name}")
-    questions_and_cypher_ds = list(filter(lambda d: database_name in d['database'], dictionaries))
-    print()
-    print(f"Size of questions and cypher ds {len(questions_and_cypher_ds)} rows")
-    n4j = Neo4jComposeRunner(dump_name)
-    print(f"Starting Neo4j in docker for dataset [{dump_name}] and dump [{dump_name}]")
-    n4j.start()
-    print(f"Database has [{str(n4j.count_nodes())}]")
-    print()
-    print(f"Creating questions and answers enricher for database [{database_name}] dataset [{dump_name}]")
-    qae = QAEnricher(dump_name)
-    # 
-    print()
-    print("Starting Q&Cypher enrichment")
-    print("*" * 100)
-    ds_with_questions_and_answers = qae.enrich(questions_and_cypher_ds)
-    print()
-    print("*" * 100)
-    print(f"Stopping Neo4j in docker for database [{database_name}] and dump [{dump_name}]")
-    n4j.stop()
+    def questions_and_cypher_ds():
+        return filter(lambda d: database_name in d['database'], dictionaries)
+
     print()
+    print(f"Size of questions and cypher ds {sum(1 for _ in questions_and_cypher_ds())} rows")
+
+    dump_fingerprint = manifest.dump_fingerprint(os.path.join(DUMPS_DIR, f"{dump_name}.dump"))
+    output_dir = f"./datasets/{database_name}"
+    filtered_path = dataset_path(
+        f"{output_dir}/questions_and_answers_{database_name}_filtered", args.format, args.compression)
+    unfiltered_path = dataset_path(
+        f"{output_dir}/questions_and_answers_{database_name}_unfiltered", args.format, args.compression)
+    if dump_fingerprint is None:
+        print(f"⚠️ Dump file for [{dump_name}] not found in {DUMPS_DIR}, its rows are always re-enriched")
+    # Reused and newly enriched rows live in an on-disk index, so peak memory does not grow with the dataset.
+    os.makedirs(output_dir, exist_ok=True)
+    if args.incremental and manifest.is_current(database_name, dump_fingerprint, args.canonical_answers):
+        enriched_rows = EnrichedRowIndex.from_file(unfiltered_path, directory=output_dir)
+        print(f"Reusing {len(enriched_rows)} enriched rows of unchanged dump [{dump_name}]")
+    else:
+        enriched_rows = EnrichedRowIndex(directory=output_dir)
+
+    def pending_rows():
+        # Checked when the enricher asks for its next row: a repeated row is enriched once, as its first
+        # occurrence was indexed by then.
+        for row in questions_and_cypher_ds():
+            if row_fingerprint(row) not in enriched_rows:
+                yield dict(row)
+
+    def output_rows(enriched):
+        for row in questions_and_cypher_ds():
+            fingerprint = row_fingerprint(row)
+            enriched_row = enriched_rows.get(fingerprint)
+            if enriched_row is None:
+                enriched_row = next(enriched)
+                enriched_rows.put(fingerprint, enriched_row)
+            yield {**enriched_row, **row}
+
+    pending = sum(1 for row in questions_and_cypher_ds() if row_fingerprint(row) not in enriched_rows)
+    print(f"[{database_name}] Rows to enrich: {pending}")
+
+    n4j = None
+    cypher_gate = None
+    qae = None
+    try:
+        if pending:
+            n4j = Neo4jComposeRunner(dump_name, isolated=args.parallel > 1, memory_limit=args.memory_limit)
+            print(f"Starting Neo4j in docker for dataset [{dump_name}] and dump [{dump_name}]")
+            n4j.start()
+            print(f"Database has [{str(n4j.count_nodes())}]")
+            print()
+            print(f"Creating questions and answers enricher for database [{database_name}] dataset [{dump_name}]")
+            cypher_gate = CypherGate(
+                Neo4jDriverRegistry.get(n4j.uri, "neo4j", "neo4j_test_password", dump_name),
+                database=dump_name,
+                mode=CYPHER_GATE_MODE,
+                max_estimated_rows=MAX_ESTIMATED_ROWS,
+            )
+            query_profiler = QueryProfiler(args.profile_queries) if args.profile_queries else None
+            schema, loaded = schema_store.load_or_capture(
+                Neo4jDriverRegistry.get(n4j.uri, "neo4j", "neo4j_test_password", dump_name),
+                database=dump_name,
+                dump=dump_name,
+            )
+            print(f"[{database_name}] Schema snapshot {'loaded' if loaded else 'captured'} "
+                  f"({len(schema.property_keys)} property keys)")
+            qae = QAEnricher(dump_name, neo4j_uri=n4j.uri, cypher_gate=cypher_gate, canonical=args.canonical_answers,
+                             query_profiler=query_profiler, schema=schema)
+            # 
+            print()
+            print(f"[{database_name}] Starting Q&Cypher enrichment")
+            print("*" * 100)
+
+        # Rows are enriched while they are written; each row is routed to both per-database outputs.
+        with MultiSinkWriter() as writer:
+            filtered_sink = writer.add_sink(filtered_path, lambda item: item['answer'] is not None)
+            unfiltered_sink = writer.add_sink(unfiltered_path)
+            writer.write_all(output_rows(qae.enrich(pending_rows()) if qae is not None else iter(())))
+        if cypher_gate is not None:
+            print(f"[{database_name}] Cypher gate stats: {cypher_gate.stats}")
+            print()
+    finally:
+        enriched_rows.close()
+        if n4j is not None:
+            print("*" * 100)
+            print(f"Stopping Neo4j in docker for database [{database_name}] and dump [{dump_name}]")
+            n4j.stop()
+            print()
+
+    manifest.record(database_name, dump_fingerprint, unfiltered_sink.rows, args.canonical_answers)
+    manifest.save()
+    if args.profile_queries:
+        # Streamed back from the written output, which holds the reused and the newly enriched rows.
+        profile_report = QueryProfiler.report(read_rows(unfiltered_path))
+        with open(f"{output_dir}/query_profile_report.json", "w") as f:
+            json.dump(profile_report, f, indent=4)
+        for expensive in profile_report["databases"].get(dump_name, {}).get("most_expensive", []):
+            print(f"[{database_name}] ⚠️ Expensive query ({expensive['db_hits']} db hits, "
+                  f"{expensive['db_time_ms']} ms): {expensive['query']}")
     print("*" * 100)
-    print(f"Enriched dataset size is  {len(ds_with_questions_and_answers)}")
+    print(f"[{database_name}] Enriched dataset size is  {unfiltered_sink.rows}")
     print()
-    ds_with_questions_and_answers_filtered = list(
-        filter(lambda item: item['answer'] is not None, ds_with_questions_and_answers))
-    print(f"Filtered dataset with answers size is  {len(ds_with_questions_and_answers_filtered)}")
+    print(f"[{database_name}] Filtered dataset with answers size is  {filtered_sink.rows}")
     print()
 
-    filtered_datasets_list.extend(ds_with_questions_and_answers_filtered)
-    unfiltered_datasets_list.extend(ds_with_questions_and_answers)
+    return (filtered_path, filtered_sink.rows), (unfiltered_path, unfiltered_sink.rows)
 
-    output_dir = f"./datasets/{database_name}"
-    os.makedirs(output_dir, exist_ok=True)
 
-    df = pd.DataFrame(ds_with_questions_and_answers_filtered)
-    df.to_json(f"./datasets/{database_name}/questions_and_answers_{database_name}_filtered.jsonl", orient="records",
-               lines=True, force_ascii=False)
+filtered_outputs = []
+unfiltered_outputs = []
 
-    df = pd.DataFrame(ds_with_questions_and_answers)
-    df.to_json(f"./datasets/{database_name}/questions_and_answers_{database_name}_unfiltered.jsonl", orient="records",
-               lines=True, force_ascii=False)
+# Databases are built concurrently on isolated Neo4j instances; outputs are merged in DUMPS order.
+with ThreadPoolExecutor(max_workers=max(1, args.parallel)) as pool:
+    builds = [pool.submit(build_database, dump_name, database_name) for dump_name, database_name in zip(DUMPS, DATABASES)]
+    for build in builds:
+        filtered, unfiltered = build.result()
+        filtered_outputs.append(filtered)
+        unfiltered_outputs.append(unfiltered)
 # 
 # 
-filtered_df = pd.DataFrame(filtered_datasets_list)
-filtered_df.to_json(f"./datasets/full_questions_and_answers_filtered.jsonl", orient="records",
-                    lines=True, force_ascii=False)
-
-unfiltered_df = pd.DataFrame(unfiltered_datasets_list)
-unfiltered_df.to_json(f"./datasets/full_questions_and_answers_unfiltered.jsonl", orient="records",
-                      lines=True, force_ascii=False)
+concat_outputs([path for path, _ in filtered_outputs],
+               dataset_path("./datasets/full_questions_and_answers_filtered", args.format, args.compression))
+concat_outputs([path for path, _ in unfiltered_outputs],
+               dataset_path("./datasets/full_questions_and_answers_unfiltered", args.format, args.compression))
 
 print("*" * 100)
 print("*" * 100)
 print("*" * 100)
-print(f"UNFILTERED DATASET SIZE IS: {len(unfiltered_df)}")
-print(f"FILTERED DATASET SIZE IS: {len(filtered_df)}")
+print(f"UNFILTERED DATASET SIZE IS: {sum(rows for _, rows in unfiltered_outputs)}")
+print(f"FILTERED DATASET SIZE IS: {sum(rows for _, rows in filtered_outputs)}")
 print("*" * 100)
 print("*" * 100)
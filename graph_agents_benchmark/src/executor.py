@@ -1,27 +1,55 @@
 import time
 from collections.abc import Callable
+from itertools import chain, islice
+from typing import Any, Dict, List, Optional, Sequence
 
 import nltk
+import numpy as np
 from pyclbr import Function
 
-nltk.download("punkt")
-
 
 class Executor:
     """
     Executes a given predictor function on a dataset and calculates accuracy and BLEU score.
     """
 
-    def __init__(self, predictor: Callable, dataset):
+    def __init__(
+            self,
+            predictor: Callable,
+            dataset,
+            batch_predictor: Optional[Callable] = None,
+            batch_size: int = 1,
+            metadata_provider: Optional[Callable] = None,
+            warmup: int = 0,
+            metrics=None,
+            verbose: bool = True,
+            warmup_done: Optional[Callable] = None,
+    ):
         """
         Initializes the Executor with a predictor function and a dataset.
 
         Args:
             predictor (Function): A function that takes a question as input and returns an answer.
-            dataset: A list of (question, expected_answer) tuples.
+            dataset: An iterable of (question, expected_answer) or (question, expected_answer, metadata) tuples. It is consumed lazily, so generators start executing immediately.
+            batch_predictor (Optional[Function]): A function that takes a list of questions and returns a list of answers.
+            batch_size (int): The micro-batch size fed to `batch_predictor`. Batching is used only when it is greater than 1.
+            metadata_provider (Optional[Function]): A function that takes a question after its prediction and returns extra fields for its result row.
+            warmup (int): The number of leading dataset questions additionally run as unscored warmup before the measured run, which answers them again. Their warmup latencies are kept in `warmup_times`.
+            metrics (Optional[RunMetrics]): Live run metrics updated as questions start, complete or fail.
+            verbose (bool): Print every question with its expected and actual answer.
+            warmup_done (Optional[Function]): Called after the warmup questions to drop the state they left behind (caches, chat memory, per-question details).
         """
         self.predictor = predictor
         self.dataset = dataset
+        self.batch_predictor = batch_predictor
+        self.batch_size = batch_size
+        self.metadata_provider = metadata_provider
+        self.warmup = warmup
+        self.warmup_times: List[float] = []
+        self.run_time: Optional[float] = None
+        self.warmup_done = warmup_done
+        self.metrics = metrics
+        self.verbose = verbose
 
     def execute(self, accuracy_function: Function):
         """
@@ -33,31 +61,191 @@ class Executor:
         Returns:
             list: A list of dictionaries, where each dictionary contains the question, expected answer, actual answer, accuracy, BLEU score, and time taken for each question.
         """
+        rows = self._run_warmup(iter(self.dataset))
+        start_time = time.time()
+        if self.batch_predictor is not None and self.batch_size > 1:
+            results = self._execute_batched(accuracy_function, rows)
+        else:
+            results = self._execute_sequential(accuracy_function, rows)
+        self.run_time = time.time() - start_time
+        return results
+
+    def _execute_sequential(self, accuracy_function: Function, rows):
         results = []
-        for question, expected_answer in self.dataset:
+        for row in rows:
+            question, expected_answer, metadata = Executor._unpack(row)
+            if self.metrics is not None:
+                self.metrics.start()
             start_time = time.time()
-            actual_answer = self.predictor(question)
+            try:
+                actual_answer = self.predictor(question)
+            except Exception:
+                if self.metrics is not None:
+                    self.metrics.fail()
+                raise
 
             end_time = time.time()
             time_taken = end_time - start_time
 
-            print("Question: " + question)
-            print("Expected Answer: " + expected_answer)
-            print("Actual Answer:" + actual_answer)
-            accuracy = accuracy_function(question, expected_answer, actual_answer)
-            blue_score = nltk.translate.bleu_score.sentence_bleu(
-                [expected_answer], actual_answer
+            result = self._evaluate(
+                question, expected_answer, actual_answer, time_taken, accuracy_function, self.verbose
             )
+            if metadata:
+                result["metadata"] = metadata
+            if self.metadata_provider is not None:
+                result.update(self.metadata_provider(question))
+            if self.metrics is not None:
+                self.metrics.observe(result)
+            results.append(result)
 
-            results.append(
-                {
-                    "question": question,
-                    "expected_answer": expected_answer,
-                    "actual_answer": actual_answer,
-                    "accuracy": accuracy,
-                    "blue_score": blue_score,
-                    "time_taken": time_taken,
-                }
-            )
+        return results
+
+    def _execute_batched(self, accuracy_function: Function, rows):
+        """
+        Executes the batch predictor on micro-batches of the dataset.
+
+        Every question of a batch is answered when the whole batch is, so its latency `time_taken` is the batch
+        wall time (also kept in `batch_time`). The gain of batching shows in `throughput_qps` of `latency_report`.
+        """
+        results = []
+        while batch := [Executor._unpack(row) for row in islice(rows, self.batch_size)]:
+            questions = [question for question, _, _ in batch]
+
+            if self.metrics is not None:
+                self.metrics.start(len(batch))
+            start_time = time.time()
+            try:
+                actual_answers = self.batch_predictor(questions)
+            except Exception:
+                if self.metrics is not None:
+                    self.metrics.fail(len(batch))
+                raise
+            batch_time = time.time() - start_time
+
+            if len(actual_answers) != len(batch):
+                raise ValueError(
+                    f"Batch predictor returned {len(actual_answers)} answers for {len(batch)} questions."
+                )
+
+            for (question, expected_answer, metadata), actual_answer in zip(batch, actual_answers):
+                result = self._evaluate(
+                    question, expected_answer, actual_answer, batch_time, accuracy_function, self.verbose
+                )
+                if metadata:
+                    result["metadata"] = metadata
+                result["batch_size"] = len(batch)
+                result["batch_time"] = batch_time
+                if self.metadata_provider is not None:
+                    result.update(self.metadata_provider(question))
+                if self.metrics is not None:
+                    self.metrics.observe(result)
+                results.append(result)
 
         return results
+
+    def _run_warmup(self, rows):
+        """
+        Runs the first `warmup` questions unscored to take model loading, connection setup and schema fetching
+        out of the measured latencies, then calls `warmup_done`. Returns all rows: the warmup questions are
+        answered again and scored in the measured run, so a warmup never removes questions from the results.
+        """
+        self.warmup_times = []
+        warmup_rows = list(islice(rows, self.warmup))
+        for row in warmup_rows:
+            question, _, _ = Executor._unpack(row)
+            start_time = time.time()
+            self.predictor(question)
+            self.warmup_times.append(time.time() - start_time)
+        if warmup_rows and self.warmup_done is not None:
+            self.warmup_done()
+        return chain(warmup_rows, rows)
+
+    @staticmethod
+    def latency_report(
+            results: List[Dict[str, Any]],
+            init_time: Optional[float] = None,
+            warmup_times: Sequence[float] = (),
+            run_time: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Splits latency into cold start and steady state.
+
+        Cold start is the first prediction after the solution was built: the first warmup question, or the first
+        measured question when there was no warmup (it is then left out of the steady state).
+
+        Args:
+            results (list): Result rows returned by `execute`.
+            init_time (Optional[float]): Seconds spent building the solution, if measured.
+            warmup_times (Sequence[float]): Latencies of the warmup questions.
+            run_time (Optional[float]): Wall time of the measured run (`Executor.run_time`), if measured.
+
+        Returns:
+            dict: init_time, cold_start_time, warmup stats, steady-state avg/p50/p95/p99 latency and, given
+            `run_time`, the throughput in questions per second.
+        """
+        cold_start_time, steady_times = Executor.split_cold_start(
+            [r["time_taken"] for r in results], warmup_times
+        )
+        report = Executor.latency_summary(init_time, cold_start_time, warmup_times, steady_times)
+        if run_time:
+            report["run_time"] = run_time
+            report["throughput_qps"] = len(results) / run_time
+        return report
+
+    @staticmethod
+    def split_cold_start(times: Sequence[float], warmup_times: Sequence[float] = ()):
+        """
+        Returns the cold start latency and the steady-state latencies of one solution instance.
+        """
+        if warmup_times:
+            return warmup_times[0], list(times)
+        if not times:
+            return None, []
+        return times[0], list(times[1:])
+
+    @staticmethod
+    def latency_summary(
+            init_time: Optional[float],
+            cold_start_time: Optional[float],
+            warmup_times: Sequence[float],
+            steady_times: Sequence[float],
+    ) -> Dict[str, Any]:
+        report = {
+            "init_time": init_time,
+            "cold_start_time": cold_start_time,
+            "warmup_questions": len(warmup_times),
+            "warmup_avg_time": float(np.mean(warmup_times)) if len(warmup_times) else None,
+            "steady_state_questions": len(steady_times),
+            "steady_state_avg_time": float(np.mean(steady_times)) if len(steady_times) else None,
+        }
+        for p in (50, 95, 99):
+            report[f"steady_state_p{p}_time"] = float(np.percentile(steady_times, p)) if len(steady_times) else None
+        return report
+
+    @staticmethod
+    def _unpack(row):
+        if len(row) == 3:
+            return row
+        question, expected_answer = row
+        return question, expected_answer, None
+
+    @staticmethod
+    def _evaluate(question, expected_answer, actual_answer, time_taken, accuracy_function: Function,
+                  verbose: bool = True) -> dict:
+        if verbose:
+            print("Question: " + question)
+            print("Expected Answer: " + expected_answer)
+            print("Actual Answer:" + actual_answer)
+        accuracy = accuracy_function(question, expected_answer, actual_answer)
+        blue_score = nltk.translate.bleu_score.sentence_bleu(
+            [expected_answer], actual_answer
+        )
+
+        return {
+            "question": question,
+            "expected_answer": expected_answer,
+            "actual_answer": actual_answer,
+            "accuracy": accuracy,
+            "blue_score": blue_score,
+            "time_taken": time_taken,
+        }
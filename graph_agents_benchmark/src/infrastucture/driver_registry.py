@@ -0,0 +1,123 @@
+import atexit
+import hashlib
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from neo4j import Driver, GraphDatabase
+
+from graph_agents_benchmark.src.infrastucture.fake_neo4j import FAKE_URI_SCHEME, FakeNeo4jDriver
+from graph_agents_benchmark.src.utils.latency import LatencyModel
+
+DriverKey = Tuple[str, str, str, Optional[str]]
+
+
+def _driver_key(uri: str, user: str, password: str, database: Optional[str]) -> DriverKey:
+    # Credentials are part of the key, so two passwords for the same uri/user never share a pool.
+    return uri, user, hashlib.sha256((password or "").encode("utf-8")).hexdigest(), database
+
+
+class Neo4jDriverRegistry:
+    """
+    Process-wide registry of Neo4j drivers keyed by (uri, user, password, database).
+
+    Every component that talks to Neo4j (solutions, enricher, compose runner) obtains its driver here, so a
+    process opens one connection pool per database instead of one per component. Pool size and liveness
+    settings are tuned in one place, either through the class attributes or the environment.
+
+    A `fake://<distribution>[:<mean>[:<spread>]]` uri yields an in-process FakeNeo4jDriver instead, for offline
+    harness runs. Pre-built drivers (e.g. a FakeNeo4jDriver with canned results) can be injected with `register`.
+    """
+
+    max_pool_size: int = int(os.environ.get("NEO4J_MAX_POOL_SIZE", 50))
+    # Idle pooled connections older than this are pinged by the driver before being handed out.
+    liveness_check_timeout: float = float(os.environ.get("NEO4J_LIVENESS_CHECK_TIMEOUT", 30))
+    # A cached driver is re-verified with a round trip at most this often.
+    verify_interval: float = float(os.environ.get("NEO4J_VERIFY_INTERVAL", 60))
+
+    _drivers: Dict[DriverKey, Driver] = {}
+    _verified_at: Dict[DriverKey, float] = {}
+    # Guards the dicts above; connectivity checks only hold the lock of their key, so a slow or unreachable
+    # database never blocks `get` for another one.
+    _lock = threading.Lock()
+    _key_locks: Dict[DriverKey, threading.Lock] = {}
+
+    @classmethod
+    def get(
+            cls,
+            uri: str,
+            user: str,
+            password: str,
+            database: Optional[str] = None,
+            verify: bool = True,
+    ) -> Driver:
+        """
+        Returns the shared driver for (uri, user, password, database), creating it on first use.
+
+        A failed connectivity check raises but keeps the driver: solutions already hold it, and the driver
+        reconnects by itself once the database is reachable again. The next `get` checks again.
+
+        Raises:
+            neo4j.exceptions.Neo4jError / neo4j.exceptions.DriverError: If `verify` is set and the database is unreachable.
+        """
+        key = _driver_key(uri, user, password, database)
+        with cls._lock:
+            driver = cls._drivers.get(key)
+            if driver is None and uri.startswith(FAKE_URI_SCHEME):
+                driver = FakeNeo4jDriver(latency=LatencyModel.parse(uri[len(FAKE_URI_SCHEME):]))
+                cls._drivers[key] = driver
+                cls._verified_at[key] = 0.0
+            elif driver is None:
+                driver = GraphDatabase.driver(
+                    uri,
+                    auth=(user, password),
+                    max_connection_pool_size=cls.max_pool_size,
+                    liveness_check_timeout=cls.liveness_check_timeout,
+                )
+                cls._drivers[key] = driver
+                cls._verified_at[key] = 0.0
+            key_lock = cls._key_locks.setdefault(key, threading.Lock())
+
+        if verify:
+            with key_lock:
+                if time.monotonic() - cls._verified_at.get(key, 0.0) > cls.verify_interval:
+                    driver.verify_connectivity()
+                    with cls._lock:
+                        if cls._drivers.get(key) is driver:
+                            cls._verified_at[key] = time.monotonic()
+
+        return driver
+
+    @classmethod
+    def register(cls, uri: str, user: str, password: str, database: Optional[str], driver) -> None:
+        """
+        Registers an externally built driver under (uri, user, password, database), replacing any existing one.
+        """
+        key = _driver_key(uri, user, password, database)
+        with cls._lock:
+            cls._discard(key)
+            cls._drivers[key] = driver
+            cls._verified_at[key] = 0.0
+
+    @classmethod
+    def close(cls, uri: Optional[str] = None) -> None:
+        """
+        Closes the registered drivers for `uri`, or every driver when `uri` is None.
+        """
+        with cls._lock:
+            for key in [key for key in cls._drivers if uri is None or key[0] == uri]:
+                cls._discard(key)
+
+    @classmethod
+    def _discard(cls, key: DriverKey) -> None:
+        driver = cls._drivers.pop(key, None)
+        cls._verified_at.pop(key, None)
+        if driver is not None:
+            try:
+                driver.close()
+            except Exception as e:
+                print(f"❌ Failed to close Neo4j driver for {key[0]}. Error: {e}")
+
+
+atexit.register(Neo4jDriverRegistry.close)
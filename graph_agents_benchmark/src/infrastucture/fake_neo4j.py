@@ -0,0 +1,120 @@
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from neo4j import Record
+
+from graph_agents_benchmark.src.utils.latency import LatencyModel
+
+FAKE_URI_SCHEME = "fake://"
+
+
+PROFILE_PREFIX = re.compile(r"(?i)^\s*PROFILE\s+")
+
+
+def _normalize(query: str) -> str:
+    return " ".join(query.split())
+
+
+class FakeSummary:
+    """
+    Subset of `neo4j.ResultSummary`: timings in milliseconds and, for PROFILE queries, a single-operator profile
+    with one db hit per row.
+    """
+
+    def __init__(self, result_available_after: int, rows: int, profiled: bool = False):
+        self.result_available_after = result_available_after
+        self.result_consumed_after = 0
+        self.plan = None
+        self.profile = None
+        self.notifications = []
+        if profiled:
+            self.profile = {"operatorType": "ProduceResults@fake", "rows": rows, "dbHits": rows, "children": []}
+
+
+class FakeResult:
+    """
+    Subset of `neo4j.Result` used by the enricher and the solutions.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], summary: Optional[FakeSummary] = None):
+        self._records = [Record(row) for row in rows]
+        self._summary = summary or FakeSummary(0, len(rows))
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self._records)
+
+    def value(self, key=0, default=None) -> List[Any]:
+        return [record.get(key, default) if isinstance(key, str) else record[key] for record in self._records]
+
+    def single(self, strict: bool = False) -> Optional[Record]:
+        if strict and len(self._records) != 1:
+            raise ValueError(f"Expected a single record, found {len(self._records)}.")
+        return self._records[0] if self._records else None
+
+    def data(self, *keys) -> List[Dict[str, Any]]:
+        return [record.data(*keys) for record in self._records]
+
+    def consume(self) -> FakeSummary:
+        return self._summary
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeNeo4jDriver", database: Optional[str] = None):
+        self._driver = driver
+        self.database = database
+
+    def __enter__(self) -> "FakeSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None, **kwargs) -> FakeResult:
+        profiled = PROFILE_PREFIX.match(query) is not None
+        start_time = time.perf_counter()
+        rows = self._driver.answer(PROFILE_PREFIX.sub("", query))
+        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        return FakeResult(rows, FakeSummary(elapsed_ms, len(rows), profiled))
+
+    def close(self) -> None:
+        pass
+
+
+class FakeNeo4jDriver:
+    """
+    In-process stand-in for a Neo4j driver.
+
+    Answers queries with canned rows keyed by whitespace-normalized Cypher, falling back to `default_rows`,
+    after a latency drawn from `latency`. `CALL db.propertyKeys()` returns `property_keys`, which defaults
+    to every `alias.property` referenced by the canned queries.
+    """
+
+    def __init__(self, results: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 default_rows: Optional[List[Dict[str, Any]]] = None,
+                 property_keys: Optional[List[str]] = None,
+                 latency: Optional[LatencyModel] = None):
+        self._results = {_normalize(q): rows for q, rows in (results or {}).items()}
+        self._default_rows = default_rows if default_rows is not None else [{"count": 0}]
+        if property_keys is None:
+            property_keys = sorted({key for q in self._results for key in re.findall(r"\b\w+\.(\w+)", q)})
+        self._property_keys = property_keys
+        self.latency = latency or LatencyModel()
+        self.queries = 0
+
+    def answer(self, query: str) -> List[Dict[str, Any]]:
+        self.queries += 1
+        normalized = _normalize(query)
+        if normalized == "CALL db.propertyKeys()":
+            return [{"propertyKey": key} for key in self._property_keys]
+        self.latency.wait()
+        return self._results.get(normalized, self._default_rows)
+
+    def session(self, database: Optional[str] = None, **kwargs) -> FakeSession:
+        return FakeSession(self, database)
+
+    def verify_connectivity(self, **kwargs) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
@@ -1,49 +1,153 @@
 import os
+import shutil
+import socket
+import tempfile
 import time
 from typing import Optional
 
 from python_on_whales import DockerClient
+from python_on_whales.exceptions import DockerException
 
-from neo4j import GraphDatabase
-
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
 from graph_agents_benchmark.src.settings import ROOT_DIR
 
 
 class Neo4jComposeRunner:
+    """
+    Starts a Neo4j container for one database through docker compose.
+
+    By default the single shared `neo4j-benchmark` container is used on ports 7687/7474 with the data in
+    `neo4j/data`. With `isolated=True` the instance gets its own compose project and container, a private copy of
+    the database files and dynamically allocated ports (unless given), so several runners can work concurrently.
+    An isolated container runs as the host user that owns the copied files, and a start that loses a dynamically
+    allocated port to another process is retried on fresh ports.
+    """
+
+    PORT_CONFLICT_MARKERS = ("port is already allocated", "address already in use")
+
     def __init__(
             self,
             db_name: str,
             user: str = "neo4j",
             password: str = "neo4j_test_password",
             compose_file: Optional[str] = "docker-compose.yaml",
+            isolated: bool = False,
+            bolt_port: Optional[int] = None,
+            http_port: Optional[int] = None,
+            memory_limit: str = "5g",
     ):
         self._db_name = db_name
         self._user = user
         self._password = password
-        self._uri = "bolt://localhost:7687"
         self._compose_file = compose_file
+        self._isolated = isolated
+        self._dynamic_ports = isolated and bolt_port is None and http_port is None
+        self._bolt_port = bolt_port or (Neo4jComposeRunner._free_port() if isolated else 7687)
+        self._http_port = http_port or (Neo4jComposeRunner._free_port() if isolated else 7474)
+        self._memory_limit = memory_limit
+        self._uri = f"bolt://localhost:{self._bolt_port}"
         self._started = False
 
         compose_file_path = os.path.join(ROOT_DIR, self._compose_file)
         if not os.path.exists(compose_file_path):
             raise FileNotFoundError("There is no compose file at {}".format(compose_file_path))
-        self._docker = DockerClient(compose_files=[])
+
+        self._data_dir = os.path.join(ROOT_DIR, "neo4j", "data")
+        compose_files = [compose_file_path]
+        project_name = None
+        if isolated:
+            project_name = f"neo4j-benchmark-{db_name}".lower()
+            self._data_dir = os.path.join(ROOT_DIR, "neo4j", "instances", db_name)
+            compose_files.append(Neo4jComposeRunner._write_user_override(project_name))
+
+        self._project_name = project_name or "neo4j-benchmark"
+        self._env_file = self._write_env_file()
+        self._docker = DockerClient(
+            compose_files=compose_files,
+            compose_env_files=[self._env_file],
+            compose_project_name=project_name,
+        )
+
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    @staticmethod
+    def _free_port() -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("localhost", 0))
+            return s.getsockname()[1]
+
+    def _write_env_file(self) -> str:
+        env_file = os.path.join(tempfile.gettempdir(), f"{self._project_name}.env")
+        with open(env_file, "w") as f:
+            for key, value in {
+                "NEO4J_DB": self._db_name,
+                "NEO4J_CONTAINER_NAME": self._project_name,
+                "NEO4J_BOLT_PORT": self._bolt_port,
+                "NEO4J_HTTP_PORT": self._http_port,
+                "NEO4J_DATA_DIR": self._data_dir,
+                "NEO4J_MEMORY_LIMIT": self._memory_limit,
+            }.items():
+                f.write(f"{key}={value}\n")
+        return env_file
+
+    @staticmethod
+    def _write_user_override(project_name: str) -> str:
+        """Compose override running the container as the host user, who owns the private copy of the data."""
+        override_file = os.path.join(tempfile.gettempdir(), f"{project_name}.override.yaml")
+        with open(override_file, "w") as f:
+            f.write("services:\n")
+            f.write("  neo4j-benchmark:\n")
+            f.write(f'    user: "{os.getuid()}:{os.getgid()}"\n')
+        return override_file
+
+    def _prepare_isolated_data(self) -> None:
+        shared_data_dir = os.path.join(ROOT_DIR, "neo4j", "data")
+        for sub_dir in ("databases", "transactions"):
+            source = os.path.join(shared_data_dir, sub_dir, self._db_name)
+            target = os.path.join(self._data_dir, sub_dir, self._db_name)
+            os.makedirs(os.path.join(self._data_dir, sub_dir), exist_ok=True)
+            if os.path.isdir(source):
+                shutil.copytree(source, target, dirs_exist_ok=True)
+
+    def _compose_up(self, retries: int = 3) -> None:
+        for attempt in range(1, retries + 1):
+            try:
+                self._docker.compose.up(detach=True)
+                return
+            except DockerException as e:
+                message = str(e).lower()
+                if not self._dynamic_ports or attempt == retries \
+                        or not any(marker in message for marker in Neo4jComposeRunner.PORT_CONFLICT_MARKERS):
+                    raise
+                # Another process took a port between allocation and `compose up`: pick fresh ones and retry.
+                self._docker.compose.down()
+                self._bolt_port = Neo4jComposeRunner._free_port()
+                self._http_port = Neo4jComposeRunner._free_port()
+                self._uri = f"bolt://localhost:{self._bolt_port}"
+                self._write_env_file()
+                print(f"🔁 Port conflict, retrying on {self._uri}...")
 
     def start(self):
-        print(f"🟢 Starting Neo4j with database '{self._db_name}' using {self._compose_file}...")
-        os.environ["NEO4J_DB"] = self._db_name
-        self._docker.compose.up(detach=True)
+        print(f"🟢 Starting Neo4j with database '{self._db_name}' using {self._compose_file} on {self._uri}...")
+        if self._isolated:
+            self._prepare_isolated_data()
+        self._compose_up()
         self._wait_for_neo4j_ready()
 
     def stop(self):
         print("🛑 Stopping Neo4j Compose setup...")
+        Neo4jDriverRegistry.close(self._uri)
         self._docker.compose.down()
+        if self._isolated:
+            shutil.rmtree(self._data_dir, ignore_errors=True)
 
     def _wait_for_neo4j_ready(self, retries=30, delay=2):
         print("⏳ Waiting for Neo4j to become ready via Bolt...")
         for attempt in range(1, retries + 1):
             try:
-                driver = GraphDatabase.driver(self._uri, auth=(self._user, self._password))
+                driver = Neo4jDriverRegistry.get(self._uri, self._user, self._password, self._db_name)
                 with driver.session(database=self._db_name) as session:
                     session.run("RETURN 1")
                 print("✅ Neo4j is ready.")
@@ -52,26 +156,17 @@ class Neo4jComposeRunner:
             except Exception as e:
                 print(f"🔁 Attempt {attempt}: {e}")
                 time.sleep(delay)
-            finally:
-                try:
-                    driver.close()
-                except Exception as e:
-                    print(f"❌ Neo4j connection closed. Error: {e}")
-                    pass
         self.stop()
         raise RuntimeError("❌ Neo4j did not become ready in time.")
 
     def count_nodes(self) -> int | None:
         print("🔍 Checking node count...")
         if self._started:
-            driver = GraphDatabase.driver(self._uri, auth=(self._user, self._password))
-            try:
-                with driver.session(database=self._db_name) as session:
-                    count = session.run("MATCH (n) RETURN count(n) AS count").single()["count"]
-                    print(f"📊 Node count in '{self._db_name}': {count}")
-                    return count
-            finally:
-                driver.close()
+            driver = Neo4jDriverRegistry.get(self._uri, self._user, self._password, self._db_name)
+            with driver.session(database=self._db_name) as session:
+                count = session.run("MATCH (n) RETURN count(n) AS count").single()["count"]
+                print(f"📊 Node count in '{self._db_name}': {count}")
+                return count
         else:
             print("❌ Neo4j did not become ready in time.")
             return None
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from graph_agents_benchmark.src.llm.embeddings import batch_embedding_function
+from graph_agents_benchmark.src.settings import OUTPUT_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are only serialized within the process
+    fcntl = None
+
+EMBEDDING_CACHE_DIR = os.path.join(OUTPUT_DIR, "embedding_cache")
+
+VECTORS_FILE = "vectors.f32"
+KEYS_FILE = "keys.txt"
+META_FILE = "meta.json"
+LOCK_FILE = ".lock"
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class VectorCache:
+    """
+    Persistent, append-only embedding cache of one model, keyed by the SHA-256 of the text.
+
+    Vectors are stored as a raw float32 matrix read through a memory map, `keys.txt` holds one text hash per row.
+    A row only counts once its key is written, so an interrupted append is ignored on the next load. Appends from
+    several processes (e.g. `ProcessExecutor` workers) are serialized with a file lock.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str):
+        self.model_name = model_name
+        self.cache_dir = os.path.join(cache_dir, re.sub(r"[^\w.-]+", "_", model_name))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._vectors_path = os.path.join(self.cache_dir, VECTORS_FILE)
+        self._keys_path = os.path.join(self.cache_dir, KEYS_FILE)
+        self._meta_path = os.path.join(self.cache_dir, META_FILE)
+        self._rows: Dict[str, int] = {}
+        self._keys_offset = 0
+        self._vectors: Optional[np.ndarray] = None
+        self.dimensions: Optional[int] = None
+        self._lock = threading.Lock()
+        with self._lock:
+            self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Cached vectors of `texts`, None for texts that were never embedded with this model.
+        """
+        keys = [text_key(text) for text in texts]
+        with self._lock:
+            if any(key not in self._rows for key in keys):
+                self._refresh()
+            rows = [self._rows.get(key) for key in keys]
+            vectors = self._vectors
+        return [np.array(vectors[row]) if row is not None else None for row in rows]
+
+    def put(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+        keys = [text_key(text) for text in texts]
+        with self._lock, self._file_lock():
+            self._refresh()
+            if self.dimensions is None:
+                self.dimensions = int(matrix.shape[1])
+                with open(self._meta_path, "w") as f:
+                    json.dump({"model": self.model_name, "dimensions": self.dimensions}, f, indent=4)
+            elif matrix.shape[1] != self.dimensions:
+                raise ValueError(f"Expected {self.dimensions}-dimensional vectors, got {matrix.shape[1]}")
+
+            new = {}
+            for i, key in enumerate(keys):
+                if key not in self._rows:
+                    new.setdefault(key, i)
+            if not new:
+                return
+            with open(self._vectors_path, "r+b" if os.path.exists(self._vectors_path) else "wb") as f:
+                # Overwrite a partial row left by an interrupted append.
+                f.seek(len(self._rows) * self.dimensions * 4)
+                f.write(matrix[list(new.values())].tobytes())
+            with open(self._keys_path, "a") as f:
+                # Drop a partial key line left by an interrupted append.
+                f.truncate(self._keys_offset)
+                f.write("".join(f"{key}\n" for key in new))
+                self._keys_offset = f.tell()
+            for key in new:
+                self._rows[key] = len(self._rows)
+            self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r",
+                                      shape=(len(self._rows), self.dimensions))
+
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.cache_dir, LOCK_FILE), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _refresh(self) -> None:
+        if self.dimensions is None and os.path.exists(self._meta_path):
+            with open(self._meta_path) as f:
+                self.dimensions = json.load(f)["dimensions"]
+        if os.path.exists(self._keys_path):
+            with open(self._keys_path) as f:
+                f.seek(self._keys_offset)
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    self._rows.setdefault(line.strip(), len(self._rows))
+                    self._keys_offset += len(line)
+        if self._rows and self.dimensions:
+            self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r",
+                                      shape=(len(self._rows), self.dimensions))
+
+
+class EmbeddingPipeline:
+    """
+    Batched, concurrent embedding of many texts through a persistent `VectorCache`, so every text is embedded
+    once per model across all runs.
+
+    It exposes the LangChain (`embed_query`/`embed_documents`) and LlamaIndex (`get_text_embedding[_batch]`)
+    calls, so it can replace a solution's `embed_model` transparently.
+    """
+
+    def __init__(self, embed_model, model_name: str, cache: Optional[VectorCache] = None,
+                 cache_dir: Optional[str] = EMBEDDING_CACHE_DIR, batch_size: int = 64, max_concurrency: int = 4):
+        """
+        Args:
+            embed_model: The LangChain or LlamaIndex embedding model doing the actual embedding.
+            model_name (str): The model name the cache is keyed by.
+            cache (Optional[VectorCache]): The vector cache. Defaults to one under `cache_dir`.
+            cache_dir (Optional[str]): Root directory of the vector caches. None disables caching.
+            batch_size (int): Texts per embedding call.
+            max_concurrency (int): Embedding calls in flight at a time.
+        """
+        self.embed_model = embed_model
+        self.model_name = model_name
+        if cache is None and cache_dir:
+            cache = VectorCache(cache_dir, model_name)
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self._embed_batch = batch_embedding_function(embed_model)
+        self.stats = {"texts": 0, "cache_hits": 0, "embedded": 0, "batches": 0}
+        self._stats_lock = threading.Lock()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embeddings of `texts` as a (len(texts), dimensions) float32 matrix, in input order.
+        """
+        texts = list(texts)
+        if not texts:
+            dimensions = self.cache.dimensions if self.cache is not None and self.cache.dimensions else 0
+            return np.empty((0, dimensions), dtype=np.float32)
+        cached = self.cache.get(texts) if self.cache is not None else [None] * len(texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+
+        embedded: Dict[str, np.ndarray] = {}
+        if missing:
+            batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(batches)))) as pool:
+                for batch, vectors in zip(batches, pool.map(self._embed_batch, batches)):
+                    matrix = np.asarray(vectors, dtype=np.float32).reshape(len(batch), -1)
+                    if self.cache is not None:
+                        self.cache.put(batch, matrix)
+                    embedded.update(zip(batch, matrix))
+            with self._stats_lock:
+                self.stats["batches"] += len(batches)
+
+        with self._stats_lock:
+            self.stats["texts"] += len(texts)
+            self.stats["cache_hits"] += sum(vector is not None for vector in cached)
+            self.stats["embedded"] += len(missing)
+        return np.stack([vector if vector is not None else embedded[text] for text, vector in zip(texts, cached)])
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed([text])[0].tolist()
+
+    def get_text_embedding_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        return self.embed_documents(texts)
+
+    def get_text_embedding(self, text: str) -> List[float]:
+        return self.embed_query(text)
@@ -0,0 +1,31 @@
+from typing import Callable, List, Optional, Sequence
+
+
+def embedding_function(embed_model) -> Callable[[str], Sequence[float]]:
+    """
+    Returns the single-text embedding call of a LangChain or LlamaIndex embedding model.
+    """
+    if hasattr(embed_model, "embed_query"):
+        return embed_model.embed_query
+    if hasattr(embed_model, "get_text_embedding"):
+        return embed_model.get_text_embedding
+    raise TypeError(f"Unsupported embedding model: {type(embed_model)}")
+
+
+def embedding_model_name(embed_model, default: Optional[str] = None) -> Optional[str]:
+    """
+    Returns the model name of a LangChain (`model`/`model_name`) or LlamaIndex (`model_name`) embedding model.
+    """
+    name = getattr(embed_model, "model_name", None) or getattr(embed_model, "model", None)
+    return name if isinstance(name, str) else default
+
+
+def batch_embedding_function(embed_model) -> Callable[[List[str]], List[Sequence[float]]]:
+    """
+    Returns the multi-text embedding call of a LangChain or LlamaIndex embedding model.
+    """
+    if hasattr(embed_model, "embed_documents"):
+        return embed_model.embed_documents
+    if hasattr(embed_model, "get_text_embedding_batch"):
+        return embed_model.get_text_embedding_batch
+    raise TypeError(f"Unsupported embedding model: {type(embed_model)}")
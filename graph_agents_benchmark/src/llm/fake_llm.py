@@ -0,0 +1,89 @@
+import hashlib
+import json
+import math
+import re
+from typing import Dict, List, Optional
+
+from graph_agents_benchmark.src.utils.latency import LatencyModel
+
+DEFAULT_CYPHER = "MATCH (n) RETURN count(n) AS count"
+
+
+class FakeLLM:
+    """
+    Deterministic offline LLM stand-in.
+
+    Answers a prompt with its canned Cypher (exact match on the stripped prompt) or `default_response`,
+    after sleeping for a latency drawn from `latency`. Exposes both the LangChain (`invoke`) and the
+    LlamaIndex (`complete`) call styles.
+    """
+
+    def __init__(self, responses: Optional[Dict[str, str]] = None, default_response: str = DEFAULT_CYPHER,
+                 latency: Optional[LatencyModel] = None):
+        self.responses = {k.strip(): v for k, v in (responses or {}).items()}
+        self.default_response = default_response
+        self.latency = latency or LatencyModel()
+        self.calls = 0
+
+    @staticmethod
+    def from_jsonl(file_path: str, question_key: str = "question", cypher_key: str = "cypher",
+                   latency: Optional[LatencyModel] = None) -> "FakeLLM":
+        """
+        Loads canned responses from an enriched dataset file, mapping every question to its gold Cypher.
+        """
+        responses = {}
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if row.get(question_key) and row.get(cypher_key):
+                    responses[row[question_key]] = row[cypher_key]
+        return FakeLLM(responses=responses, latency=latency)
+
+    def invoke(self, prompt, **kwargs) -> str:
+        self.calls += 1
+        self.latency.wait()
+        return self.responses.get(str(prompt).strip(), self.default_response)
+
+    def complete(self, prompt, **kwargs) -> str:
+        return self.invoke(prompt, **kwargs)
+
+    def batch(self, prompts: List[str], **kwargs) -> List[str]:
+        return [self.invoke(prompt) for prompt in prompts]
+
+
+class FakeEmbedding:
+    """
+    Deterministic bag-of-words hashing embedding.
+
+    Texts that share words get similar vectors, which is enough to exercise similarity-based code paths offline.
+    """
+
+    def __init__(self, dimensions: int = 64, latency: Optional[LatencyModel] = None):
+        self.dimensions = dimensions
+        self.model_name = f"fake-embedding-{dimensions}"
+        self.latency = latency or LatencyModel()
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for token in re.findall(r"\w+", text.lower()):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            index = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[index] += 1.0 if digest[4] % 2 == 0 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_query(self, text: str) -> List[float]:
+        self.latency.wait()
+        return self._embed(text)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.latency.wait()
+        return [self._embed(text) for text in texts]
+
+    def get_text_embedding(self, text: str) -> List[float]:
+        return self.embed_query(text)
+
+    def get_text_embedding_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        return self.embed_documents(texts)
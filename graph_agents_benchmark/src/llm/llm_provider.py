@@ -1,16 +1,16 @@
 import os
 from typing import Tuple
 
-from google.auth.credentials import Credentials
-from google.oauth2.service_account import Credentials as ServiceAccountCredentials
-
 from graph_agents_benchmark.src.models import Frameworks
+from graph_agents_benchmark.src.utils.latency import LatencyModel
 
 
 class ModelsProvider:
 
     @staticmethod
     def provide(framework: Frameworks, llm_model: str):
+        if llm_model.startswith("fake/"):
+            return ModelsProvider.__get_fake(llm_model)
         match framework:
             case Frameworks.LANGCHAIN:
                 return ModelsProvider.__get_langchain(llm_model)
@@ -19,6 +19,17 @@ class ModelsProvider:
             case Frameworks.CUSTOM:
                 return ModelsProvider.__get_custom(llm_model)
 
+    @staticmethod
+    def __get_vertex_credentials():
+        # google-auth is only needed for Vertex models, so fake/ and ollama/ runs work without it.
+        from google.auth.credentials import Credentials
+        from google.oauth2.service_account import Credentials as ServiceAccountCredentials
+
+        service_account = os.environ.get("GOOGLE_SERVICE_ACCOUNT_FILE")
+        if service_account:
+            return ServiceAccountCredentials.from_service_account_file(service_account)
+        return Credentials()
+
     @staticmethod
     def __get_llama_index(model, **kwargs):
         from llama_index.core.settings import Settings
@@ -27,14 +38,8 @@ class ModelsProvider:
             from llama_index.llms.vertex import Vertex
             from llama_index.embeddings.vertex import VertexTextEmbedding
             import vertexai
-            from google.oauth2 import service_account
-
-            service_account = os.environ.get("GOOGLE_SERVICE_ACCOUNT_FILE")
-            if service_account:
-                credentials = ServiceAccountCredentials.from_service_account_file(service_account)
-            else:
-                credentials = Credentials()
-                
+
+            credentials = ModelsProvider.__get_vertex_credentials()
             model = model.replace("vertex/", "")
             llm = Vertex(model, "dev-ai-demo", "us-central1")
             embed_model = VertexTextEmbedding(
@@ -73,11 +78,7 @@ class ModelsProvider:
             from langchain_google_vertexai import VertexAIEmbeddings
             import vertexai
 
-            service_account = os.environ.get("GOOGLE_SERVICE_ACCOUNT_FILE")
-            if service_account:
-                credentials = ServiceAccountCredentials.from_service_account_file(service_account)
-            else:
-                credentials = Credentials()
+            credentials = ModelsProvider.__get_vertex_credentials()
 
             model = model.replace("vertex/", "")
             print(f"NEW MODEL NAME : {model}")
@@ -94,3 +95,19 @@ class ModelsProvider:
     @staticmethod
     def __get_custom(model):
         pass
+
+    @staticmethod
+    def __get_fake(model):
+        """
+        Offline stand-in selected with `fake/<distribution>[:<mean>[:<spread>]]`, e.g. `fake/lognormal:0.8:0.3`.
+        Canned question -> Cypher responses are read from the JSONL file in FAKE_LLM_RESPONSES when set.
+        """
+        from graph_agents_benchmark.src.llm.fake_llm import FakeLLM, FakeEmbedding
+
+        latency = LatencyModel.parse(model.replace("fake/", ""))
+        responses_file = os.environ.get("FAKE_LLM_RESPONSES")
+        if responses_file:
+            llm = FakeLLM.from_jsonl(responses_file, latency=latency)
+        else:
+            llm = FakeLLM(latency=latency)
+        return llm, FakeEmbedding()
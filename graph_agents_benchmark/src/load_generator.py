@@ -0,0 +1,171 @@
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+ARRIVALS = ("constant", "poisson")
+
+# Achieved/offered throughput ratio below which a load level counts as saturated.
+SATURATION_THROUGHPUT_RATIO = 0.95
+
+
+class LoadGenerator:
+    """
+    Open-loop load generator: issues `predictor` calls at a target rate for a fixed duration, independent of
+    how fast earlier calls complete.
+
+    Requests are served by a pool of `concurrency` threads, so once the solution cannot keep up requests wait
+    for a free thread and the wait shows up as queueing delay, separate from the service time of the call.
+    """
+
+    def __init__(
+            self,
+            predictor: Callable,
+            questions: Sequence[str],
+            rps: float,
+            duration: float,
+            arrivals: str = "poisson",
+            concurrency: int = 64,
+            window: float = 1.0,
+            seed: int = 0,
+    ):
+        """
+        Initializes the LoadGenerator.
+
+        Args:
+            predictor (Callable): A function that takes a question and returns an answer, e.g. `Solution.predict`.
+            questions (Sequence[str]): Questions sampled (uniformly, with replacement) for each request.
+            rps (float): The target request rate.
+            duration (float): Seconds during which requests are issued. In-flight requests are awaited afterwards.
+            arrivals (str): "constant" for evenly spaced requests or "poisson" for exponential inter-arrival times.
+            concurrency (int): The number of requests served at the same time.
+            window (float): Width in seconds of the time series buckets.
+            seed (int): Seed of the question sampling and arrival process.
+        """
+        if arrivals not in ARRIVALS:
+            raise ValueError(f"Unknown arrival process '{arrivals}', expected one of {ARRIVALS}")
+        if rps <= 0 or duration <= 0:
+            raise ValueError("rps and duration must be positive")
+        if not questions:
+            raise ValueError("No questions to sample from")
+        self.predictor = predictor
+        self.questions = list(questions)
+        self.rps = rps
+        self.duration = duration
+        self.arrivals = arrivals
+        self.concurrency = concurrency
+        self.window = window
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests: List[Dict[str, Any]] = []
+
+    def _arrival_offsets(self):
+        offset = 0.0
+        while True:
+            if self.arrivals == "constant":
+                offset += 1.0 / self.rps
+            else:
+                offset += self._random.expovariate(self.rps)
+            if offset >= self.duration:
+                return
+            yield offset
+
+    def _serve(self, question: str, scheduled: float) -> None:
+        started = time.perf_counter()
+        error = None
+        try:
+            self.predictor(question)
+        except Exception as e:
+            error = repr(e)
+        finished = time.perf_counter()
+        with self._lock:
+            self.requests.append({
+                "question": question,
+                "scheduled": scheduled,
+                "started": started,
+                "finished": finished,
+                "queue_delay": started - scheduled,
+                "service_time": finished - started,
+                "latency": finished - scheduled,
+                "error": error,
+            })
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Runs the load and returns its report, see `report`.
+        """
+        self.requests = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            start = time.perf_counter()
+            for offset in self._arrival_offsets():
+                scheduled = start + offset
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._serve, self._random.choice(self.questions), scheduled)
+        return self.report(start)
+
+    def report(self, start: float) -> Dict[str, Any]:
+        """
+        Summarizes the requests of a run.
+
+        Returns:
+            dict: Offered and achieved rate, error rate, queueing delay / service time / latency percentiles,
+            a `saturated` flag and a `timeline` of per-window arrivals, completions, errors and latencies.
+        """
+        requests = sorted(self.requests, key=lambda r: r["scheduled"])
+        end = max((r["finished"] for r in requests), default=start)
+        errors = sum(1 for r in requests if r["error"] is not None)
+        report = {
+            "target_rps": self.rps,
+            "arrivals": self.arrivals,
+            "duration": self.duration,
+            "concurrency": self.concurrency,
+            "requests": len(requests),
+            "errors": errors,
+            "error_rate": errors / len(requests) if requests else 0.0,
+            "offered_rps": len(requests) / self.duration,
+            "throughput": (len(requests) - errors) / (end - start) if end > start else 0.0,
+        }
+        for metric in ("queue_delay", "service_time", "latency"):
+            report.update(LoadGenerator._percentiles(metric, [r[metric] for r in requests]))
+        report["saturated"] = bool(
+            report["throughput"] < SATURATION_THROUGHPUT_RATIO * report["offered_rps"]
+            or (report["queue_delay_p95"] or 0) > (report["service_time_p50"] or 0)
+        )
+        report["timeline"] = self._timeline(requests, start, end)
+        return report
+
+    def _timeline(self, requests: List[Dict[str, Any]], start: float, end: float) -> List[Dict[str, Any]]:
+        buckets = int(np.ceil((end - start) / self.window)) if end > start else 0
+        timeline = [
+            {"t": i * self.window, "arrivals": 0, "completed": 0, "errors": 0, "queue_delays": [], "latencies": []}
+            for i in range(buckets)
+        ]
+        for request in requests:
+            timeline[min(int((request["scheduled"] - start) / self.window), buckets - 1)]["arrivals"] += 1
+            bucket = timeline[min(int((request["finished"] - start) / self.window), buckets - 1)]
+            bucket["completed"] += 1
+            bucket["errors"] += request["error"] is not None
+            bucket["queue_delays"].append(request["queue_delay"])
+            bucket["latencies"].append(request["latency"])
+
+        for bucket in timeline:
+            queue_delays = bucket.pop("queue_delays")
+            latencies = bucket.pop("latencies")
+            bucket["throughput"] = (bucket["completed"] - bucket["errors"]) / self.window
+            bucket["error_rate"] = bucket["errors"] / bucket["completed"] if bucket["completed"] else 0.0
+            bucket["queue_delay_avg"] = float(np.mean(queue_delays)) if queue_delays else None
+            bucket["latency_p95"] = float(np.percentile(latencies, 95)) if latencies else None
+        return timeline
+
+    @staticmethod
+    def _percentiles(name: str, values: List[float]) -> Dict[str, Optional[float]]:
+        stats = {f"{name}_avg": float(np.mean(values)) if values else None}
+        for p in (50, 95, 99):
+            stats[f"{name}_p{p}"] = float(np.percentile(values, p)) if values else None
+        return stats
@@ -8,6 +8,8 @@ class Frameworks(str, Enum):
     LLAMA_INDEX = 'llamaindex'
     LANGCHAIN = 'langchain'
     CUSTOM = 'custom'
+    FAKE = 'fake'
+    VECTOR_RAG = 'vectorrag'
 
 
 class Column(BaseModel):
@@ -0,0 +1,225 @@
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+from collections.abc import Callable
+from itertools import chain, islice
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyclbr import Function
+
+from graph_agents_benchmark.src.executor import Executor
+
+# Seconds between liveness checks of the workers while waiting for results.
+POLL_INTERVAL = 1.0
+
+
+def _worker_main(worker_id: int, worker_factory: Callable, warmup_questions: List[str], tasks, results) -> None:
+    """
+    Worker loop: builds the predictor once and warms it up, then answers questions from `tasks` until it receives None.
+    """
+    start_time = time.time()
+    warmup_times = []
+    try:
+        predictor, metadata_provider, warmup_done = worker_factory()
+        init_time = time.time() - start_time
+        for question in warmup_questions:
+            start_time = time.time()
+            predictor(question)
+            warmup_times.append(time.time() - start_time)
+        if warmup_questions and warmup_done is not None:
+            warmup_done()
+    except Exception:
+        results.put(("init_error", worker_id, traceback.format_exc()))
+        return
+    results.put(("ready", worker_id, (init_time, warmup_times)))
+
+    while (task := tasks.get()) is not None:
+        position, question = task
+        try:
+            start_time = time.time()
+            actual_answer = predictor(question)
+            time_taken = time.time() - start_time
+            metadata = metadata_provider(question) if metadata_provider is not None else {}
+        except Exception:
+            results.put(("error", worker_id, (position, traceback.format_exc())))
+            return
+        results.put(("result", worker_id, (position, actual_answer, time_taken, metadata)))
+
+
+class ProcessExecutor:
+    """
+    Executes questions on a pool of worker processes, each owning a warm solution instance.
+
+    CPU-bound solution work (prompt building, tokenization, result formatting) is not serialized by the GIL,
+    so throughput scales with the number of workers. Scoring stays in the parent process.
+    """
+
+    def __init__(
+            self,
+            worker_factory: Callable,
+            dataset,
+            workers: Optional[int] = None,
+            max_in_flight: Optional[int] = None,
+            warmup: int = 0,
+            metrics=None,
+            verbose: bool = True,
+    ):
+        """
+        Initializes the ProcessExecutor.
+
+        Args:
+            worker_factory (Function): A picklable function that builds the solution inside a worker and returns a (predictor, metadata_provider, warmup_done) tuple. metadata_provider and warmup_done may be None.
+            dataset: An iterable of (question, expected_answer) or (question, expected_answer, metadata) tuples. It is consumed lazily.
+            workers (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+            max_in_flight (Optional[int]): The maximum number of questions queued or running at a time. Defaults to twice the number of workers.
+            warmup (int): The number of leading dataset questions every worker additionally runs unscored before taking measured questions; they are answered again in the measured run.
+            metrics (Optional[RunMetrics]): Live run metrics updated as questions are submitted, complete or fail.
+            verbose (bool): Print every question with its expected and actual answer.
+        """
+        self.worker_factory = worker_factory
+        self.dataset = dataset
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.workers
+        self.warmup = warmup
+        self.init_times: Dict[int, float] = {}
+        self.warmup_times: Dict[int, List[float]] = {}
+        self.metrics = metrics
+        self.verbose = verbose
+
+    def execute(self, accuracy_function: Function) -> List[Dict[str, Any]]:
+        """
+        Executes the dataset on the worker pool and scores answers as they stream back.
+
+        Args:
+            accuracy_function (Function): A function that takes a question, expected answer, and actual answer as input and returns an accuracy score.
+
+        Returns:
+            list: Result dictionaries in dataset order, as returned by `Executor.execute`, with the answering `worker` added.
+
+        Raises:
+            RuntimeError: If a worker fails to build its solution, fails on a question or dies.
+        """
+        # spawn keeps workers free of the parent's driver sockets and threads
+        context = multiprocessing.get_context("spawn")
+        tasks = context.Queue()
+        results_queue = context.Queue()
+        rows = iter(self.dataset)
+        warmup_rows = list(islice(rows, self.warmup))
+        warmup_questions = [Executor._unpack(row)[0] for row in warmup_rows]
+        rows = chain(warmup_rows, rows)
+        processes = [
+            context.Process(
+                target=_worker_main,
+                args=(worker_id, self.worker_factory, warmup_questions, tasks, results_queue),
+                daemon=True,
+            )
+            for worker_id in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        pending: Dict[int, Tuple[str, str, Any]] = {}
+        results: Dict[int, Dict[str, Any]] = {}
+        numbered_rows = enumerate(rows)
+        exhausted = False
+
+        def submit_next() -> None:
+            nonlocal exhausted
+            if exhausted:
+                return
+            try:
+                position, row = next(numbered_rows)
+            except StopIteration:
+                exhausted = True
+                return
+            question, expected_answer, metadata = Executor._unpack(row)
+            pending[position] = (question, expected_answer, metadata)
+            tasks.put((position, question))
+            if self.metrics is not None:
+                self.metrics.start()
+
+        try:
+            while len(pending) < self.max_in_flight and not exhausted:
+                submit_next()
+
+            while pending:
+                try:
+                    kind, worker_id, payload = results_queue.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    dead = [p.pid for p in processes if not p.is_alive()]
+                    if dead:
+                        raise RuntimeError(f"Worker processes {dead} exited unexpectedly")
+                    continue
+
+                match kind:
+                    case "ready":
+                        init_time, warmup_times = payload
+                        self.init_times[worker_id] = init_time
+                        self.warmup_times[worker_id] = warmup_times
+                        print(f"🟢 Worker {worker_id} ready in {init_time:.2f}s (+{sum(warmup_times):.2f}s warmup)")
+                    case "init_error":
+                        raise RuntimeError(f"Worker {worker_id} failed to build its solution:\n{payload}")
+                    case "error":
+                        position, error = payload
+                        if self.metrics is not None:
+                            self.metrics.fail()
+                        raise RuntimeError(f"Worker {worker_id} failed on question #{position}:\n{error}")
+                    case "result":
+                        position, actual_answer, time_taken, worker_metadata = payload
+                        question, expected_answer, metadata = pending.pop(position)
+                        result = Executor._evaluate(
+                            question, expected_answer, actual_answer, time_taken, accuracy_function, self.verbose
+                        )
+                        if metadata:
+                            result["metadata"] = metadata
+                        result["worker"] = worker_id
+                        result.update(worker_metadata)
+                        if self.metrics is not None:
+                            self.metrics.observe(result)
+                        results[position] = result
+                        submit_next()
+        finally:
+            for _ in processes:
+                tasks.put(None)
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+        return [results[position] for position in sorted(results)]
+
+    def latency_report(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Cold-start and steady-state latency over all workers, see `Executor.latency_report`.
+
+        `init_time` is the slowest worker's build time, `cold_start_time` the mean of the workers' first predictions.
+        The per-worker reports are kept under "workers".
+        """
+        cold_start_times = []
+        steady_times = []
+        warmup_times = []
+        workers = {}
+        for worker_id in sorted(self.init_times):
+            worker_results = [r for r in results if r["worker"] == worker_id]
+            worker_warmup_times = self.warmup_times.get(worker_id, [])
+            workers[str(worker_id)] = Executor.latency_report(
+                worker_results, self.init_times[worker_id], worker_warmup_times
+            )
+            cold_start_time, worker_steady_times = Executor.split_cold_start(
+                [r["time_taken"] for r in worker_results], worker_warmup_times
+            )
+            if cold_start_time is not None:
+                cold_start_times.append(cold_start_time)
+            steady_times.extend(worker_steady_times)
+            warmup_times.extend(worker_warmup_times)
+
+        report = Executor.latency_summary(
+            max(self.init_times.values(), default=None),
+            sum(cold_start_times) / len(cold_start_times) if cold_start_times else None,
+            warmup_times,
+            steady_times,
+        )
+        report["workers"] = workers
+        return report
@@ -2,3 +2,8 @@ import os
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent.parent.parent.absolute()
+
+# Base of everything a run writes (results, stored runs, caches, schema snapshots): the working directory, unless
+# BENCHMARK_OUTPUT_DIR is set. Inputs (dumps, Neo4j data) stay under ROOT_DIR.
+OUTPUT_DIR = Path(os.environ.get("BENCHMARK_OUTPUT_DIR", ".")).absolute()
+RESULTS_DIR = os.path.join(OUTPUT_DIR, "results")
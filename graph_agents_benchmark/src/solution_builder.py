@@ -0,0 +1,309 @@
+import time
+from typing import Optional
+
+from graph_agents_benchmark.src.llm.embedding_pipeline import EMBEDDING_CACHE_DIR
+from graph_agents_benchmark.src.solutions.base import Solution
+
+NEO4J_USER = "neo4j"
+# NEO4J_USER = "twitter"
+NEO4J_PASSWORD = "test_password"
+# NEO4J_PASSWORD = "twitter"
+NEO4J_URL = "bolt://0.0.0.0:7687"  # Use docker-compose service name
+NEO4J_DATABASE = "neo4j"
+
+
+# NEO4J_URL = "neo4j+s://demo.neo4jlabs.com:7687"  # Use docker-compose service name
+
+
+def get_solution(
+        solution_name: str,
+        model: str,
+        db_user: str,
+        db_password: str,
+        db_url: str,
+        db_name: str,
+        cypher_gate=None,
+        query_profiler=None,
+        embedding_cache_dir: Optional[str] = EMBEDDING_CACHE_DIR,
+        schema=None,
+) -> Solution:
+    """
+    Retrieves a solution based on the provided name.
+
+    Args:
+        solution_name (str): The name of the solution to retrieve (e.g., "langchain", "llamaindex", "vectorrag", "custom", "fake").
+        model (str): The LLM model to use for the solution.
+        db_user (str): The database user.
+        db_password (str): The database password.
+        db_url (str): The database URL.
+        db_name (str): The database name.
+        cypher_gate (Optional[CypherGate]): Validates generated Cypher with EXPLAIN before execution. Not supported by "custom".
+        query_profiler (Optional[QueryProfiler]): Captures the cost of the executed Cypher. Not supported by "custom".
+        embedding_cache_dir (Optional[str]): Persistent vector cache "vectorrag" embeds the graph's nodes through.
+        schema (Optional[SchemaSnapshot]): Stored database schema used instead of schema introspection. Not supported by "custom".
+
+    Returns:
+        Solution: An instance of the requested solution.
+
+    Raises:
+        ValueError: If an unknown solution name is provided.
+    """
+    if solution_name == "langchain":
+        from graph_agents_benchmark.src.solutions.langchain import LangChainSolution
+
+        lch = LangChainSolution(
+            config={
+                "model_name": model,
+                "db_user": db_user,
+                "db_password": db_password,
+                "db_url": db_url,
+                "db_name": db_name,
+                "cypher_gate": cypher_gate,
+                "query_profiler": query_profiler,
+                "schema": schema,
+            }
+        )
+        lch.initialize()
+        return lch
+    elif solution_name == "llamaindex":
+        from graph_agents_benchmark.src.solutions.llamaindex import LlamaIndexSolution
+
+        return LlamaIndexSolution(
+            model_name=model,
+            db_user=db_user,
+            db_password=db_password,
+            db_url=db_url,
+            db_name=db_name,
+            cypher_gate=cypher_gate,
+            query_profiler=query_profiler,
+            schema=schema,
+        )
+
+    elif solution_name == "vectorrag":
+        from graph_agents_benchmark.src.solutions.vector_rag import VectorRagSolution
+
+        return VectorRagSolution(
+            model_name=model,
+            db_user=db_user,
+            db_password=db_password,
+            db_url=db_url,
+            db_name=db_name,
+            query_profiler=query_profiler,
+            embedding_cache_dir=embedding_cache_dir,
+            schema=schema,
+        )
+
+    elif solution_name == "custom":
+        from graph_agents_benchmark.src.solutions.text2neo import Text2NeoSolution
+
+        return Text2NeoSolution(
+            model_name=model,
+            db_user=db_user,
+            db_password=db_password,
+            db_url=db_url,
+            db_name=db_name,
+        )
+    elif solution_name == "fake":
+        from graph_agents_benchmark.src.solutions.fake import FakeSolution
+
+        return FakeSolution(
+            model_name=model,
+            db_user=db_user,
+            db_password=db_password,
+            db_url=db_url,
+            db_name=db_name,
+            cypher_gate=cypher_gate,
+            query_profiler=query_profiler,
+            schema=schema,
+        )
+    else:
+        raise ValueError(f"Unknown solution: {solution_name}")
+
+
+def build_solution(
+        solution_name: str,
+        model: str,
+        db_user: str,
+        db_password: str,
+        db_url: str,
+        db_name: str,
+        semantic_cache_threshold: Optional[float] = None,
+        few_shot_dataset: Optional[str] = None,
+        few_shot_k: int = 3,
+        cypher_gate_mode: Optional[str] = None,
+        max_estimated_rows: Optional[float] = None,
+        query_profile_mode: Optional[str] = None,
+        template_dataset: Optional[str] = None,
+        template_threshold: float = 0.8,
+        template_min_support: int = 2,
+        template_database: Optional[str] = None,
+        embedding_cache_dir: Optional[str] = EMBEDDING_CACHE_DIR,
+        embedding_batch_size: int = 64,
+        embedding_concurrency: int = 4,
+        reset_between_questions: bool = False,
+        memory_profiler=None,
+        schema=None,
+):
+    """
+    Builds a solution together with its optional Cypher gate, few-shot and semantic cache wrappers.
+
+    Args:
+        solution_name (str): Name of the solution being benchmarked.
+        model (str): The LLM model to use for the solution.
+        db_user (str): The database user.
+        db_password (str): The database password.
+        db_url (str): The database URL.
+        db_name (str): The database name.
+        semantic_cache_threshold (Optional[float]): Enables the semantic question cache with this cosine similarity threshold.
+        few_shot_dataset (Optional[str]): Enriched dataset file whose examples are added to every question as few-shot prompts.
+        few_shot_k (int): The number of few-shot examples per question.
+        cypher_gate_mode (Optional[str]): Enables EXPLAIN pre-validation of generated Cypher ("flag" or "reject").
+        max_estimated_rows (Optional[float]): Planner row estimate above which the Cypher gate flags a query.
+        query_profile_mode (Optional[str]): Captures the cost of executed Cypher per question ("summary" or "profile").
+        template_dataset (Optional[str]): Enriched dataset file Cypher templates are learned from; matching questions skip the LLM.
+        template_threshold (float): The minimal template classifier confidence for skipping the LLM.
+        template_min_support (int): The minimal number of distinct questions a template is learned from.
+        template_database (Optional[str]): Only answer from templates learned for this dataset database (e.g. "movies").
+        embedding_cache_dir (Optional[str]): Persistent vector cache of the solution's embedding model. None disables it.
+        embedding_batch_size (int): Texts per embedding call.
+        embedding_concurrency (int): Embedding calls in flight at a time.
+        reset_between_questions (bool): Clear the solution's conversational state (e.g. agent chat memory) after every question.
+        memory_profiler (Optional[MemoryProfiler]): Adds the process memory after every question to its result row.
+        schema (Optional[SchemaSnapshot]): Stored database schema used instead of the solution's schema introspection.
+
+    Returns:
+        Tuple[Solution, Optional[Callable], Optional[CypherGate], Callable]: The solution, a metadata provider for the
+        result rows (None if no wrapper reports metadata), the Cypher gate (None if disabled) and the callback that
+        drops the state left behind by warmup questions.
+    """
+    cypher_gate = None
+    if cypher_gate_mode is not None:
+        from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+        from graph_agents_benchmark.src.utils.cypher_gate import CypherGate
+
+        cypher_gate = CypherGate(
+            Neo4jDriverRegistry.get(db_url, db_user, db_password, db_name),
+            database=db_name,
+            mode=cypher_gate_mode,
+            max_estimated_rows=max_estimated_rows,
+        )
+
+    query_profiler = None
+    if query_profile_mode is not None:
+        from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+
+        query_profiler = QueryProfiler(query_profile_mode)
+
+    solution = get_solution(
+        solution_name=solution_name,
+        model=model,
+        db_user=db_user,
+        db_password=db_password,
+        db_url=db_url,
+        db_name=db_name,
+        cypher_gate=cypher_gate,
+        query_profiler=query_profiler,
+        embedding_cache_dir=embedding_cache_dir,
+        schema=schema,
+    )
+
+    from graph_agents_benchmark.src.llm.embedding_pipeline import EmbeddingPipeline
+
+    if getattr(solution, "embed_model", None) is not None and not isinstance(solution.embed_model, EmbeddingPipeline):
+        from graph_agents_benchmark.src.llm.embeddings import embedding_model_name
+
+        solution.embed_model = EmbeddingPipeline(
+            solution.embed_model,
+            embedding_model_name(solution.embed_model, default=model),
+            cache_dir=embedding_cache_dir,
+            batch_size=embedding_batch_size,
+            max_concurrency=embedding_concurrency,
+        )
+
+    embed_model = getattr(solution, "embed_model", None)
+    metadata_providers = []
+    if query_profiler is not None:
+        metadata_providers.append(query_profiler.metadata)
+    if few_shot_dataset is not None:
+        from graph_agents_benchmark.src.solutions.few_shot import FewShotSolution
+        from graph_agents_benchmark.src.utils.few_shot_index import FewShotIndex
+
+        if embed_model is None:
+            raise ValueError(f"Solution {solution.get_name()} has no embedding model for few-shot examples.")
+        index = FewShotIndex.load_or_build(few_shot_dataset, embed_model, model)
+        solution = FewShotSolution(solution, index, k=few_shot_k)
+        metadata_providers.append(solution.lookup_info)
+
+    if template_dataset is not None:
+        from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+        from graph_agents_benchmark.src.solutions.template import TemplateSolution
+        from graph_agents_benchmark.src.utils.template_index import TemplateIndex
+
+        start_time = time.time()
+        index = TemplateIndex.from_dataset(template_dataset, embed_model, min_support=template_min_support)
+        print(f"Learned {len(index)} Cypher templates ({index.classifier} classifier) in {time.time() - start_time:.2f}s")
+        solution = TemplateSolution(
+            solution,
+            index,
+            Neo4jDriverRegistry.get(db_url, db_user, db_password, db_name),
+            db_name=db_name,
+            threshold=template_threshold,
+            template_database=template_database,
+            cypher_gate=cypher_gate,
+            query_profiler=query_profiler,
+        )
+        metadata_providers.append(solution.lookup_info)
+
+    if semantic_cache_threshold is not None:
+        from graph_agents_benchmark.src.solutions.semantic_cache import CachedSolution
+
+        solution = CachedSolution(solution, threshold=semantic_cache_threshold)
+        metadata_providers.append(solution.lookup_info)
+
+    # Metadata providers run after a question's time was measured, so resets and memory samples are not timed.
+    if reset_between_questions:
+        def reset_solution(question):
+            solution.reset()
+            return {}
+
+        metadata_providers.append(reset_solution)
+    if memory_profiler is not None:
+        metadata_providers.append(memory_profiler.metadata)
+
+    def metadata_provider(question):
+        metadata = {}
+        for provider in metadata_providers:
+            metadata.update(provider(question))
+        return metadata
+
+    def warmup_done():
+        # Warmup questions are answered again in the measured run; nothing they cached may carry over. clear_state
+        # also resets conversational state, which reset_solution only does after measured questions.
+        solution.clear_state()
+        if query_profiler is not None:
+            query_profiler.take()
+        if memory_profiler is not None:
+            memory_profiler.reset_baseline()
+
+    return solution, metadata_provider if metadata_providers else None, cypher_gate, warmup_done
+
+
+def build_worker(memory_profile_mode: Optional[str] = None, memory_sample_every: int = 1, **solution_kwargs):
+    """
+    Builds the solution inside a `ProcessExecutor` worker.
+
+    Args:
+        memory_profile_mode (Optional[str]): Samples the worker's memory after its questions ("rss" or "tracemalloc").
+        memory_sample_every (int): Sample memory after every n-th question only.
+        **solution_kwargs: Keyword arguments of `build_solution`.
+
+    Returns:
+        Tuple[Callable, Optional[Callable], Callable]: The predictor, metadata provider and warmup callback of the
+        worker's solution.
+    """
+    if memory_profile_mode is not None:
+        from graph_agents_benchmark.src.utils.memory_profiler import MemoryProfiler
+
+        solution_kwargs["memory_profiler"] = MemoryProfiler(memory_profile_mode, sample_every=memory_sample_every)
+    solution, metadata_provider, _, warmup_done = build_solution(**solution_kwargs)
+    return solution.predict, metadata_provider, warmup_done
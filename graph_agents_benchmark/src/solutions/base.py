@@ -1,4 +1,9 @@
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
 from graph_agents_benchmark.src.models import Frameworks
 
 
@@ -9,6 +14,10 @@ class Solution(ABC):
     Defines the interface for all text-to-Cypher solutions, including methods for setup, prediction, and teardown.
     """
 
+    # Whether `predict` may run concurrently on one instance. Solutions keeping per-instance conversational state
+    # (e.g. an agent's chat memory) set it to False, so questions of a batch do not see each other's history.
+    concurrent_predict: bool = True
+
     def before(self) -> None:
         """
         Optional method to perform any setup actions before prediction.
@@ -38,8 +47,137 @@ class Solution(ABC):
         """
         pass
 
+    def predict_batch(self, questions: List[str], max_concurrency: int = 4) -> List[str]:
+        """
+        Predicts answers for a batch of questions.
+
+        The default implementation fans the questions out to `predict` on a thread pool, or answers them one
+        after another when `concurrent_predict` is False. Solutions whose backend supports native batching
+        should override it.
+
+        Args:
+            questions (List[str]): The input questions.
+            max_concurrency (int): The maximum number of questions processed in parallel.
+
+        Returns:
+            List[str]: The predicted answers, in the same order as the questions.
+        """
+        if not questions:
+            return []
+        if not self.concurrent_predict:
+            return [self.predict(question) for question in questions]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(questions)))) as pool:
+            return list(pool.map(self.predict, questions))
+
+    def reset(self) -> None:
+        """
+        Optional method to clear conversational state (e.g. agent chat memory) carried over between questions.
+        """
+        pass
+
+    def clear_state(self) -> None:
+        """
+        Drops everything earlier predictions left behind (conversational state, caches), so the next question is
+        answered as by a freshly built solution. Called after warmup; defaults to `reset`.
+        """
+        self.reset()
+
     def after(self) -> None:
         """
         Optional method to perform any teardown actions after prediction.
         """
         pass
+
+
+class SolutionWrapper(Solution):
+    """
+    Base class of solutions that sit in front of another solution (caching, few-shot prompting, templates).
+
+    Delegates naming and state handling to the wrapped solution and records per-question lookup details, which
+    the executor collects through `lookup_info`. The recorder is thread-safe and keeps one queue per question,
+    so repeated questions in flight at the same time each keep their own details.
+    """
+
+    def __init__(self, solution: Solution):
+        """
+        Initializes the wrapper.
+
+        Args:
+            solution (Solution): The wrapped solution.
+        """
+        self.solution = solution
+        self.embed_model = getattr(solution, "embed_model", None)
+        self._lookups: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._lookups_lock = threading.Lock()
+
+    @property
+    def concurrent_predict(self) -> bool:
+        return self.solution.concurrent_predict
+
+    def get_name(self) -> Frameworks:
+        """
+        Returns the name of the wrapped solution.
+
+        Returns:
+            Frameworks: The name of the wrapped solution.
+        """
+        return self.solution.get_name()
+
+    def _record_lookup(self, question: str, info: Dict[str, Any]) -> None:
+        with self._lookups_lock:
+            self._lookups.setdefault(question, deque()).append(info)
+
+    def lookup_info(self, question: str) -> Dict[str, Any]:
+        """
+        Returns and forgets the lookup details of the oldest unreported prediction of `question`.
+        """
+        with self._lookups_lock:
+            pending = self._lookups.get(question)
+            if not pending:
+                return {}
+            info = pending.popleft()
+            if not pending:
+                del self._lookups[question]
+            return info
+
+    def reset(self) -> None:
+        """
+        Resets the wrapped solution.
+        """
+        self.solution.reset()
+
+    def clear_state(self) -> None:
+        """
+        Forgets the recorded lookups and clears the wrapped solution's state.
+        """
+        with self._lookups_lock:
+            self._lookups.clear()
+        self.solution.clear_state()
+
+    @staticmethod
+    def mean(rows: List[Dict[str, Any]], key: str) -> Optional[float]:
+        return sum(r[key] for r in rows) / len(rows) if rows else None
+
+    @staticmethod
+    def hit_report(
+        results: List[Dict[str, Any]], hit_key: str, lookup_time_key: str, miss_name: str = "misses"
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Splits benchmark result rows into hits and misses on `hit_key` and summarizes hit rate, lookup time, and
+        time and accuracy on hits vs. misses. Returns the summary together with the hit and miss rows.
+        """
+        hits = [r for r in results if r.get(hit_key)]
+        misses = [r for r in results if r.get(hit_key) is False]
+        total = len(hits) + len(misses)
+        mean = SolutionWrapper.mean
+        summary = {
+            "questions": total,
+            "hits": len(hits),
+            "hit_rate": len(hits) / total if total else 0.0,
+            "avg_lookup_time": mean(hits + misses, lookup_time_key),
+            "avg_time_hits": mean(hits, "time_taken"),
+            f"avg_time_{miss_name}": mean(misses, "time_taken"),
+            "avg_accuracy_hits": mean(hits, "accuracy"),
+            f"avg_accuracy_{miss_name}": mean(misses, "accuracy"),
+        }
+        return summary, hits, misses
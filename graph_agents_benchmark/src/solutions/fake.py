@@ -0,0 +1,79 @@
+import json
+from typing import Optional
+
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+from graph_agents_benchmark.src.llm.llm_provider import ModelsProvider
+from graph_agents_benchmark.src.models import Frameworks
+from graph_agents_benchmark.src.solutions.base import Solution
+from graph_agents_benchmark.src.utils.cypher_gate import CypherGate
+from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+from graph_agents_benchmark.src.utils.schema_snapshot import SchemaSnapshot
+
+
+class FakeSolution(Solution):
+    """
+    Minimal text-to-Cypher solution used to measure the benchmark harness itself.
+
+    Asks the LLM for a Cypher query, runs it once and returns the rows as JSON. Combined with a `fake/...` model
+    and a `fake://...` database URL it runs fully offline with deterministic, configurable latencies.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        db_user: str,
+        db_password: str,
+        db_url: str,
+        db_name: Optional[str] = None,
+        cypher_gate: Optional[CypherGate] = None,
+        query_profiler: Optional[QueryProfiler] = None,
+        schema: Optional[SchemaSnapshot] = None,
+    ):
+        """
+        Initializes the fake solution.
+
+        Args:
+            model_name (str): The name of the LLM model to use, e.g. `fake/constant:0.05`.
+            db_user (str): The Neo4j database user.
+            db_password (str): The Neo4j database password.
+            db_url (str): The Neo4j database URL, e.g. `fake://`.
+            db_name (Optional[str]): The Neo4j database name.
+            cypher_gate (Optional[CypherGate]): Validates generated Cypher with EXPLAIN before execution.
+            query_profiler (Optional[QueryProfiler]): Captures result summaries or PROFILE statistics of the executed Cypher.
+            schema (Optional[SchemaSnapshot]): The database schema. Kept for parity with the real solutions; the fake LLM ignores it.
+        """
+        self.llm, self.embed_model = ModelsProvider.provide(self.get_name(), model_name)
+        self.driver = Neo4jDriverRegistry.get(db_url, db_user, db_password, db_name)
+        self.db_name = db_name
+        self.cypher_gate = cypher_gate
+        self.query_profiler = query_profiler
+        self.schema = schema
+
+    def get_name(self) -> Frameworks:
+        """
+        Returns the name of the solution.
+
+        Returns:
+            Frameworks: The name of the solution (FAKE).
+        """
+        return Frameworks.FAKE
+
+    def predict(self, question: str) -> str:
+        """
+        Generates a Cypher query for the question, executes it and returns the rows.
+
+        Args:
+            question (str): The input question in natural language.
+
+        Returns:
+            str: The query result rows serialized as JSON.
+        """
+        cypher = self.llm.invoke(question)
+        if self.cypher_gate is not None:
+            self.cypher_gate.guard(cypher)
+        if self.query_profiler is not None:
+            rows = self.query_profiler.query(self.driver, self.db_name, cypher)
+        else:
+            with self.driver.session(database=self.db_name) as session:
+                rows = session.run(cypher).data()
+        return json.dumps(rows, default=str)
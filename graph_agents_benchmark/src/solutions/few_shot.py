@@ -0,0 +1,47 @@
+from graph_agents_benchmark.src.solutions.base import Solution, SolutionWrapper
+from graph_agents_benchmark.src.utils.few_shot_index import FewShotIndex
+
+PROMPT_TEMPLATE = """Examples of similar questions and the Cypher queries that answer them:
+
+{examples}
+
+Question: {question}"""
+
+
+class FewShotSolution(SolutionWrapper):
+    """
+    Wraps a solution and prepends the top-k most similar verified examples to every question.
+
+    The examples come from a FewShotIndex over the enriched dataset; the question under test is excluded.
+    """
+
+    def __init__(self, solution: Solution, index: FewShotIndex, k: int = 3):
+        """
+        Initializes the few-shot wrapper.
+
+        Args:
+            solution (Solution): The wrapped solution.
+            index (FewShotIndex): The example index of the benchmarked database.
+            k (int): The number of examples added to each question.
+        """
+        super().__init__(solution)
+        self.index = index
+        self.k = k
+
+    def predict(self, question: str) -> str:
+        """
+        Predicts the answer for a question augmented with few-shot examples.
+
+        Args:
+            question (str): The input question in natural language.
+
+        Returns:
+            str: The answer of the wrapped solution.
+        """
+        examples = self.index.query(question, k=self.k)
+        self._record_lookup(question, {"few_shot_questions": [e["question"] for e in examples]})
+        if not examples:
+            return self.solution.predict(question)
+        return self.solution.predict(
+            PROMPT_TEMPLATE.format(examples=FewShotIndex.format_examples(examples), question=question)
+        )
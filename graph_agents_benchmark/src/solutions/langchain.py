@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from langchain_neo4j import Neo4jGraph
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
@@ -8,15 +8,67 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.prompts.chat import ChatPromptTemplate
 from langchain_core.runnables import Runnable
 from langchain_core.output_parsers import StrOutputParser
-from graph_agents_benchmark.src.model_provider import ModelsProvider
+from neo4j import Driver
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+from graph_agents_benchmark.src.llm.llm_provider import ModelsProvider
 from langchain_neo4j import Neo4jGraph, GraphCypherQAChain
 from graph_agents_benchmark.src.solutions.base import Solution
 from graph_agents_benchmark.src.models import Frameworks
-from graph_agents_benchmark.src.utils.neo4j_integration import Neo4jConnectionManager
+from graph_agents_benchmark.src.utils.cypher_gate import CypherGate
+from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+from graph_agents_benchmark.src.utils.schema_snapshot import SchemaSnapshot, schema_text, without_benchmark_objects
 
 logger = logging.getLogger(__name__)
 
 
+class SharedDriverNeo4jGraph(Neo4jGraph):
+    """
+    Neo4jGraph running on a driver owned by Neo4jDriverRegistry instead of its own connection pool.
+
+    The graph is built through the public `Neo4jGraph` constructor without schema refresh; only its driver is
+    swapped for the registry's afterwards (`Neo4jGraph` has no driver argument, langchain-neo4j is pinned to the
+    0.4 series that keeps it in `_driver`).
+
+    When a CypherGate is given, every query issued after schema introspection is validated with it first;
+    when a QueryProfiler is given, those queries are executed through it. When a SchemaSnapshot is given, the
+    schema is taken from it instead of being introspected; an introspected schema leaves out the benchmark's own
+    embedding nodes.
+    """
+
+    def __init__(self, url: str, username: str, password: str, database: Optional[str] = None,
+                 refresh_schema: bool = True, cypher_gate: Optional[CypherGate] = None,
+                 query_profiler: Optional[QueryProfiler] = None, schema: Optional[SchemaSnapshot] = None):
+        self._cypher_gate = None
+        self._query_profiler = None
+        super().__init__(url=url, username=username, password=password, database=database, refresh_schema=False)
+        private_driver: Driver = self._driver
+        self._driver = Neo4jDriverRegistry.get(url, username, password, database)
+        private_driver.close()
+        if schema is not None:
+            self.schema = schema.to_text()
+            self.structured_schema = schema.structured_schema()
+        elif refresh_schema:
+            self.refresh_schema()
+        self._cypher_gate = cypher_gate
+        self._query_profiler = query_profiler
+
+    def query(self, query: str, params: Optional[Dict[str, Any]] = None, *args, **kwargs) -> List[Dict[str, Any]]:
+        if self._cypher_gate is not None:
+            self._cypher_gate.guard(query)
+        if self._query_profiler is not None:
+            return self._query_profiler.query(self._driver, self._database, query, params)
+        return super().query(query, params or {}, *args, **kwargs)
+
+    def refresh_schema(self) -> None:
+        super().refresh_schema()
+        self.structured_schema = without_benchmark_objects(self.structured_schema)
+        self.schema = schema_text(self.structured_schema)
+
+    def close(self) -> None:
+        # The driver is shared through Neo4jDriverRegistry and outlives this graph.
+        pass
+
+
 class LangChainSolution(Solution):
     """
     LangChain implementation for text-to-Cypher conversion.
@@ -54,10 +106,14 @@ class LangChainSolution(Solution):
         """
         try:
             # Initialize Neo4j connection
-            self.graph = Neo4jGraph(
-                url=self.config.get("neo4j_uri", "bolt://localhost:7687"),
-                username=self.config.get("neo4j_user", "neo4j"),
-                password=self.config.get("neo4j_password", "password"),
+            self.graph = SharedDriverNeo4jGraph(
+                url=self.config.get("db_url", "bolt://localhost:7687"),
+                username=self.config.get("db_user", "neo4j"),
+                password=self.config.get("db_password", "password"),
+                database=self.config.get("db_name"),
+                cypher_gate=self.config.get("cypher_gate"),
+                query_profiler=self.config.get("query_profiler"),
+                schema=self.config.get("schema"),
             )
 
             model_name = self.config["model_name"]
@@ -116,6 +172,33 @@ class LangChainSolution(Solution):
             logger.error(f"Failed to generate Cypher query: {e}")
             raise
 
+    def predict_batch(self, questions: List[str], max_concurrency: int = 4) -> List[str]:
+        """
+        Converts a batch of natural language questions using the chain's native `batch` call.
+
+        Args:
+            questions (List[str]): The input questions in natural language.
+            max_concurrency (int): The maximum number of concurrent requests sent to the LLM backend.
+
+        Returns:
+            List[str]: The generated answers, in the same order as the questions.
+
+        Raises:
+            ValueError: If LangChain is not initialized.
+            Exception: If Cypher query generation fails.
+        """
+        if not self.chain:
+            raise ValueError("LangChain not initialized. Call initialize() first.")
+        if not questions:
+            return []
+
+        try:
+            outputs = self.chain.batch(questions, config={"max_concurrency": max_concurrency})
+            return [output["result"] for output in outputs]
+        except Exception as e:
+            logger.error(f"Failed to generate Cypher queries for batch: {e}")
+            raise
+
     def close(self):
         """
         Closes the connection to Neo4j.
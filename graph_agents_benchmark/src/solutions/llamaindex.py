@@ -5,17 +5,23 @@ from langchain_neo4j import Neo4jGraph
 from llama_index.llms.vertex import Vertex
 from llama_index.core.settings import Settings
 from llama_index.core import StorageContext
+from llama_index.graph_stores.neo4j import Neo4jGraphStore
 from llama_index.vector_stores.neo4jvector import Neo4jVectorStore
 from llama_index.embeddings.vertex import VertexTextEmbedding
 import vertexai
 from google.oauth2 import service_account
 from llama_index.llms.ollama import Ollama
 from llama_index.embeddings.ollama import OllamaEmbedding
-from graph_agents_benchmark.src.model_provider import ModelsProvider
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+from graph_agents_benchmark.src.llm.llm_provider import ModelsProvider
 from llama_index.core.agent.react import ReActAgent
 from llama_index.tools.neo4j import Neo4jQueryToolSpec
+from llama_index.tools.neo4j.query_validator import CypherQueryCorrector, Schema
 from graph_agents_benchmark.src.models import Frameworks
 from graph_agents_benchmark.src.solutions.base import Solution
+from graph_agents_benchmark.src.utils.cypher_gate import CypherGate
+from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+from graph_agents_benchmark.src.utils.schema_snapshot import SchemaSnapshot, schema_text, without_benchmark_objects
 
 import time
 from llama_index.core import VectorStoreIndex, SimpleDirectoryReader
@@ -27,8 +33,15 @@ class LlamaIndexSolution(Solution):
     LlamaIndex implementation for text-to-Cypher conversion.
 
     Leverages LlamaIndex's capabilities to connect to Neo4j, construct prompts, and execute queries.
+
+    The `Neo4jQueryToolSpec` is built through its public constructor, which introspects the schema once; its graph
+    store's driver is swapped for the registry's afterwards (the store has no driver argument,
+    llama-index-graph-stores-neo4j is pinned to the 0.4 series that keeps it in `_driver`).
     """
 
+    # The ReActAgent keeps one chat memory per instance.
+    concurrent_predict = False
+
     def __init__(
         self,
         model_name: str,
@@ -36,6 +49,9 @@ class LlamaIndexSolution(Solution):
         db_password: str,
         db_url: str,
         db_name: Optional[str] = None,
+        cypher_gate: Optional[CypherGate] = None,
+        query_profiler: Optional[QueryProfiler] = None,
+        schema: Optional[SchemaSnapshot] = None,
     ):
         """
         Initializes the LlamaIndex solution with a configuration.
@@ -46,9 +62,12 @@ class LlamaIndexSolution(Solution):
             db_password (str): The Neo4j database password.
             db_url (str): The Neo4j database URL.
             db_name (Optional[str]): The Neo4j database name.
+            cypher_gate (Optional[CypherGate]): Validates the agent's Cypher with EXPLAIN before execution.
+            query_profiler (Optional[QueryProfiler]): Captures result summaries or PROFILE statistics of the agent's Cypher.
+            schema (Optional[SchemaSnapshot]): The database schema shown to the agent instead of the tool's own introspection.
         """
         print(f"Initiating LlamaIndexSolution")
-        self.llm = llm, self.embed_model = ModelsProvider.provide(
+        self.llm, self.embed_model = ModelsProvider.provide(
             self.get_name(), model_name
         )
 
@@ -60,12 +79,30 @@ class LlamaIndexSolution(Solution):
             validate_cypher=True,
             database=db_name,
         )
+        graph_store = gds_db.graph_store
+        # Route the tool's queries through the process-wide connection pool.
+        private_driver = graph_store._driver
+        graph_store._driver = Neo4jDriverRegistry.get(db_url, db_user, db_password, db_name)
+        private_driver.close()
+        # Show the agent the stored snapshot, or its own introspection without the benchmark's embedding nodes.
+        if schema is not None:
+            graph_store.structured_schema = schema.structured_schema()
+        else:
+            graph_store.structured_schema = without_benchmark_objects(graph_store.structured_schema)
+        graph_store.schema = schema_text(graph_store.structured_schema)
+        gds_db.cypher_query_corrector = CypherQueryCorrector(
+            [Schema(r["start"], r["type"], r["end"]) for r in graph_store.structured_schema["relationships"]]
+        )
+        if query_profiler is not None:
+            gds_db.graph_store.query = query_profiler.wrap(gds_db.graph_store._driver, db_name)
+        if cypher_gate is not None:
+            gds_db.graph_store.query = cypher_gate.wrap(gds_db.graph_store.query)
 
         tools = gds_db.to_tool_list()
 
         self.agent = ReActAgent.from_tools(
             tools=tools,
-            llm=llm,
+            llm=self.llm,
         )
 
     def get_name(self):
@@ -89,3 +126,9 @@ class LlamaIndexSolution(Solution):
         """
         print(f"Question : {question}")
         return str(self.agent.chat(message=question))
+
+    def reset(self) -> None:
+        """
+        Clears the ReActAgent chat memory, which otherwise grows with every question and is sent with each prompt.
+        """
+        self.agent.reset()
@@ -0,0 +1,159 @@
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from graph_agents_benchmark.src.llm.embeddings import embedding_function
+from graph_agents_benchmark.src.solutions.base import Solution, SolutionWrapper
+
+# Values a question is about: quoted strings, numbers and capitalized words other than the first one.
+QUESTION_LITERAL = re.compile(r"'([^']+)'|\"([^\"]+)\"|(-?\d+(?:\.\d+)?)|(?<=\s)([A-Z][\w'-]+)")
+
+
+def question_literals(question: str) -> Tuple[str, ...]:
+    """
+    The case and whitespace normalized literals of a question, e.g. ("1999", "tom", "hanks").
+    """
+    literals = set()
+    for match in QUESTION_LITERAL.finditer(question):
+        value = next(group for group in match.groups() if group is not None)
+        literals.add(" ".join(value.lower().split()))
+    return tuple(sorted(literals))
+
+
+class SemanticCache:
+    """
+    In-memory cosine-similarity index from question embeddings to previously predicted answers.
+
+    Vectors are L2-normalized on insertion, so a lookup is a single matrix-vector product. Entries are grouped by
+    the literals of their question and a lookup only considers entries with the same literals: a paraphrase above
+    the threshold that asks about another year or name ("movies from 1999" vs. "from 2000") is a miss.
+    """
+
+    def __init__(self, threshold: float = 0.95, initial_capacity: int = 1024):
+        self.threshold = threshold
+        self._vectors: Optional[np.ndarray] = None
+        self._initial_capacity = initial_capacity
+        self._size = 0
+        self._questions: List[str] = []
+        self._answers: List[str] = []
+        self._predict_times: List[float] = []
+        self._by_literals: Dict[Tuple[str, ...], List[int]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def lookup(self, vector: Sequence[float], literals: Tuple[str, ...] = ()) -> Optional[Tuple[str, str, float, float]]:
+        """
+        Returns (question, answer, similarity, predict_time) of the closest cached entry with the same literals
+        above the threshold.
+        """
+        positions = self._by_literals.get(literals)
+        if not positions:
+            return None
+        similarities = self._vectors[positions] @ self._normalize(vector)
+        best = positions[int(np.argmax(similarities))]
+        similarity = float(np.max(similarities))
+        if similarity < self.threshold:
+            return None
+        return self._questions[best], self._answers[best], similarity, self._predict_times[best]
+
+    def add(self, question: str, vector: Sequence[float], answer: str, predict_time: float,
+            literals: Tuple[str, ...] = ()) -> None:
+        normalized = self._normalize(vector)
+        if self._vectors is None:
+            self._vectors = np.empty((self._initial_capacity, normalized.shape[0]), dtype=np.float32)
+        elif self._size == self._vectors.shape[0]:
+            self._vectors = np.concatenate([self._vectors, np.empty_like(self._vectors)])
+        self._vectors[self._size] = normalized
+        self._by_literals.setdefault(literals, []).append(self._size)
+        self._size += 1
+        self._questions.append(question)
+        self._answers.append(answer)
+        self._predict_times.append(predict_time)
+
+
+class CachedSolution(SolutionWrapper):
+    """
+    Wraps a solution with a semantic cache in front of `predict`.
+
+    Each question is embedded with the wrapped solution's `embed_model`; when a previously answered question with
+    the same literals is at least `threshold` cosine-similar, its answer is returned without calling the wrapped
+    solution. Per-question cache details are available through `lookup_info` and summarized by `report`.
+    """
+
+    def __init__(self, solution: Solution, threshold: float = 0.95):
+        """
+        Initializes the cache wrapper.
+
+        Args:
+            solution (Solution): The wrapped solution. It must expose an `embed_model` attribute.
+            threshold (float): The minimal cosine similarity for a cache hit.
+        """
+        embed_model = getattr(solution, "embed_model", None)
+        if embed_model is None:
+            raise ValueError(f"Solution {solution.get_name()} has no embedding model for the semantic cache.")
+        super().__init__(solution)
+        self.cache = SemanticCache(threshold)
+        self._embed = embedding_function(embed_model)
+        self._lock = threading.Lock()
+
+    def predict(self, question: str) -> str:
+        """
+        Returns a cached answer for a near-duplicate question, or delegates to the wrapped solution.
+
+        Args:
+            question (str): The input question in natural language.
+
+        Returns:
+            str: The cached or freshly predicted answer.
+        """
+        start_time = time.time()
+        vector = self._embed(question)
+        literals = question_literals(question)
+        with self._lock:
+            hit = self.cache.lookup(vector, literals)
+        lookup_time = time.time() - start_time
+
+        if hit:
+            cached_question, answer, similarity, predict_time = hit
+            self._record_lookup(question, {
+                "cache_hit": True,
+                "cache_similarity": similarity,
+                "cache_source_question": cached_question,
+                "cache_lookup_time": lookup_time,
+                "cache_saved_time": predict_time - lookup_time,
+            })
+            return answer
+
+        start_time = time.time()
+        answer = self.solution.predict(question)
+        predict_time = time.time() - start_time
+        with self._lock:
+            self.cache.add(question, vector, answer, predict_time, literals)
+        self._record_lookup(question, {"cache_hit": False, "cache_lookup_time": lookup_time})
+        return answer
+
+    def clear_state(self) -> None:
+        """
+        Empties the cache and the recorded lookups, and clears the wrapped solution's state.
+        """
+        with self._lock:
+            self.cache = SemanticCache(self.cache.threshold)
+        super().clear_state()
+
+    @staticmethod
+    def report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Summarizes hit rate, latency savings and accuracy on hits vs. misses from benchmark result rows.
+        """
+        summary, hits, _ = SolutionWrapper.hit_report(results, "cache_hit", "cache_lookup_time")
+        return summary | {"total_saved_time": sum(r["cache_saved_time"] for r in hits)}
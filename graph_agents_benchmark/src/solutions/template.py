@@ -0,0 +1,115 @@
+import time
+from typing import Any, Dict, List, Optional
+
+from graph_agents_benchmark.src.solutions.base import Solution, SolutionWrapper
+from graph_agents_benchmark.src.utils.cypher_gate import CypherGate
+from graph_agents_benchmark.src.utils.qa_enricher import AnswerFormatter
+from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+from graph_agents_benchmark.src.utils.template_index import TemplateIndex
+
+
+class TemplateSolution(SolutionWrapper):
+    """
+    Wraps a solution with a template fast path in front of `predict`.
+
+    Questions matching a learned Cypher template with at least `threshold` confidence are answered by executing
+    the filled template directly, without any LLM call; the records are formatted with the dataset enricher's
+    AnswerFormatter, so a correct template reproduces the gold answer exactly.
+    Everything else, including templates whose execution fails, falls back to the wrapped solution.
+    Per-question routing details are available through `lookup_info` and summarized by `report`.
+    """
+
+    def __init__(
+        self,
+        solution: Solution,
+        index: TemplateIndex,
+        driver,
+        db_name: Optional[str] = None,
+        threshold: float = 0.8,
+        template_database: Optional[str] = None,
+        cypher_gate: Optional[CypherGate] = None,
+        query_profiler: Optional[QueryProfiler] = None,
+        canonical: bool = False,
+    ):
+        """
+        Initializes the template router.
+
+        Args:
+            solution (Solution): The wrapped LLM solution used as fallback.
+            index (TemplateIndex): The templates learned from the enriched dataset.
+            driver: The Neo4j driver the templates are executed with.
+            db_name (Optional[str]): The Neo4j database name.
+            threshold (float): The minimal classifier confidence for answering from a template.
+            template_database (Optional[str]): Only use templates learned for this dataset database (e.g. "movies").
+            cypher_gate (Optional[CypherGate]): Validates the filled templates with EXPLAIN before execution.
+            query_profiler (Optional[QueryProfiler]): Captures result summaries or PROFILE statistics of the templates.
+            canonical (bool): Whether the dataset's answers were serialized with sorted keys (--canonical-answers).
+        """
+        super().__init__(solution)
+        self.index = index
+        self.driver = driver
+        self.db_name = db_name
+        self.threshold = threshold
+        self.template_database = template_database
+        self.cypher_gate = cypher_gate
+        self.query_profiler = query_profiler
+        self.formatter = AnswerFormatter(canonical)
+
+    def predict(self, question: str) -> str:
+        """
+        Answers the question from a matching template, or delegates to the wrapped solution.
+
+        Args:
+            question (str): The input question in natural language.
+
+        Returns:
+            str: The template's result formatted like the gold answers, or the wrapped solution's answer.
+        """
+        start_time = time.time()
+        match = self.index.match(question, database=self.template_database)
+        lookup_time = time.time() - start_time
+        info = {"template_hit": False, "template_lookup_time": lookup_time}
+        if match is not None:
+            info["template_id"] = match["template_id"]
+            info["template_confidence"] = match["confidence"]
+
+        if match is not None and match["confidence"] >= self.threshold:
+            try:
+                answer = self._execute(match["cypher"], match["params"])
+            except Exception as e:
+                info["template_error"] = repr(e)
+            else:
+                info["template_hit"] = True
+                info["template_source_question"] = match["source_question"]
+                self._record_lookup(question, info)
+                return answer
+
+        self._record_lookup(question, info)
+        return self.solution.predict(question)
+
+    def _execute(self, cypher: str, params: Dict[str, Any]) -> str:
+        if self.cypher_gate is not None:
+            self.cypher_gate.guard(cypher)
+        with self.driver.session(database=self.db_name) as session:
+            if self.query_profiler is not None:
+                records = self.query_profiler.stream(session, cypher, params, database=self.db_name)
+            else:
+                records = session.run(cypher, params)
+            # The enricher stores no answer for an empty result; an empty string never matches a gold answer.
+            return self.formatter.format_result(records) or ""
+
+    @staticmethod
+    def report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Summarizes the fast-path hit rate, the LLM calls and time it saved, and accuracy on hits vs. fallbacks.
+        """
+        summary, hits, fallbacks = SolutionWrapper.hit_report(
+            results, "template_hit", "template_lookup_time", miss_name="fallbacks"
+        )
+        return summary | {
+            "llm_calls_saved": len(hits),
+            "errors": sum("template_error" in r for r in fallbacks),
+            "estimated_saved_time": (
+                len(hits) * (summary["avg_time_fallbacks"] - summary["avg_time_hits"]) if hits and fallbacks else None
+            ),
+        }
@@ -0,0 +1,277 @@
+import time
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+from graph_agents_benchmark.src.llm.embedding_pipeline import EMBEDDING_CACHE_DIR, EmbeddingPipeline
+from graph_agents_benchmark.src.llm.embeddings import embedding_model_name
+from graph_agents_benchmark.src.llm.llm_provider import ModelsProvider
+from graph_agents_benchmark.src.models import Frameworks
+from graph_agents_benchmark.src.solutions.base import Solution
+from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+from graph_agents_benchmark.src.utils.schema_snapshot import EMBEDDING_LABEL, EMBEDS_RELATIONSHIP, SchemaSnapshot
+
+INDEX_NAME = "benchmark_node_embeddings"
+
+PROMPT_TEMPLATE = """Answer the question using only the graph data below. Each line is a node matching the question
+followed by its neighbourhood. Answer briefly; say "I don't know" if the data does not contain the answer.
+
+{context}
+
+Question: {question}
+Answer:"""
+
+SCHEMA_TEMPLATE = """Graph schema:
+{schema}
+
+Nodes:"""
+
+NODES_QUERY = f"""
+MATCH (n) WHERE NOT n:{EMBEDDING_LABEL} AND NOT EXISTS {{ (n)<-[:{EMBEDS_RELATIONSHIP}]-(:{EMBEDDING_LABEL}) }}
+RETURN elementId(n) AS id, labels(n) AS labels, properties(n) AS properties
+"""
+
+WRITE_QUERY = f"""
+UNWIND $rows AS row
+MATCH (n) WHERE elementId(n) = row.id
+CREATE (e:{EMBEDDING_LABEL} {{text: row.text, embedding: row.embedding, model: $model}})-[:{EMBEDS_RELATIONSHIP}]->(n)
+"""
+
+# Appended by Neo4jVectorStore to `CALL db.index.vector.queryNodes(...) YIELD node, score`; `node` is the
+# embedding node of a graph node, whose neighbourhood up to `hops` away is added as context.
+RETRIEVAL_QUERY = """
+MATCH (node)-[:{relationship}]->(n)
+CALL {{
+    WITH n
+    OPTIONAL MATCH path = (n)-[*1..{hops}]-(m) WHERE NOT m:{label}
+    WITH path LIMIT {max_neighbours}
+    RETURN collect([r IN relationships(path) | [
+        coalesce(startNode(r).name, startNode(r).title, head(labels(startNode(r)))),
+        type(r),
+        coalesce(endNode(r).name, endNode(r).title, head(labels(endNode(r))))
+    ]]) AS paths
+}}
+RETURN node.text AS text, score, elementId(n) AS id, {{paths: paths}} AS metadata
+"""
+
+
+class VectorRagSolution(Solution):
+    """
+    Vector RAG over the graph: answers with a single LLM call instead of generating Cypher.
+
+    Every node gets an embedding of its labels and properties, stored once per database on `:BenchmarkEmbedding`
+    nodes linked to it and indexed in a Neo4j vector index. A question retrieves the `top_k` most similar nodes
+    through `Neo4jVectorStore`, expands each of them by at most `hops` relationships (`max_neighbours` paths) and
+    passes the result as context to the LLM. Nodes embedded by an earlier run are reused, so only the first run
+    against a database pays for the index build, which is reported in `index_report` apart from query latency.
+
+    Schema snapshots and `SharedDriverNeo4jGraph` leave the embedding nodes out of the schema other solutions
+    see; `main.py` removes them with `drop_embeddings` when a run ends unless `--keep-vector-index` is given.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        db_user: str,
+        db_password: str,
+        db_url: str,
+        db_name: Optional[str] = None,
+        query_profiler: Optional[QueryProfiler] = None,
+        embedding_cache_dir: Optional[str] = EMBEDDING_CACHE_DIR,
+        top_k: int = 5,
+        hops: int = 1,
+        max_neighbours: int = 20,
+        write_batch_size: int = 500,
+        schema: Optional[SchemaSnapshot] = None,
+    ):
+        """
+        Initializes the solution and builds the vector index if the database has nodes without embeddings.
+
+        Args:
+            model_name (str): The name of the LLM model to use.
+            db_user (str): The Neo4j database user.
+            db_password (str): The Neo4j database password.
+            db_url (str): The Neo4j database URL.
+            db_name (Optional[str]): The Neo4j database name.
+            query_profiler (Optional[QueryProfiler]): Captures result summaries or PROFILE statistics of the retrieval queries.
+            embedding_cache_dir (Optional[str]): Persistent vector cache used when embedding the nodes. None disables it.
+            top_k (int): The number of most similar nodes retrieved per question.
+            hops (int): The maximal length of the paths expanded from a retrieved node.
+            max_neighbours (int): The maximal number of paths expanded from a retrieved node.
+            write_batch_size (int): The number of embeddings written to Neo4j per transaction.
+            schema (Optional[SchemaSnapshot]): The database schema, added to the answer prompt.
+        """
+        from llama_index.vector_stores.neo4jvector import Neo4jVectorStore
+
+        print("Initiating VectorRagSolution")
+        self.llm, embed_model = ModelsProvider.provide(Frameworks.LLAMA_INDEX, model_name)
+        self.embed_model = EmbeddingPipeline(
+            embed_model,
+            embedding_model_name(embed_model, default=model_name),
+            cache_dir=embedding_cache_dir,
+        )
+        self.driver = Neo4jDriverRegistry.get(db_url, db_user, db_password, db_name)
+        self.db_name = db_name
+        self.top_k = top_k
+        self.write_batch_size = write_batch_size
+        self.schema_text = schema.to_text() if schema is not None else None
+
+        start_time = time.time()
+        self.index_report = self.build_index()
+        self.vector_store = Neo4jVectorStore(
+            username=db_user,
+            password=db_password,
+            url=db_url,
+            embedding_dimension=self.index_report["dimensions"],
+            database=db_name or "neo4j",
+            index_name=INDEX_NAME,
+            node_label=EMBEDDING_LABEL,
+            embedding_node_property="embedding",
+            text_node_property="text",
+            retrieval_query=RETRIEVAL_QUERY.format(
+                label=EMBEDDING_LABEL,
+                relationship=EMBEDS_RELATIONSHIP,
+                hops=int(hops),
+                max_neighbours=int(max_neighbours),
+            ),
+        )
+        # Route the store's queries through the process-wide connection pool.
+        private_driver = self.vector_store._driver
+        self.vector_store._driver = self.driver
+        private_driver.close()
+        with self.driver.session(database=db_name) as session:
+            session.run("CALL db.awaitIndexes(300)").consume()
+        self.index_report["index_build_time"] = time.time() - start_time
+        print(
+            f"✅ Vector index ready in {self.index_report['index_build_time']:.2f}s "
+            f"({self.index_report['embedded_nodes']} nodes embedded, {self.index_report['reused_nodes']} reused)"
+        )
+        if query_profiler is not None:
+            self.vector_store.database_query = query_profiler.wrap(self.driver, db_name)
+
+    def get_name(self) -> Frameworks:
+        """
+        Returns the name of the solution.
+
+        Returns:
+            Frameworks: The name of the solution (VECTOR_RAG).
+        """
+        return Frameworks.VECTOR_RAG
+
+    @staticmethod
+    def node_text(labels: List[str], properties: Dict[str, Any]) -> str:
+        """
+        Text embedded for a node: its labels followed by its scalar and short list properties.
+        """
+        fields = []
+        for key, value in sorted(properties.items()):
+            if isinstance(value, list) and (len(value) > 10 or any(isinstance(v, float) for v in value)):
+                continue  # Skip vectors and long lists.
+            fields.append(f"{key}: {value}")
+        return f"{':'.join(labels)} {{{', '.join(fields)}}}"
+
+    def build_index(self) -> Dict[str, Any]:
+        """
+        Embeds every node that has no embedding yet. Embeddings of another embedding model are dropped first.
+
+        The nodes are streamed from one read session and embedded and written `write_batch_size` at a time
+        through separate sessions, so only one batch of nodes is held in memory.
+
+        Returns:
+            Dict[str, Any]: Embedding dimensions, embedded and reused node counts and the embedding time.
+        """
+        start_time = time.time()
+        model = self.embed_model.model_name
+        with self.driver.session(database=self.db_name) as session:
+            stale = session.run(
+                f"MATCH (e:{EMBEDDING_LABEL}) WHERE e.model <> $model RETURN count(e) AS count", model=model
+            ).single()["count"]
+            if stale:
+                print(f"⚠️ Dropping {stale} embeddings of another embedding model")
+                self.drop_index()
+            reused = session.run(f"MATCH (e:{EMBEDDING_LABEL}) RETURN count(e) AS count").single()["count"]
+
+        dimensions = None
+        embedded = 0
+        with self.driver.session(database=self.db_name) as read_session:
+            nodes = iter(read_session.run(NODES_QUERY))
+            while batch := list(islice(nodes, self.write_batch_size)):
+                if not embedded:
+                    print("⏳ Embedding nodes without embeddings")
+                texts = [VectorRagSolution.node_text(node["labels"], node["properties"]) for node in batch]
+                vectors = self.embed_model.embed(texts)
+                dimensions = int(vectors.shape[1])
+                rows = [{"id": node["id"], "text": text, "embedding": vector.tolist()}
+                        for node, text, vector in zip(batch, texts, vectors)]
+                with self.driver.session(database=self.db_name) as session:
+                    session.run(WRITE_QUERY, rows=rows, model=model).consume()
+                embedded += len(batch)
+
+        if dimensions is None:
+            dimensions = len(self.embed_model.embed_query(EMBEDDING_LABEL))
+        return {
+            "model": model,
+            "dimensions": dimensions,
+            "embedded_nodes": embedded,
+            "reused_nodes": reused,
+            "embedding_time": time.time() - start_time,
+        }
+
+    def drop_index(self) -> None:
+        """
+        Removes the vector index and all embedding nodes from the database.
+        """
+        VectorRagSolution.drop_embeddings(self.driver, self.db_name)
+
+    @staticmethod
+    def drop_embeddings(driver, database: Optional[str] = None) -> int:
+        """
+        Removes the vector index and all embedding nodes from a database.
+
+        Returns:
+            int: The number of embedding nodes removed.
+        """
+        with driver.session(database=database) as session:
+            session.run(f"DROP INDEX {INDEX_NAME} IF EXISTS").consume()
+            count = session.run(f"MATCH (e:{EMBEDDING_LABEL}) RETURN count(e) AS count").single()["count"]
+            session.run(
+                f"MATCH (e:{EMBEDDING_LABEL}) CALL {{ WITH e DETACH DELETE e }} IN TRANSACTIONS OF 10000 ROWS"
+            ).consume()
+        return count
+
+    def retrieve(self, question: str) -> List[str]:
+        """
+        Retrieves the context lines of the `top_k` nodes most similar to the question.
+
+        Args:
+            question (str): The input question in natural language.
+
+        Returns:
+            List[str]: One line per retrieved node: its text followed by its expanded paths.
+        """
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        result = self.vector_store.query(
+            VectorStoreQuery(query_embedding=self.embed_model.embed_query(question), similarity_top_k=self.top_k)
+        )
+        lines = []
+        for node in result.nodes:
+            paths = [", ".join(f"({start})-[{kind}]-({end})" for start, kind, end in path)
+                     for path in node.metadata.get("paths") or [] if path]
+            lines.append(node.get_content() + (f" | {'; '.join(paths)}" if paths else ""))
+        return lines
+
+    def predict(self, question: str) -> str:
+        """
+        Answers the question from the retrieved graph context with a single LLM call.
+
+        Args:
+            question (str): The input question in natural language.
+
+        Returns:
+            str: The LLM's answer.
+        """
+        context = "\n".join(self.retrieve(question))
+        if self.schema_text is not None:
+            context = f"{SCHEMA_TEMPLATE.format(schema=self.schema_text)}\n{context}"
+        return str(self.llm.complete(PROMPT_TEMPLATE.format(context=context, question=question)))
@@ -0,0 +1,164 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from neo4j.exceptions import Neo4jError
+from pydantic import BaseModel
+
+# `[*]`, `[:REL*]`, `[*..]`, `[*2..]` - variable-length patterns without an upper bound.
+UNBOUNDED_VAR_LENGTH = re.compile(r"\*\s*(?:\d*\s*\.\.\s*)?\]")
+
+WARNING_NOTIFICATIONS = {
+    "Neo.ClientNotification.Statement.CartesianProduct": "cartesian_product",
+    "Neo.ClientNotification.Statement.UnboundedVariableLengthPattern": "unbounded_var_length",
+}
+
+
+class CypherCheck(BaseModel):
+    query: str
+    valid: bool
+    error: Optional[str] = None
+    estimated_rows: Optional[float] = None
+    peak_estimated_rows: Optional[float] = None
+    operators: List[str] = []
+    warnings: List[str] = []
+    rejected: bool = False
+
+
+class CypherRejectedError(ValueError):
+    def __init__(self, check: CypherCheck):
+        self.check = check
+        reason = check.error or ", ".join(check.warnings)
+        super().__init__(f"Cypher query rejected by gate ({reason}): {check.query}")
+
+
+class CypherGate:
+    """
+    Validates Cypher with `EXPLAIN` before it is executed.
+
+    Plans are cached by normalized query text. A query is invalid when EXPLAIN fails (syntax or semantic errors)
+    and runaway when its plan contains a cartesian product, an unbounded variable-length pattern, or an operator
+    estimated to produce more than `max_estimated_rows` rows. In "reject" mode invalid and runaway queries raise
+    CypherRejectedError; in "flag" mode only invalid ones do and runaway queries are reported but still executed.
+    """
+
+    MODES = ("flag", "reject")
+
+    def __init__(self, driver, database: Optional[str] = None, mode: str = "reject",
+                 max_estimated_rows: Optional[float] = 1_000_000, cache_size: int = 4096):
+        if mode not in CypherGate.MODES:
+            raise ValueError(f"Unsupported cypher gate mode '{mode}'. Must be one of {CypherGate.MODES}.")
+        self._driver = driver
+        self._database = database
+        self.mode = mode
+        self.max_estimated_rows = max_estimated_rows
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, CypherCheck]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"checks": 0, "cache_hits": 0, "invalid": 0, "flagged": 0, "rejected": 0}
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(query.split()).rstrip(";").strip()
+
+    def check(self, query: str) -> CypherCheck:
+        key = CypherGate.normalize(query)
+        with self._lock:
+            self.stats["checks"] += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                self._count(cached)
+                return cached
+
+        check = self._explain(key)
+
+        with self._lock:
+            self._cache[key] = check
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            self._count(check)
+        return check
+
+    def guard(self, query: str) -> CypherCheck:
+        """
+        Checks the query and raises CypherRejectedError when it must not be executed.
+        """
+        check = self.check(query)
+        if not check.valid or check.rejected:
+            raise CypherRejectedError(check)
+        if check.warnings:
+            print(f"⚠️ Cypher gate flagged query ({', '.join(check.warnings)}): {check.query}")
+        return check
+
+    def wrap(self, query_fn: Callable) -> Callable:
+        """
+        Wraps a `query(cypher, ...)` callable so every query passes the gate first.
+        """
+
+        def gated(query: str, *args, **kwargs):
+            self.guard(query)
+            return query_fn(query, *args, **kwargs)
+
+        return gated
+
+    def _count(self, check: CypherCheck) -> None:
+        if not check.valid:
+            self.stats["invalid"] += 1
+        elif check.rejected:
+            self.stats["rejected"] += 1
+        elif check.warnings:
+            self.stats["flagged"] += 1
+
+    def _explain(self, query: str) -> CypherCheck:
+        if re.match(r"(?i)^(EXPLAIN|PROFILE)\b", query):
+            return CypherCheck(query=query, valid=True)
+
+        try:
+            with self._driver.session(database=self._database) as session:
+                summary = session.run(f"EXPLAIN {query}").consume()
+        except Neo4jError as e:
+            return CypherCheck(query=query, valid=False, error=e.message or str(e))
+
+        operators: List[str] = []
+        row_estimates: List[float] = []
+        plan = getattr(summary, "plan", None)
+        if plan:
+            CypherGate._walk_plan(plan, operators, row_estimates)
+
+        warnings = []
+        for notification in getattr(summary, "notifications", None) or []:
+            warning = WARNING_NOTIFICATIONS.get(notification.get("code"))
+            if warning and warning not in warnings:
+                warnings.append(warning)
+        if any(op.startswith("CartesianProduct") for op in operators) and "cartesian_product" not in warnings:
+            warnings.append("cartesian_product")
+        if UNBOUNDED_VAR_LENGTH.search(query) and "unbounded_var_length" not in warnings:
+            warnings.append("unbounded_var_length")
+
+        peak_estimated_rows = max(row_estimates) if row_estimates else None
+        if (self.max_estimated_rows is not None and peak_estimated_rows is not None
+                and peak_estimated_rows > self.max_estimated_rows):
+            warnings.append("estimated_rows_exceeded")
+
+        return CypherCheck(
+            query=query,
+            valid=True,
+            estimated_rows=row_estimates[0] if row_estimates else None,
+            peak_estimated_rows=peak_estimated_rows,
+            operators=operators,
+            warnings=warnings,
+            rejected=self.mode == "reject" and bool(warnings),
+        )
+
+    @staticmethod
+    def _walk_plan(plan: Dict[str, Any], operators: List[str], row_estimates: List[float]) -> None:
+        operators.append(plan.get("operatorType", ""))
+        # Bolt reports plan arguments under "args"
+        estimated_rows = (plan.get("args") or plan.get("arguments") or {}).get("EstimatedRows")
+        if estimated_rows is not None:
+            row_estimates.append(float(estimated_rows))
+        for child in plan.get("children") or []:
+            CypherGate._walk_plan(child, operators, row_estimates)
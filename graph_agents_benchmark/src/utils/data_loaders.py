@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import List, Union, Callable, Optional
+from typing import List, Union, Callable, Optional, Iterator, Tuple, Dict, Any
 
 import datasets
 import pandas as pd
@@ -7,6 +7,9 @@ from datasets import load_dataset, DatasetDict, Dataset, IterableDatasetDict, It
 from numpy.ma.core import identity
 
 from graph_agents_benchmark.src.models import Column
+from graph_agents_benchmark.src.utils.dataset_writer import read_rows
+
+FILE_TYPES = ("csv", "json", "jsonl", "parquet", "arrow")
 
 
 class HuggingFaceDataLoader:
@@ -87,6 +90,13 @@ class HuggingFaceDataLoader:
 
 
 class FsDataLoader:
+    """
+    Loads a question/answer dataset from a local file.
+
+    `data` materializes the whole file as a DataFrame on first access. `iter_qa` streams rows instead: JSONL line by
+    line, Parquet by row group, Arrow IPC through a memory map and CSV in chunks, so large files start yielding
+    immediately with bounded memory.
+    """
 
     def __init__(
             self,
@@ -95,21 +105,84 @@ class FsDataLoader:
             question_column="question",
             answer_column="answer",
     ):
+        if file_type not in FILE_TYPES:
+            raise ValueError(f"Unsupported file type '{file_type}'. Must be one of {FILE_TYPES}.")
         self.file_path = file_path
         self.file_type = file_type
-        self.data = self._load_data()
+        self._data: Optional[pd.DataFrame] = None
         self.question_column = question_column
         self.answer_column = answer_column
 
+    @staticmethod
+    def infer_file_type(file_path: str) -> str:
+        name = file_path.lower()
+        if name.endswith((".jsonl", ".jsonl.gz")):
+            return "jsonl"
+        if name.endswith(".parquet"):
+            return "parquet"
+        if name.endswith((".arrow", ".feather", ".ipc")):
+            return "arrow"
+        if name.endswith(".json"):
+            return "json"
+        return "csv"
+
+    @property
+    def data(self) -> pd.DataFrame:
+        if self._data is None:
+            self._data = self._load_data()
+        return self._data
+
     def _load_data(self):
         if self.file_type == "csv":
             return pd.read_csv(self.file_path)
         elif self.file_type == "json":
             return pd.read_json(self.file_path)
+        elif self.file_type == "jsonl":
+            return pd.read_json(self.file_path, lines=True)
+        elif self.file_type == "parquet":
+            return pd.read_parquet(self.file_path)
+        else:
+            return pd.read_feather(self.file_path)
+
+    def iter_rows(self, chunk_size: int = 10_000) -> Iterator[Dict[str, Any]]:
+        if self.file_type in ("jsonl", "parquet"):
+            yield from read_rows(self.file_path)
+        elif self.file_type == "arrow":
+            import pyarrow as pa
+
+            with pa.memory_map(self.file_path, "r") as source:
+                reader = pa.ipc.open_file(source)
+                for index in range(reader.num_record_batches):
+                    yield from reader.get_batch(index).to_pylist()
+        elif self.file_type == "csv":
+            for chunk in pd.read_csv(self.file_path, chunksize=chunk_size):
+                yield from chunk.to_dict("records")
         else:
-            raise ValueError(
-                f"Unsupported file type '{self.file_type}'. Must be 'csv', 'json', or 'tsv'."
-            )
+            yield from self.data.to_dict("records")
+
+    def iter_qa(
+            self,
+            question_column: Optional[str] = None,
+            answer_column: Optional[str] = None,
+            metadata_columns: Optional[List[str]] = None,
+            chunk_size: int = 10_000,
+    ) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Streams (question, answer, metadata) tuples, skipping rows without a question or an answer.
+
+        `metadata` holds `metadata_columns`, or every other column when it is None.
+        """
+        question_column = question_column or self.question_column
+        answer_column = answer_column or self.answer_column
+        for row in self.iter_rows(chunk_size):
+            question, answer = row.get(question_column), row.get(answer_column)
+            if question is None or answer is None:
+                continue
+            if metadata_columns is None:
+                metadata = {k: v for k, v in row.items() if k not in (question_column, answer_column)}
+            else:
+                metadata = {k: row.get(k) for k in metadata_columns}
+            yield question, answer, metadata
 
     def get_data(self):
         return self.data.copy()  # Return a copy to avoid modification of original data
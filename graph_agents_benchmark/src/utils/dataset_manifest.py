@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+from graph_agents_benchmark.src.utils.dataset_writer import read_rows
+from graph_agents_benchmark.src.utils.hashing import file_sha256
+
+# Bump when the enrichment output changes shape (e.g. new answer columns) to invalidate cached rows.
+ENRICHMENT_VERSION = 3
+
+
+def row_fingerprint(row: Dict[str, Any]) -> str:
+    """
+    Hash of the inputs that determine a row's answer: its database, question and Cypher.
+    """
+    key = json.dumps([row.get("database"), row.get("question"), row.get("cypher")], ensure_ascii=False)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class EnrichedRowIndex:
+    """
+    On-disk (SQLite) index of enriched rows keyed by row fingerprint, so reused and newly enriched rows are looked
+    up without holding a database's dataset in memory. The index file is temporary and removed by `close`.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        fd, self.path = tempfile.mkstemp(prefix="enriched_rows_", suffix=".sqlite", dir=directory)
+        os.close(fd)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("CREATE TABLE rows (fingerprint TEXT PRIMARY KEY, row TEXT NOT NULL)")
+
+    @staticmethod
+    def from_file(file_path: str, directory: Optional[str] = None) -> "EnrichedRowIndex":
+        """
+        Indexes a previously written enriched dataset file (JSONL, gzip JSONL or Parquet), if it exists.
+        """
+        index = EnrichedRowIndex(directory)
+        if os.path.exists(file_path):
+            for row in read_rows(file_path):
+                index.put(row_fingerprint(row), row)
+            index._connection.commit()
+        return index
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT count(*) FROM rows").fetchone()[0]
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return self._connection.execute(
+            "SELECT 1 FROM rows WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone() is not None
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        found = self._connection.execute("SELECT row FROM rows WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        return json.loads(found[0]) if found is not None else None
+
+    def put(self, fingerprint: str, row: Dict[str, Any]) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO rows (fingerprint, row) VALUES (?, ?)",
+            (fingerprint, json.dumps(row, ensure_ascii=False)),
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+        os.remove(self.path)
+
+    def __enter__(self) -> "EnrichedRowIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class DatasetManifest:
+    """
+    Tracks which dump and enrichment version each database's dataset files were built from.
+
+    Dump hashes are cached by (size, mtime) so unchanged dumps are not re-read on every build. All methods are
+    safe to call from concurrent per-database builds.
+    """
+
+    def __init__(self, file_path: str, data: Optional[Dict[str, Any]] = None):
+        self.file_path = file_path
+        self._data = data or {"dumps": {}, "databases": {}}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def load(file_path: str) -> "DatasetManifest":
+        if not os.path.exists(file_path):
+            return DatasetManifest(file_path)
+        with open(file_path) as f:
+            return DatasetManifest(file_path, json.load(f))
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.file_path)), exist_ok=True)
+        tmp_path = f"{self.file_path}.tmp"
+        with self._lock:
+            with open(tmp_path, "w") as f:
+                json.dump(self._data, f, indent=4, sort_keys=True)
+            os.replace(tmp_path, self.file_path)
+
+    def dump_fingerprint(self, dump_path: str) -> Optional[str]:
+        if not os.path.exists(dump_path):
+            return None
+        stat = os.stat(dump_path)
+        with self._lock:
+            cached = self._data["dumps"].get(dump_path)
+        if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            return cached["sha256"]
+
+        sha256 = file_sha256(dump_path)
+        with self._lock:
+            self._data["dumps"][dump_path] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha256,
+            }
+        return sha256
+
+    def is_current(self, database_name: str, dump_fingerprint: Optional[str], canonical: bool = False) -> bool:
+        with self._lock:
+            entry = self._data["databases"].get(database_name)
+        return (
+                dump_fingerprint is not None
+                and entry is not None
+                and entry["dump_sha256"] == dump_fingerprint
+                and entry["enrichment_version"] == ENRICHMENT_VERSION
+                and entry.get("canonical", False) == canonical
+        )
+
+    def record(self, database_name: str, dump_fingerprint: Optional[str], row_count: int,
+               canonical: bool = False) -> None:
+        entry = {
+            "dump_sha256": dump_fingerprint,
+            "enrichment_version": ENRICHMENT_VERSION,
+            "canonical": canonical,
+            "rows": row_count,
+        }
+        with self._lock:
+            self._data["databases"][database_name] = entry
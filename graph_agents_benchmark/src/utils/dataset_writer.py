@@ -0,0 +1,195 @@
+import gzip
+import json
+import shutil
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+FORMATS = ("jsonl", "parquet")
+COMPRESSIONS = ("none", "gzip")
+
+# Columns holding nested values of varying shape; Parquet stores them as JSON strings.
+JSON_COLUMNS = ("answer_typed", "query_profile")
+
+
+def dataset_path(base_path: str, file_format: str = "jsonl", compression: str = "none") -> str:
+    """
+    Returns the output path for a base path without extension, e.g. `./datasets/movies/questions_and_answers_movies_filtered`.
+    """
+    if file_format == "parquet":
+        return f"{base_path}.parquet"
+    return f"{base_path}.jsonl.gz" if compression == "gzip" else f"{base_path}.jsonl"
+
+
+class JsonlSink:
+    format = "jsonl"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows = 0
+        self._file = gzip.open(path, "wb") if path.endswith(".gz") else open(path, "wb")
+
+    @staticmethod
+    def encode(row: Dict[str, Any]) -> bytes:
+        return (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def write(self, line: bytes) -> None:
+        self._file.write(line)
+        self.rows += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink:
+    """
+    Writes rows to Parquet in row groups of `row_group_size`, so at most one row group is held in memory.
+    """
+
+    format = "parquet"
+
+    def __init__(self, path: str, row_group_size: int = 10_000):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Parquet output requires pyarrow: install the 'parquet' extra.") from e
+        self.path = path
+        self.rows = 0
+        self._row_group_size = row_group_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._writer = None
+
+    @staticmethod
+    def encode(row: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: json.dumps(v) if k in JSON_COLUMNS and v is not None else v for k, v in row.items()}
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._buffer.append(record)
+        self.rows += 1
+        if len(self._buffer) >= self._row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self._buffer:
+            return
+        if self._writer is None:
+            table = pa.Table.from_pylist(self._buffer)
+            # Columns that are null in the first row group would otherwise be typed `null` for the whole file.
+            schema = pa.schema([
+                field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in table.schema
+            ])
+            self._writer = pq.ParquetWriter(self.path, schema)
+            table = table.cast(schema)
+        else:
+            table = pa.Table.from_pylist(self._buffer, schema=self._writer.schema)
+        self._writer.write_table(table)
+        self._buffer = []
+
+    def close(self) -> None:
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            pq.write_table(pa.table({}), self.path)
+
+
+def open_sink(path: str):
+    return ParquetSink(path) if path.endswith(".parquet") else JsonlSink(path)
+
+
+class MultiSinkWriter:
+    """
+    Routes each row to every sink whose predicate accepts it, serializing it at most once per sink format (only
+    when a sink of that format takes it).
+
+        with MultiSinkWriter() as writer:
+            writer.add_sink("movies_filtered.jsonl", lambda row: row["answer"] is not None)
+            writer.add_sink("movies_unfiltered.jsonl")
+            writer.write_all(rows)
+    """
+
+    def __init__(self):
+        self._routes: List[Tuple[Any, Optional[Callable[[Dict[str, Any]], bool]]]] = []
+
+    def add_sink(self, path: str, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None):
+        sink = open_sink(path)
+        self._routes.append((sink, predicate))
+        return sink
+
+    def write(self, row: Dict[str, Any]) -> None:
+        encoded: Dict[str, Any] = {}
+        for sink, predicate in self._routes:
+            if predicate is None or predicate(row):
+                if sink.format not in encoded:
+                    encoded[sink.format] = sink.encode(row)
+                sink.write(encoded[sink.format])
+
+    def write_all(self, rows: Iterable[Dict[str, Any]]) -> None:
+        for row in rows:
+            self.write(row)
+
+    def close(self) -> None:
+        for sink, _ in self._routes:
+            sink.close()
+
+    def __enter__(self) -> "MultiSinkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def concat_outputs(source_paths: List[str], target_path: str) -> None:
+    """
+    Concatenates dataset files of the same format without re-serializing rows.
+
+    JSONL (also gzip, whose members concatenate) is copied byte-wise; Parquet is copied row group by row group.
+    """
+    if target_path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for path in source_paths:
+                source = pq.ParquetFile(path)
+                for index in range(source.num_row_groups):
+                    table = source.read_row_group(index)
+                    if writer is None:
+                        writer = pq.ParquetWriter(target_path, table.schema)
+                    writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+        return
+
+    with open(target_path, "wb") as target:
+        for path in source_paths:
+            with open(path, "rb") as source:
+                shutil.copyfileobj(source, target)
+
+
+def read_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Streams the rows of a JSONL, gzip-compressed JSONL or Parquet dataset file.
+    """
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        source = pq.ParquetFile(path)
+        for index in range(source.num_row_groups):
+            for row in source.read_row_group(index).to_pylist():
+                for column in JSON_COLUMNS:
+                    if isinstance(row.get(column), str):
+                        row[column] = json.loads(row[column])
+                yield row
+        return
+
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
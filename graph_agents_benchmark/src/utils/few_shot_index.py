@@ -0,0 +1,151 @@
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from graph_agents_benchmark.src.llm.embedding_pipeline import EmbeddingPipeline
+from graph_agents_benchmark.src.llm.embeddings import embedding_function
+from graph_agents_benchmark.src.utils.hashing import file_sha256
+
+VECTORS_FILE = "vectors.npy"
+EXAMPLES_FILE = "examples.jsonl"
+META_FILE = "meta.json"
+
+
+def _normalize_question(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+class FewShotIndex:
+    """
+    Memory-mapped embedding index over verified question/Cypher/answer examples of one database.
+
+    The index is built once from an enriched dataset file (e.g.
+    `datasets/movies/questions_and_answers_movies_filtered.jsonl`) and stored next to it, one directory per
+    embedding model. Queries are a single matrix-vector product over the memory-mapped vectors.
+    """
+
+    def __init__(self, index_dir: str, embed_model=None):
+        with open(os.path.join(index_dir, META_FILE)) as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        self._vectors = np.load(os.path.join(index_dir, VECTORS_FILE), mmap_mode="r")
+        with open(os.path.join(index_dir, EXAMPLES_FILE), encoding="utf-8") as f:
+            self._examples = [json.loads(line) for line in f]
+
+        self._positions: Dict[str, List[int]] = {}
+        for position, example in enumerate(self._examples):
+            self._positions.setdefault(_normalize_question(example["question"]), []).append(position)
+        self._embed = embedding_function(embed_model) if embed_model is not None else None
+
+    def __len__(self) -> int:
+        return len(self._examples)
+
+    @staticmethod
+    def build(dataset_path: str, index_dir: str, embed_model, model_name: str = "",
+              batch_size: int = 64) -> "FewShotIndex":
+        """
+        Embeds the questions of an enriched dataset file and writes the index to `index_dir`.
+
+        Raises:
+            ValueError: If the file has no row with a question, Cypher and answer.
+        """
+        examples = []
+        seen = set()
+        with open(dataset_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if not row.get("question") or not row.get("cypher") or row.get("answer") is None:
+                    continue
+                key = _normalize_question(row["question"])
+                if key not in seen:
+                    seen.add(key)
+                    examples.append({"question": row["question"], "cypher": row["cypher"], "answer": row["answer"]})
+
+        if not examples:
+            raise ValueError(f"No usable few-shot examples (question, cypher and answer) in {dataset_path}")
+
+        pipeline = embed_model
+        if not isinstance(pipeline, EmbeddingPipeline):
+            pipeline = EmbeddingPipeline(embed_model, model_name, cache_dir=None, batch_size=batch_size)
+        matrix = pipeline.embed([e["question"] for e in examples]).reshape(len(examples), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1, norms)
+
+        os.makedirs(index_dir, exist_ok=True)
+        np.save(os.path.join(index_dir, VECTORS_FILE), matrix)
+        with open(os.path.join(index_dir, EXAMPLES_FILE), "w", encoding="utf-8") as f:
+            for example in examples:
+                f.write(json.dumps(example, ensure_ascii=False) + "\n")
+        with open(os.path.join(index_dir, META_FILE), "w") as f:
+            json.dump(
+                {
+                    "source": os.path.abspath(dataset_path),
+                    "source_sha256": file_sha256(dataset_path),
+                    "model": model_name,
+                    "size": len(examples),
+                    "dimensions": int(matrix.shape[1]),
+                },
+                f,
+                indent=4,
+            )
+        return FewShotIndex(index_dir, embed_model)
+
+    @staticmethod
+    def load_or_build(dataset_path: str, embed_model, model_name: str,
+                      index_root: Optional[str] = None) -> "FewShotIndex":
+        """
+        Loads the index of `dataset_path` for `model_name`, (re)building it when missing or stale.
+        """
+        model_slug = re.sub(r"[^\w.-]+", "_", model_name)
+        index_root = index_root or os.path.join(os.path.dirname(os.path.abspath(dataset_path)), "few_shot_index")
+        index_dir = os.path.join(index_root, model_slug)
+
+        meta_path = os.path.join(index_dir, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get("source_sha256") == file_sha256(dataset_path):
+                return FewShotIndex(index_dir, embed_model)
+
+        print(f"Building few-shot index for [{dataset_path}] with model [{model_name}]...")
+        return FewShotIndex.build(dataset_path, index_dir, embed_model, model_name)
+
+    def query(self, question: str, k: int = 3, vector: Optional[Sequence[float]] = None,
+              exclude_question: bool = True) -> List[Dict[str, Any]]:
+        """
+        Returns the `k` examples closest to `question`, most similar first.
+
+        Examples with the same (case and whitespace normalized) question are skipped when `exclude_question` is set,
+        so a question under test never sees its own gold Cypher.
+        """
+        if not self._examples or k <= 0:
+            return []
+        if vector is None:
+            if self._embed is None:
+                raise ValueError("FewShotIndex was loaded without an embedding model; pass `vector`.")
+            vector = self._embed(question)
+
+        query_vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query_vector)
+        similarities = self._vectors @ (query_vector / norm if norm else query_vector)
+        if exclude_question:
+            excluded = self._positions.get(_normalize_question(question), [])
+            if excluded:
+                similarities[excluded] = -np.inf
+
+        k = min(k, len(self._examples))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [
+            {**self._examples[i], "similarity": float(similarities[i])}
+            for i in top
+            if np.isfinite(similarities[i])
+        ]
+
+    @staticmethod
+    def format_examples(examples: List[Dict[str, Any]]) -> str:
+        return "\n\n".join(f"Question: {e['question']}\nCypher: {e['cypher']}" for e in examples)
@@ -0,0 +1,12 @@
+import hashlib
+
+
+def file_sha256(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Hex sha256 of a file's contents, read in chunks so large dumps and datasets are not loaded into memory.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,64 @@
+import random
+import time
+from typing import Optional
+
+
+class LatencyModel:
+    """
+    Samples artificial latencies from a configurable distribution.
+
+    Used by the offline stand-ins for the LLM and Neo4j so harness runs are reproducible for a given seed.
+
+    Supported distributions (`mean` and `spread` are in seconds):
+        constant     - always `mean`
+        uniform      - uniform in [mean - spread, mean + spread]
+        normal       - gaussian with stddev `spread`
+        lognormal    - lognormal with median `mean` and shape `spread`
+        exponential  - exponential with mean `mean`
+    """
+
+    DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal", "exponential")
+
+    def __init__(self, distribution: str = "constant", mean: float = 0.0, spread: float = 0.0,
+                 seed: Optional[int] = 0):
+        if distribution not in LatencyModel.DISTRIBUTIONS:
+            raise ValueError(
+                f"Unsupported latency distribution '{distribution}'. Must be one of {LatencyModel.DISTRIBUTIONS}."
+            )
+        self.distribution = distribution
+        self.mean = mean
+        self.spread = spread
+        self._random = random.Random(seed)
+
+    @staticmethod
+    def parse(spec: str, seed: Optional[int] = 0) -> "LatencyModel":
+        """
+        Builds a latency model from a `<distribution>[:<mean>[:<spread>]]` spec, e.g. `lognormal:0.8:0.3`.
+        """
+        parts = spec.split(":") if spec else []
+        distribution = parts[0] if parts and parts[0] else "constant"
+        mean = float(parts[1]) if len(parts) > 1 else 0.0
+        spread = float(parts[2]) if len(parts) > 2 else 0.0
+        return LatencyModel(distribution, mean, spread, seed)
+
+    def sample(self) -> float:
+        if self.mean <= 0 and (self.spread <= 0 or self.distribution in ("lognormal", "exponential")):
+            return 0.0
+        match self.distribution:
+            case "constant":
+                value = self.mean
+            case "uniform":
+                value = self._random.uniform(self.mean - self.spread, self.mean + self.spread)
+            case "normal":
+                value = self._random.gauss(self.mean, self.spread)
+            case "lognormal":
+                value = self.mean * self._random.lognormvariate(0.0, self.spread)
+            case _:
+                value = self._random.expovariate(1.0 / self.mean)
+        return max(0.0, value)
+
+    def wait(self) -> float:
+        delay = self.sample()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,146 @@
+import os
+import resource
+import sys
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+MB = 1024 * 1024
+
+
+def current_rss() -> int:
+    """
+    Resident set size of the current process in bytes. Falls back to the peak RSS where /proc is unavailable.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryProfiler:
+    """
+    Samples process memory after every `sample_every`-th question.
+
+    "rss" reads the resident set size only (a single /proc read, cheap enough for timed runs). "tracemalloc"
+    also traces Python allocations, which makes every allocation slower: use it to find what grows, not for
+    latency numbers. Samples are taken by the executor's metadata provider after a question's time was measured.
+
+    Growth sites are only known to the process that traced them: a `ProcessExecutor` parent has none, its
+    workers' samples carry their RSS and traced totals only.
+    """
+
+    MODES = ("rss", "tracemalloc")
+
+    def __init__(self, mode: str = "rss", sample_every: int = 1, frames: int = 5):
+        if mode not in MemoryProfiler.MODES:
+            raise ValueError(f"Unsupported memory profiler mode '{mode}'. Must be one of {MemoryProfiler.MODES}.")
+        self.mode = mode
+        self.sample_every = max(1, sample_every)
+        self.questions = 0
+        self.baseline_rss = current_rss()
+        self._baseline_snapshot: Optional[tracemalloc.Snapshot] = None
+        if mode == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def metadata(self, question: str) -> Dict[str, Any]:
+        """
+        Executor metadata provider adding the process memory after the question to its result row.
+        """
+        self.questions += 1
+        if (self.questions - 1) % self.sample_every:
+            return {}
+        sample = {"memory_sample": self.questions, "rss_mb": current_rss() / MB}
+        if self.mode == "tracemalloc":
+            traced, peak = tracemalloc.get_traced_memory()
+            sample["traced_mb"] = traced / MB
+            sample["traced_peak_mb"] = peak / MB
+            if self._baseline_snapshot is None:
+                # The first question has loaded lazy imports and clients; growth is measured from here.
+                self._baseline_snapshot = tracemalloc.take_snapshot()
+        return sample
+
+    def reset_baseline(self) -> None:
+        """
+        Measures growth from now on, e.g. after warmup: re-reads the baseline RSS, resets the traced peak and
+        takes the tracemalloc baseline again at the next sample.
+        """
+        self.baseline_rss = current_rss()
+        self._baseline_snapshot = None
+        if self.mode == "tracemalloc" and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+    def growth_sites(self, top_n: int = 10) -> List[Dict[str, Any]]:
+        """
+        Source lines whose live Python allocations grew the most since the first question ("tracemalloc" only).
+        """
+        if self._baseline_snapshot is None:
+            return []
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+        stats = snapshot.compare_to(self._baseline_snapshot.filter_traces(filters), "lineno")
+        return [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff_mb": stat.size_diff / MB,
+                "count_diff": stat.count_diff,
+                "size_mb": stat.size / MB,
+            }
+            for stat in stats[:top_n]
+            if stat.size_diff > 0
+        ]
+
+    def stop(self) -> None:
+        if self.mode == "tracemalloc" and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @staticmethod
+    def growth(values: List[float], positions: List[int]) -> Dict[str, Any]:
+        """
+        Start, end, peak, total growth and the least-squares growth per question of a memory series in MB.
+        """
+        if not values:
+            return {"samples": 0}
+        slope = float(np.polyfit(positions, values, 1)[0]) if len(set(positions)) > 1 else None
+        return {
+            "samples": len(values),
+            "start_mb": values[0],
+            "end_mb": values[-1],
+            "peak_mb": max(values),
+            "growth_mb": values[-1] - values[0],
+            "growth_per_question_kb": slope * 1024 if slope is not None else None,
+        }
+
+    @staticmethod
+    def report(results: List[Dict[str, Any]], solution: str) -> Dict[str, Any]:
+        """
+        Memory growth of a solution over benchmark result rows ("rss_mb", "traced_mb"), overall and per worker
+        process for `ProcessExecutor` runs.
+        """
+        by_worker: Dict[str, List[tuple]] = {}
+        for row in results:
+            if row.get("rss_mb") is not None:
+                # `memory_sample` counts the questions of the sampling process, including unsampled ones.
+                by_worker.setdefault(str(row.get("worker", 0)), []).append((row["memory_sample"], row))
+
+        report: Dict[str, Any] = {"solution": solution, "workers": {}}
+        for worker, samples in sorted(by_worker.items()):
+            samples.sort(key=lambda sample: sample[0])
+            positions = [position for position, _ in samples]
+            worker_report = {"rss": MemoryProfiler.growth([row["rss_mb"] for _, row in samples], positions)}
+            traced = [(position, row["traced_mb"]) for position, row in samples if row.get("traced_mb") is not None]
+            if traced:
+                worker_report["traced"] = MemoryProfiler.growth(
+                    [value for _, value in traced], [position for position, _ in traced]
+                )
+            report["workers"][worker] = worker_report
+
+        rss_growth = [w["rss"]["growth_mb"] for w in report["workers"].values() if w["rss"]["samples"]]
+        report["rss_growth_mb"] = max(rss_growth) if rss_growth else None
+        slopes = [w["rss"]["growth_per_question_kb"] for w in report["workers"].values()
+                  if w["rss"].get("growth_per_question_kb") is not None]
+        report["rss_growth_per_question_kb"] = max(slopes) if slopes else None
+        return report
@@ -1,75 +1,29 @@
+import io
 import json
 import re
-from typing import Dict, List
-from neo4j import GraphDatabase, Driver, Record
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from neo4j import Driver, Record
 from neo4j.graph import Node, Relationship
 from neo4j.time import DateTime, Date, Time, Duration
 
-class QAEnricher:
-    def __init__(
-            self,
-            db_name: str,
-            neo4j_uri: str = "bolt://localhost:7687",
-            neo4j_user: str = "neo4j",
-            neo4j_password: str = "neo4j_test_password",
-    ) -> None:
-        self._db_name = db_name
-        self._neo4j_uri = neo4j_uri
-        self._neo4j_user = neo4j_user
-        self._neo4j_password = neo4j_password
-        self._driver: Driver = GraphDatabase.driver(
-            self._neo4j_uri, auth=(self._neo4j_user, self._neo4j_password)
-        )
-        self._driver.verify_connectivity()
-
-    def enrich(
-            self,
-            dataset: List[Dict[str, str]],
-            cypher_column: str = "cypher",
-            answer_key: str = "answer",
-    ) -> List[Dict[str, str]]:
-        enriched_dataset = []
-
-        with self._driver.session(database=self._db_name) as session:
-            for item in dataset:
-                cypher_query = item.get(cypher_column)
-                if not cypher_query:
-                    item[answer_key] = None
-                    enriched_dataset.append(item)
-                    continue
-
-                try:
-                    query = QAEnricher._unescape_query(cypher_query)
-
-                    # Check for missing properties
-                    missing_props = QAEnricher._query_has_missing_properties(session, query)
-                    if missing_props:
-                        print(
-                            f"⚠️ Query references missing properties in database: {', '.join(missing_props)} | {cypher_query}")
-                        item[answer_key] = None
-                        enriched_dataset.append(item)
-                        continue
-
-                    result = session.run(query)
-                    item[answer_key] = self._format_result(result)
-                except Exception as e:
-                    print(f"⚠️ Error executing query:\n{cypher_query}\nError: {e}")
-                    item[answer_key] = None
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+from graph_agents_benchmark.src.utils.cypher_gate import CypherGate
+from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+from graph_agents_benchmark.src.utils.schema_snapshot import SchemaSnapshot
+from graph_agents_benchmark.src.utils.typed_answer import TypedAnswerBuilder
 
-                enriched_dataset.append(item)
 
-        return enriched_dataset
+class AnswerFormatter:
+    """
+    Serializes Cypher results into the answer strings stored in the datasets.
 
-    def close(self) -> None:
-        if self._driver:
-            self._driver.close()
+    Used by QAEnricher for the gold answers and by solutions that answer straight from the database, so both
+    produce byte-identical answers for the same records.
+    """
 
-    @staticmethod
-    def _unescape_query(q: str) -> str:
-        try:
-            return q.encode("utf-8").decode("unicode_escape")
-        except UnicodeDecodeError:
-            return q
+    def __init__(self, canonical: bool = False) -> None:
+        # Sort the keys of serialized records so equal results always produce identical answers.
+        self.canonical = canonical
 
     @staticmethod
     def _parse_key(key: str) -> str:
@@ -77,24 +31,25 @@ class QAEnricher:
             return key.split(".")[-1].strip()
         return key.strip()
 
-    def _format_result(self, result_iter) -> str | None:
-        lines = []
+    def format_result(self, result_iter) -> str | None:
+        """
+        Serializes records one at a time into a single buffer; records are never materialized as a list.
+        """
+        buffer = io.StringIO()
+        written = False
 
         for record in result_iter:
             if not record:
                 continue
-            elif QAEnricher._is_stringifies(record):
-                line = self._stringify(record)
-                lines.append(line)
+            if written:
+                buffer.write("\n")
+            if AnswerFormatter._is_stringifies(record):
+                buffer.write(self._stringify(record))
             else:
-                line = self._stringify(record.data())
-                lines.append(line)
-        if len(lines) > 1:
-            return "\n".join(lines)
-        elif len(lines) == 1:
-            return lines[0]
-        else:
-            return None
+                buffer.write(self._stringify(record.data()))
+            written = True
+
+        return buffer.getvalue() if written else None
 
     @staticmethod
     def _is_stringifies(val) -> bool:
@@ -111,18 +66,20 @@ class QAEnricher:
             has_strings = False
             lines = []
             for k, v in val.items():
-                if len(k) == 1 and QAEnricher._is_stringifies(v):
+                if len(k) == 1 and AnswerFormatter._is_stringifies(v):
                     has_strings = True
                     lines.append(self._stringify(v))
                 else:
-                    lines.append({QAEnricher._parse_key(k): self._stringify(v)})
+                    lines.append((AnswerFormatter._parse_key(k), self._stringify(v)))
             if has_strings:
                 return " ".join(lines)
             else:
+                # The first occurrence of a key wins and keys are emitted in reverse order, which is what the
+                # historical pairwise `{**item, **result}` merge produced; the reversed update keeps it linear.
                 result = {}
-                for item in lines:
-                    result = {**item, **result}
-                return json.dumps(result)
+                for key, value in reversed(lines):
+                    result[key] = value
+                return json.dumps(result, sort_keys=self.canonical)
 
         elif isinstance(val, list):
             if all(isinstance(v, (str, int, float, None)) for v in val):
@@ -136,8 +93,111 @@ class QAEnricher:
 
         return str(val)
 
+
+class QAEnricher:
+    def __init__(
+            self,
+            db_name: str,
+            neo4j_uri: str = "bolt://localhost:7687",
+            neo4j_user: str = "neo4j",
+            neo4j_password: str = "neo4j_test_password",
+            cypher_gate: Optional[CypherGate] = None,
+            canonical: bool = False,
+            query_profiler: Optional[QueryProfiler] = None,
+            schema: Optional[SchemaSnapshot] = None,
+    ) -> None:
+        self._db_name = db_name
+        self._neo4j_uri = neo4j_uri
+        self._neo4j_user = neo4j_user
+        self._neo4j_password = neo4j_password
+        self._cypher_gate = cypher_gate
+        self._formatter = AnswerFormatter(canonical)
+        self._query_profiler = query_profiler
+        # Property keys checked against every row's Cypher; fetched once per `enrich` call without a snapshot.
+        self._property_keys = set(schema.property_keys) if schema is not None else None
+        self._driver: Driver = Neo4jDriverRegistry.get(
+            self._neo4j_uri, self._neo4j_user, self._neo4j_password, self._db_name
+        )
+
+    def enrich(
+            self,
+            dataset: Iterable[Dict[str, str]],
+            cypher_column: str = "cypher",
+            answer_key: str = "answer",
+            typed_answer_key: Optional[str] = "answer_typed",
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Executes each row's Cypher and stores the formatted result under `answer_key`.
+
+        Rows are read from `dataset` and yielded one at a time, so the enriched dataset is never held in memory.
+
+        Unless `typed_answer_key` is None, the canonical typed form of the same result (see typed_answer.py) is
+        stored next to it; both are None when the query fails or returns nothing. With a query profiler the
+        query's cost is stored under "query_profile".
+        """
+        with self._driver.session(database=self._db_name) as session:
+            property_keys = self._property_keys
+            if property_keys is None:
+                property_keys = set(session.run("CALL db.propertyKeys()").value())
+            for item in dataset:
+                cypher_query = item.get(cypher_column)
+                item[answer_key] = None
+                if typed_answer_key:
+                    item[typed_answer_key] = None
+                if not cypher_query:
+                    item[answer_key] = None
+                    yield item
+                    continue
+
+                try:
+                    query = QAEnricher._unescape_query(cypher_query)
+
+                    # Check for missing properties
+                    missing_props = QAEnricher._query_has_missing_properties(property_keys, query)
+                    if missing_props:
+                        print(
+                            f"⚠️ Query references missing properties in database: {', '.join(missing_props)} | {cypher_query}")
+                        item[answer_key] = None
+                        yield item
+                        continue
+
+                    if self._cypher_gate is not None:
+                        self._cypher_gate.guard(query)
+
+                    if self._query_profiler is not None:
+                        result = self._query_profiler.stream(session, query, database=self._db_name)
+                    else:
+                        result = session.run(query)
+                    if typed_answer_key:
+                        typed = TypedAnswerBuilder(query)
+                        item[answer_key] = self._formatter.format_result(typed.collect(result))
+                        if item[answer_key] is not None:
+                            item[typed_answer_key] = typed.build()
+                    else:
+                        item[answer_key] = self._formatter.format_result(result)
+                except Exception as e:
+                    print(f"⚠️ Error executing query:\n{cypher_query}\nError: {e}")
+                    item[answer_key] = None
+
+                if self._query_profiler is not None:
+                    # Drained per row, so profiles never pile up over the enrichment.
+                    profiles = self._query_profiler.take()
+                    item["query_profile"] = profiles[-1].model_dump() if profiles else None
+                yield item
+
+    def close(self) -> None:
+        # The driver is shared through Neo4jDriverRegistry, so only the reference is released here.
+        self._driver = None
+
+    @staticmethod
+    def _unescape_query(q: str) -> str:
+        try:
+            return q.encode("utf-8").decode("unicode_escape")
+        except UnicodeDecodeError:
+            return q
+
     @staticmethod
-    def _query_has_missing_properties(session, query: str) -> List[str]:
+    def _query_has_missing_properties(existing_keys: Set[str], query: str) -> List[str]:
         """
         Check whether the query refers to property keys that don't exist in the DB.
         Only works for simple property references like m.foo or n.bar.
@@ -147,6 +207,5 @@ class QAEnricher:
         if not props:
             return []
 
-        existing_keys = session.run("CALL db.propertyKeys()").value()
         missing = [p for p in props if p not in existing_keys]
         return missing
@@ -0,0 +1,180 @@
+import heapq
+import re
+import threading
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class QueryProfile(BaseModel):
+    query: str
+    database: Optional[str] = None
+    mode: str
+    rows: int = 0
+    result_available_after: Optional[int] = None
+    result_consumed_after: Optional[int] = None
+    db_hits: Optional[int] = None
+    page_cache_hits: Optional[int] = None
+    page_cache_misses: Optional[int] = None
+    operators: List[str] = []
+    error: Optional[str] = None
+
+    @property
+    def db_time(self) -> Optional[int]:
+        """
+        Server-side milliseconds until the last record was consumed.
+        """
+        if self.result_available_after is None:
+            return None
+        return self.result_available_after + (self.result_consumed_after or 0)
+
+
+class QueryProfiler:
+    """
+    Captures per-query Neo4j cost: result summary timings (`result_available_after`, `result_consumed_after`)
+    and rows in "summary" mode, additionally db hits, page cache hits/misses and operators of the `PROFILE` plan
+    in "profile" mode.
+
+    Profiles are collected per thread until `take` is called, so a solution's queries can be attached to the
+    result row of the question that issued them. Queries issued from other threads (e.g. inside
+    `predict_batch`) are not attached.
+    """
+
+    MODES = ("summary", "profile")
+
+    def __init__(self, mode: str = "summary"):
+        if mode not in QueryProfiler.MODES:
+            raise ValueError(f"Unsupported query profiler mode '{mode}'. Must be one of {QueryProfiler.MODES}.")
+        self.mode = mode
+        self._local = threading.local()
+
+    def stream(self, session, query: str, parameters: Optional[Dict[str, Any]] = None,
+               database: Optional[str] = None) -> Iterator[Any]:
+        """
+        Runs the query in `session` and yields its records as they arrive. The profile is recorded once the
+        records are exhausted (read from the result summary) or the query fails; errors are re-raised.
+        """
+        executed = query
+        if self.mode == "profile" and not re.match(r"(?i)^\s*(EXPLAIN|PROFILE)\b", query):
+            executed = f"PROFILE {query}"
+
+        profile = QueryProfile(query=query, database=database, mode=self.mode)
+        try:
+            result = session.run(executed, parameters or {})
+            for record in result:
+                profile.rows += 1
+                yield record
+            summary = result.consume()
+        except Exception as e:
+            profile.error = repr(e)
+            self._record(profile)
+            raise
+
+        if summary is not None:
+            profile.result_available_after = getattr(summary, "result_available_after", None)
+            profile.result_consumed_after = getattr(summary, "result_consumed_after", None)
+            plan = getattr(summary, "profile", None)
+            if plan:
+                totals = {"dbHits": 0, "pageCacheHits": 0, "pageCacheMisses": 0}
+                QueryProfiler._walk_profile(plan, profile.operators, totals)
+                profile.db_hits = totals["dbHits"]
+                profile.page_cache_hits = totals["pageCacheHits"]
+                profile.page_cache_misses = totals["pageCacheMisses"]
+        self._record(profile)
+
+    def run(self, session, query: str, parameters: Optional[Dict[str, Any]] = None,
+            database: Optional[str] = None) -> Tuple[List[Any], QueryProfile]:
+        """
+        Runs the query in `session`, consuming all records, and returns them with the query's profile.
+        Errors are recorded on the profile and re-raised.
+        """
+        records = list(self.stream(session, query, parameters, database))
+        return records, self._local.profiles[-1]
+
+    def query(self, driver, database: Optional[str], query: str,
+              parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Profiled equivalent of `Neo4jGraph.query`: runs the query in a new session and returns the rows as dicts.
+        """
+        with driver.session(database=database) as session:
+            records, _ = self.run(session, query, parameters, database=database)
+        return [record.data() for record in records]
+
+    def wrap(self, driver, database: Optional[str]) -> Callable:
+        """
+        Returns a `query(cypher, params)` callable that replaces a graph store's own `query`.
+        """
+
+        def profiled(query: str, param_map: Optional[Dict[str, Any]] = None, *args, **kwargs):
+            return self.query(driver, database, query, param_map)
+
+        return profiled
+
+    def take(self) -> List[QueryProfile]:
+        """
+        Returns and clears the profiles recorded by the current thread since the last call.
+        """
+        profiles = getattr(self._local, "profiles", [])
+        self._local.profiles = []
+        return profiles
+
+    def metadata(self, question: str) -> Dict[str, Any]:
+        """
+        Executor metadata provider adding the question's query profiles and total server time to its result row.
+        """
+        profiles = self.take()
+        db_times = [p.db_time for p in profiles if p.db_time is not None]
+        return {
+            "query_profiles": [p.model_dump() for p in profiles],
+            "db_time_ms": sum(db_times) if db_times else None,
+        }
+
+    @staticmethod
+    def report(rows: Iterable[Dict[str, Any]], top_n: int = 5) -> Dict[str, Any]:
+        """
+        Per-database totals and the `top_n` most expensive queries (by db hits, then server time) over benchmark
+        result rows ("query_profiles") or enriched dataset rows ("query_profile"). Rows are read once and only
+        the current top `top_n` profiles per database are kept, so `rows` may be a stream over a dataset file.
+        """
+        databases: Dict[str, Dict[str, Any]] = {}
+        # Min-heaps of (db hits, db time, tie breaker, profile) holding the most expensive profiles so far.
+        expensive: Dict[str, List[Tuple[int, int, int, Dict[str, Any]]]] = {}
+        order = count()
+        for row in rows:
+            profiles = row.get("query_profiles") or ([row["query_profile"]] if row.get("query_profile") else [])
+            for profile in profiles:
+                database = str(profile.get("database") or (row.get("metadata") or {}).get("database"))
+                db_time = QueryProfile(**profile).db_time
+                stats = databases.setdefault(
+                    database, {"queries": 0, "errors": 0, "db_time_ms": 0, "db_hits": 0, "rows": 0}
+                )
+                stats["queries"] += 1
+                stats["errors"] += profile.get("error") is not None
+                stats["db_time_ms"] += db_time or 0
+                stats["db_hits"] += profile.get("db_hits") or 0
+                stats["rows"] += profile.get("rows") or 0
+                candidate = (profile.get("db_hits") or 0, db_time or 0, -next(order),
+                             {"question": row.get("question"), "db_time_ms": db_time} | profile)
+                heap = expensive.setdefault(database, [])
+                if len(heap) < top_n:
+                    heapq.heappush(heap, candidate)
+                elif heap and candidate[:3] > heap[0][:3]:
+                    heapq.heapreplace(heap, candidate)
+
+        for database, stats in databases.items():
+            stats["most_expensive"] = [candidate[3] for candidate in sorted(expensive[database], reverse=True)]
+        return {"databases": databases}
+
+    def _record(self, profile: QueryProfile) -> None:
+        if not hasattr(self._local, "profiles"):
+            self._local.profiles = []
+        self._local.profiles.append(profile)
+
+    @staticmethod
+    def _walk_profile(plan: Dict[str, Any], operators: List[str], totals: Dict[str, int]) -> None:
+        operators.append(plan.get("operatorType", ""))
+        for key in totals:
+            totals[key] += plan.get(key) or 0
+        for child in plan.get("children") or []:
+            QueryProfiler._walk_profile(child, operators, totals)
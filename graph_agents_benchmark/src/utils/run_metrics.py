@@ -0,0 +1,221 @@
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+PREFIX = "benchmark"
+PERCENTILES = (50, 90, 95, 99)
+
+
+class RunMetrics:
+    """
+    Live counters of a benchmark run, rendered in the Prometheus text exposition format.
+
+    Latency percentiles and answer tokens/sec are computed over the last `window` completed questions.
+    Tokens are whitespace-separated tokens of the answers, the solutions do not report LLM token usage.
+    Extra gauges (e.g. Cypher gate cache stats) can be added with `add_source`.
+    """
+
+    def __init__(self, total: Optional[int] = None, window: int = 1000):
+        self.total = total
+        self.started = 0
+        self.completed = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.answer_tokens = 0
+        self._latencies = deque(maxlen=window)
+        self._completions = deque(maxlen=window)
+        self._sources: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._start_time = time.time()
+        self._lock = threading.Lock()
+
+    def add_source(self, name: str, source: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Exposes the numeric values of `source()` as `benchmark_<name>_<key>` gauges.
+        """
+        self._sources[name] = source
+
+    def start(self, count: int = 1) -> None:
+        with self._lock:
+            self.started += count
+
+    def fail(self, count: int = 1) -> None:
+        with self._lock:
+            self.errors += count
+
+    def observe(self, result: Dict[str, Any]) -> None:
+        """
+        Records a completed question from its result row.
+        """
+        tokens = len(result["actual_answer"].split()) if result.get("actual_answer") else 0
+        with self._lock:
+            self.completed += 1
+            self.answer_tokens += tokens
+            self._latencies.append(result["time_taken"])
+            self._completions.append((time.time(), tokens))
+            if result.get("cache_hit") is True:
+                self.cache_hits += 1
+            elif result.get("cache_hit") is False:
+                self.cache_misses += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = list(self._latencies)
+            completions = list(self._completions)
+            snapshot = {
+                "total": self.total,
+                "started": self.started,
+                "completed": self.completed,
+                "errors": self.errors,
+                "in_flight": self.started - self.completed - self.errors,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "answer_tokens": self.answer_tokens,
+                "elapsed": time.time() - self._start_time,
+            }
+        finished = snapshot["completed"] + snapshot["errors"]
+        snapshot["error_rate"] = snapshot["errors"] / finished if finished else 0.0
+        lookups = snapshot["cache_hits"] + snapshot["cache_misses"]
+        snapshot["cache_hit_rate"] = snapshot["cache_hits"] / lookups if lookups else None
+        for p, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES) if latencies else [None] * 4):
+            snapshot[f"latency_p{p}"] = float(value) if value is not None else None
+
+        snapshot["questions_per_second"] = None
+        snapshot["tokens_per_second"] = None
+        if len(completions) > 1 and completions[-1][0] > completions[0][0]:
+            span = completions[-1][0] - completions[0][0]
+            snapshot["questions_per_second"] = (len(completions) - 1) / span
+            snapshot["tokens_per_second"] = sum(tokens for _, tokens in completions[1:]) / span
+
+        for name, source in self._sources.items():
+            for key, value in source().items():
+                snapshot[f"{name}_{key}"] = value
+        return snapshot
+
+    def render(self) -> str:
+        """
+        Current metrics in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, value):
+            if value is None:
+                return
+            lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            lines.append(f"{PREFIX}_{name} {float(value)}")
+
+        metric("questions_total", "gauge", "Questions in the run.", snapshot["total"])
+        metric("questions_completed_total", "counter", "Completed questions.", snapshot["completed"])
+        metric("questions_failed_total", "counter", "Questions whose prediction raised.", snapshot["errors"])
+        metric("questions_in_flight", "gauge", "Questions being predicted.", snapshot["in_flight"])
+        metric("error_rate", "gauge", "Failed / finished questions.", snapshot["error_rate"])
+        metric("cache_hits_total", "counter", "Semantic cache hits.", snapshot["cache_hits"])
+        metric("cache_misses_total", "counter", "Semantic cache misses.", snapshot["cache_misses"])
+        metric("cache_hit_rate", "gauge", "Semantic cache hit rate.", snapshot["cache_hit_rate"])
+        metric("answer_tokens_total", "counter", "Whitespace tokens of the answers.", snapshot["answer_tokens"])
+        metric("tokens_per_second", "gauge", "Rolling answer tokens per second.", snapshot["tokens_per_second"])
+        metric("questions_per_second", "gauge", "Rolling completed questions per second.",
+               snapshot["questions_per_second"])
+        percentiles = [(p, snapshot[f"latency_p{p}"]) for p in PERCENTILES if snapshot[f"latency_p{p}"] is not None]
+        for i, (p, value) in enumerate(percentiles):
+            if i == 0:
+                lines.append(f"# HELP {PREFIX}_latency_seconds Rolling per-question latency.")
+                lines.append(f"# TYPE {PREFIX}_latency_seconds summary")
+            lines.append(f'{PREFIX}_latency_seconds{{quantile="{p / 100}"}} {value}')
+        for name in self._sources:
+            for key, value in snapshot.items():
+                if key.startswith(f"{name}_") and isinstance(value, (int, float)) and not isinstance(value, bool):
+                    metric(key, "gauge", f"{name} {key[len(name) + 1:]}.", value)
+        return "\n".join(lines) + "\n"
+
+    def progress(self) -> str:
+        snapshot = self.snapshot()
+        total = f"/{snapshot['total']}" if snapshot["total"] is not None else ""
+        line = f"⏳ {snapshot['completed']}{total} done, {snapshot['in_flight']} in flight, {snapshot['errors']} errors"
+        if snapshot["latency_p95"] is not None:
+            line += f", p95 {snapshot['latency_p95']:.3f}s, {snapshot['questions_per_second'] or 0:.1f} q/s"
+        return line
+
+
+class MetricsFileWriter:
+    """
+    Rewrites a metrics file (Prometheus text format, usable by node_exporter's textfile collector) every
+    `interval` seconds and once more on `stop`. Optionally prints a one-line progress summary each time.
+    """
+
+    def __init__(self, metrics: RunMetrics, file_path: str, interval: float = 5.0, progress: bool = False):
+        self.metrics = metrics
+        self.file_path = file_path
+        self.interval = interval
+        self.progress = progress
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "MetricsFileWriter":
+        os.makedirs(os.path.dirname(os.path.abspath(self.file_path)), exist_ok=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+
+    def flush(self) -> None:
+        tmp_path = f"{self.file_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.metrics.render())
+        os.replace(tmp_path, self.file_path)
+        if self.progress:
+            print(self.metrics.progress())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+
+class MetricsServer:
+    """
+    Serves `RunMetrics` at http://<host>:<port>/metrics for Prometheus to scrape. Listens on localhost only
+    unless another `host` (e.g. "0.0.0.0" for a scraper in another container) is given.
+    """
+
+    def __init__(self, metrics: RunMetrics, port: int, host: str = "127.0.0.1"):
+        self.metrics = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.rstrip("/") not in ("", "/metrics"):
+                    handler.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                handler.send_response(200)
+                handler.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> "MetricsServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,195 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from graph_agents_benchmark.src.settings import RESULTS_DIR, ROOT_DIR
+from graph_agents_benchmark.src.utils.hashing import file_sha256
+
+RUNS_DIR = os.path.join(RESULTS_DIR, "runs")
+
+# Metrics compared between runs: name -> (result field, statistic, higher is better).
+METRICS: Dict[str, Tuple[str, Callable, bool]] = {
+    "avg_time": ("time_taken", np.mean, False),
+    "p50_time": ("time_taken", lambda values: np.percentile(values, 50), False),
+    "p95_time": ("time_taken", lambda values: np.percentile(values, 95), False),
+    "accuracy": ("accuracy", np.mean, True),
+    "bleu": ("blue_score", np.mean, True),
+}
+
+
+def git_revision() -> Dict[str, Any]:
+    """
+    Commit SHA of the working tree and whether it has uncommitted changes; None values outside a git checkout.
+    """
+    try:
+        sha = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True,
+                             check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {"git_sha": None, "git_dirty": None}
+    return {"git_sha": sha, "git_dirty": bool(status.strip())}
+
+
+def file_hash(file_path: Optional[str]) -> Optional[str]:
+    if not file_path or not os.path.exists(file_path):
+        return None
+    return file_sha256(file_path)
+
+
+class RunStore:
+    """
+    Keeps every benchmark run instead of overwriting the previous one.
+
+    Each run is a directory `<root>/<solution>/<run id>/` holding `results.json`, `metadata.json` (git SHA, model,
+    dataset hash, concurrency, ...) and any extra reports. Run ids sort chronologically.
+    """
+
+    def __init__(self, root: str = RUNS_DIR):
+        self.root = root
+
+    def save(self, solution: str, results: List[Dict[str, Any]], metadata: Dict[str, Any],
+             reports: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Stores a run and returns its directory.
+        """
+        created_at = datetime.now(timezone.utc)
+        revision = git_revision()
+        run_id = created_at.strftime("%Y%m%dT%H%M%S%fZ")
+        if revision["git_sha"]:
+            run_id += f"-{revision['git_sha'][:8]}"
+
+        run_dir = os.path.join(self.root, solution, run_id)
+        os.makedirs(run_dir)
+        metadata = {
+            "run_id": run_id,
+            "solution": solution,
+            "created_at": created_at.isoformat(),
+            **revision,
+            "dataset_hash": file_hash(metadata.get("dataset")),
+            "questions": len(results),
+            "argv": sys.argv,
+            "hostname": platform.node(),
+            "python": platform.python_version(),
+            **metadata,
+        }
+        with open(os.path.join(run_dir, "metadata.json"), "w") as f:
+            json.dump(metadata, f, indent=4)
+        with open(os.path.join(run_dir, "results.json"), "w") as f:
+            json.dump(results, f, indent=4)
+        for name, report in (reports or {}).items():
+            with open(os.path.join(run_dir, f"{name}.json"), "w") as f:
+                json.dump(report, f, indent=4)
+        return run_dir
+
+    def runs(self, solution: Optional[str] = None) -> List[str]:
+        """
+        Run directories, oldest first, optionally of one solution only.
+        """
+        if not os.path.isdir(self.root):
+            return []
+        solutions = [solution] if solution else sorted(os.listdir(self.root))
+        run_dirs = []
+        for name in solutions:
+            solution_dir = os.path.join(self.root, name)
+            if os.path.isdir(solution_dir):
+                run_dirs.extend(os.path.join(solution_dir, run_id) for run_id in os.listdir(solution_dir))
+        return sorted(run_dirs, key=os.path.basename)
+
+    def resolve(self, ref: str, solution: Optional[str] = None) -> str:
+        """
+        Resolves a run directory, run id (or unique prefix), "latest" or "previous" to a run directory.
+
+        Raises:
+            ValueError: If no or more than one run matches.
+        """
+        if os.path.isfile(os.path.join(ref, "results.json")):
+            return ref
+        runs = self.runs(solution)
+        if ref in ("latest", "previous"):
+            position = -1 if ref == "latest" else -2
+            if len(runs) < -position:
+                raise ValueError(f"Not enough stored runs to resolve '{ref}'")
+            return runs[position]
+        matches = [run_dir for run_dir in runs if os.path.basename(run_dir).startswith(ref)]
+        if len(matches) != 1:
+            raise ValueError(f"Run '{ref}' matches {len(matches)} stored runs")
+        return matches[0]
+
+    @staticmethod
+    def load(run_dir: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        with open(os.path.join(run_dir, "results.json")) as f:
+            results = json.load(f)
+        metadata_path = os.path.join(run_dir, "metadata.json")
+        metadata = {}
+        if os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+        return results, metadata
+
+
+def bootstrap_delta(baseline: np.ndarray, candidate: np.ndarray, statistic: Callable, resamples: int = 2000,
+                    confidence: float = 0.95, seed: int = 0, chunk_size: int = 100) -> Tuple[float, float, float]:
+    """
+    Difference `statistic(candidate) - statistic(baseline)` with a percentile bootstrap confidence interval.
+    Both runs are resampled independently, so they do not need to contain the same questions.
+    """
+    rng = np.random.default_rng(seed)
+    deltas = []
+    for start in range(0, resamples, chunk_size):
+        size = min(chunk_size, resamples - start)
+        baseline_samples = baseline[rng.integers(0, len(baseline), (size, len(baseline)))]
+        candidate_samples = candidate[rng.integers(0, len(candidate), (size, len(candidate)))]
+        deltas.extend(
+            statistic(c) - statistic(b) for b, c in zip(baseline_samples, candidate_samples)
+        )
+    alpha = (1 - confidence) / 2
+    low, high = np.percentile(deltas, [100 * alpha, 100 * (1 - alpha)])
+    return float(statistic(candidate) - statistic(baseline)), float(low), float(high)
+
+
+def compare_runs(baseline: List[Dict[str, Any]], candidate: List[Dict[str, Any]], resamples: int = 2000,
+                 confidence: float = 0.95, latency_tolerance: float = 0.05, accuracy_tolerance: float = 0.0,
+                 seed: int = 0) -> Dict[str, Any]:
+    """
+    Latency and accuracy deltas of `candidate` against `baseline` with bootstrap confidence intervals.
+
+    A metric regressed when its whole confidence interval lies on the worse side beyond the tolerance: latency
+    metrics by more than `latency_tolerance` of the baseline value, quality metrics by more than the absolute
+    `accuracy_tolerance`.
+    """
+    comparison = {"confidence": confidence, "resamples": resamples, "metrics": {}, "regressions": []}
+    if not baseline or not candidate:
+        return comparison
+
+    for name, (field, statistic, higher_is_better) in METRICS.items():
+        baseline_values = np.array([r[field] for r in baseline], dtype=float)
+        candidate_values = np.array([r[field] for r in candidate], dtype=float)
+        delta, low, high = bootstrap_delta(baseline_values, candidate_values, statistic, resamples, confidence, seed)
+        baseline_value = float(statistic(baseline_values))
+        if higher_is_better:
+            regressed = high < -accuracy_tolerance
+            improved = low > accuracy_tolerance
+        else:
+            margin = latency_tolerance * baseline_value
+            regressed = low > margin
+            improved = high < -margin
+        comparison["metrics"][name] = {
+            "baseline": baseline_value,
+            "candidate": float(statistic(candidate_values)),
+            "delta": delta,
+            "relative_delta": delta / baseline_value if baseline_value else None,
+            "ci_low": low,
+            "ci_high": high,
+            "regressed": bool(regressed),
+            "improved": bool(improved),
+        }
+        if regressed:
+            comparison["regressions"].append(name)
+    return comparison
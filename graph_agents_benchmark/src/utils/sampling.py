@@ -0,0 +1,230 @@
+import hashlib
+import json
+import math
+import os
+import re
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from graph_agents_benchmark.src.utils.data_loaders import FsDataLoader
+from graph_agents_benchmark.src.utils.hashing import file_sha256
+
+# Bump when stratum keys change to invalidate stored indexes.
+STRATA_VERSION = 1
+STRATA_DIR = "strata"
+
+# A relationship pattern between two nodes: `)-[...]->(`, `)<--(`, `)--(`; the bracket is captured for `*min..max`.
+RELATIONSHIP = re.compile(r"\)\s*<?-\s*(\[[^\]]*\])?\s*->?\s*\(")
+VARIABLE_LENGTH = re.compile(r"\*\s*(\d*)\s*(?:\.\.\s*(\d*))?")
+AGGREGATION = re.compile(
+    r"\b(count|sum|avg|min|max|collect|stdev|stdevp|percentilecont|percentiledisc)\s*\(", re.IGNORECASE
+)
+ANSWER_SIZES = ((0, "0"), (1, "1"), (10, "2-10"), (100, "11-100"))
+METRICS = ("time_taken", "accuracy", "blue_score")
+Z_95 = 1.959963984540054
+
+
+def _question_key(question: str) -> str:
+    return hashlib.blake2b(" ".join(question.split()).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def query_complexity(cypher: Optional[str]) -> Tuple[int, int]:
+    """
+    Relationship hops and aggregation calls of a Cypher query. A variable-length pattern counts its upper bound
+    (its lower bound, or 3 when unbounded).
+    """
+    if not cypher:
+        return 0, 0
+    cypher = cypher.replace("\\n", "\n")
+    hops = 0
+    for match in RELATIONSHIP.finditer(cypher):
+        length = VARIABLE_LENGTH.search(match.group(1) or "")
+        if length is None:
+            hops += 1
+        elif length.group(2):
+            hops += int(length.group(2))  # *min..max
+        elif length.group(1) and length.group(2) is None:
+            hops += int(length.group(1))  # *n
+        else:
+            hops += 3  # *, *min.. or *..
+    return hops, len(AGGREGATION.findall(cypher))
+
+
+def answer_size(answer: Any) -> int:
+    """
+    Number of records of a gold answer: JSON lines of a string answer, or the length of a list answer.
+    """
+    if answer is None:
+        return 0
+    if isinstance(answer, (list, tuple)):
+        return len(answer)
+    return sum(1 for line in str(answer).splitlines() if line.strip())
+
+
+def stratum_of(row: Dict[str, Any]) -> str:
+    """
+    Stratum key of a dataset row, e.g. "movies/hops=2/aggs=1/rows=2-10".
+    """
+    hops, aggregations = query_complexity(row.get("cypher"))
+    size = answer_size(row.get("answer"))
+    rows = next((label for bound, label in ANSWER_SIZES if size <= bound), ">100")
+    return f"{row.get('database') or 'unknown'}/hops={min(hops, 3)}/aggs={min(aggregations, 2)}/rows={rows}"
+
+
+class StratumIndex:
+    """
+    Positions of a dataset's questions grouped by stratum: database, query complexity (hops and aggregations of
+    the gold Cypher, capped at 3 and 2) and answer size bucket.
+
+    Positions count the rows `FsDataLoader.iter_qa` yields, so a sample streams through the file without loading
+    it. The index is stored next to the dataset under `strata/` and rebuilt when the file's SHA-256 changes.
+    """
+
+    def __init__(self, dataset_path: str, strata: Dict[str, Dict[str, List]]):
+        self.dataset_path = dataset_path
+        self.strata = strata
+
+    def __len__(self) -> int:
+        return sum(len(stratum["positions"]) for stratum in self.strata.values())
+
+    @staticmethod
+    def build(dataset_path: str) -> "StratumIndex":
+        loader = FsDataLoader(dataset_path, file_type=FsDataLoader.infer_file_type(dataset_path))
+        strata: Dict[str, Dict[str, List]] = {}
+        for position, (question, answer, metadata) in enumerate(
+                loader.iter_qa(metadata_columns=["database", "cypher"])):
+            stratum = strata.setdefault(stratum_of({**metadata, "answer": answer}), {"positions": [], "keys": []})
+            stratum["positions"].append(position)
+            stratum["keys"].append(_question_key(question))
+        return StratumIndex(dataset_path, dict(sorted(strata.items())))
+
+    @staticmethod
+    def load_or_build(dataset_path: str, index_root: Optional[str] = None) -> "StratumIndex":
+        """
+        Loads the stratum index of `dataset_path`, (re)building it when missing or stale.
+        """
+        index_root = index_root or os.path.join(os.path.dirname(os.path.abspath(dataset_path)), STRATA_DIR)
+        index_path = os.path.join(index_root, f"{os.path.basename(dataset_path)}.json")
+        source_sha256 = file_sha256(dataset_path)
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                stored = json.load(f)
+            if stored.get("source_sha256") == source_sha256 and stored.get("version") == STRATA_VERSION:
+                return StratumIndex(dataset_path, stored["strata"])
+
+        print(f"Building stratum index for [{dataset_path}]...")
+        index = StratumIndex.build(dataset_path)
+        os.makedirs(index_root, exist_ok=True)
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": STRATA_VERSION, "source_sha256": source_sha256, "strata": index.strata}, f)
+        os.replace(tmp_path, index_path)
+        return index
+
+    def sample(self, fraction: float, seed: int = 0, min_per_stratum: int = 1) -> Dict[int, str]:
+        """
+        Deterministic stratified sample of about `fraction` of the questions.
+
+        The sample size is split across strata proportionally to their size (largest remainder), with at least
+        `min_per_stratum` questions per stratum, so every stratum is represented; the questions the minimums add
+        are taken from the largest strata. Only when the minimums alone exceed the sample size is it larger than
+        `fraction`; `report` gives the effective fraction. Within a stratum the questions with the smallest seeded
+        hash are taken first, so a sample is stable across runs and machines.
+
+        Returns:
+            Dict[int, str]: The stratum of every sampled position.
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError(f"Invalid sample fraction {fraction}, expected (0, 1]")
+        total = len(self)
+        shares = {key: fraction * len(stratum["positions"]) for key, stratum in self.strata.items()}
+        counts = {key: min(len(self.strata[key]["positions"]), max(min_per_stratum, math.floor(share)))
+                  for key, share in shares.items()}
+        remaining = max(0, round(fraction * total)) - sum(counts.values())
+        # Questions the minimums added to small strata are taken from the strata furthest above their share.
+        while remaining < 0:
+            reducible = [key for key in counts if counts[key] > min_per_stratum]
+            if not reducible:
+                break
+            key = max(reducible, key=lambda key: (counts[key] - shares[key], key))
+            counts[key] -= 1
+            remaining += 1
+        for key in sorted(shares, key=lambda key: (-(shares[key] - math.floor(shares[key])), key)):
+            if remaining <= 0:
+                break
+            if counts[key] < len(self.strata[key]["positions"]):
+                counts[key] += 1
+                remaining -= 1
+
+        sampled = {}
+        for key, stratum in self.strata.items():
+            ranked = sorted(
+                zip(stratum["positions"], stratum["keys"]),
+                key=lambda item: hashlib.blake2b(f"{seed}:{item[1]}".encode("utf-8"), digest_size=8).digest(),
+            )
+            for position, _ in ranked[:counts[key]]:
+                sampled[position] = key
+        return sampled
+
+    def report(self, results: List[Dict[str, Any]], fraction: float, seed: int) -> Dict[str, Any]:
+        """
+        Stratified estimates of the population means of a sampled run's time, accuracy and BLEU score with 95%
+        confidence intervals (normal approximation with finite population correction). Strata with a single
+        sampled question borrow the pooled sample variance.
+        """
+        population = len(self)
+        by_stratum: Dict[str, List[Dict[str, Any]]] = {}
+        for row in results:
+            stratum = (row.get("metadata") or {}).get("stratum")
+            if stratum in self.strata:
+                by_stratum.setdefault(stratum, []).append(row)
+
+        report: Dict[str, Any] = {
+            "dataset": self.dataset_path,
+            "fraction": fraction,
+            "effective_fraction": sum(len(rows) for rows in by_stratum.values()) / population if population else 0.0,
+            "seed": seed,
+            "population": population,
+            "sample_size": sum(len(rows) for rows in by_stratum.values()),
+            "strata": len(self.strata),
+            "strata_sampled": len(by_stratum),
+        }
+        # Strata without results (e.g. cut by --limit) are left out; their weight is reported as uncovered.
+        covered = sum(len(self.strata[key]["positions"]) for key in by_stratum)
+        report["population_covered"] = covered / population if population else 0.0
+        for metric in METRICS:
+            values = {key: np.array([row[metric] for row in rows], dtype=float) for key, rows in by_stratum.items()}
+            if not values or not covered:
+                report[metric] = None
+                continue
+            pooled = np.concatenate(list(values.values()))
+            pooled_variance = float(pooled.var(ddof=1)) if len(pooled) > 1 else 0.0
+            mean = 0.0
+            variance = 0.0
+            for key, sample in values.items():
+                size = len(self.strata[key]["positions"])
+                weight = size / covered
+                stratum_variance = float(sample.var(ddof=1)) if len(sample) > 1 else pooled_variance
+                mean += weight * float(sample.mean())
+                variance += weight ** 2 * (1 - len(sample) / size) * stratum_variance / len(sample)
+            stderr = math.sqrt(variance)
+            report[metric] = {
+                "mean": mean,
+                "stderr": stderr,
+                "ci95_low": mean - Z_95 * stderr,
+                "ci95_high": mean + Z_95 * stderr,
+            }
+        return report
+
+
+def filter_sample(rows: Iterable[Tuple], sampled: Dict[int, str]) -> Iterator[Tuple]:
+    """
+    Lazily keeps the sampled (question, answer, metadata) rows of an `iter_qa` stream, adding their stratum to the
+    metadata. Stops reading once the last sampled position was reached.
+    """
+    last = max(sampled, default=-1)
+    for position, (question, answer, metadata) in enumerate(islice(rows, last + 1)):
+        if position in sampled:
+            yield question, answer, {**metadata, "stratum": sampled[position]}
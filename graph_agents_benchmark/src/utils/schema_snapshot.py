@@ -0,0 +1,276 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from graph_agents_benchmark.src.settings import OUTPUT_DIR, ROOT_DIR
+from graph_agents_benchmark.src.utils.dataset_manifest import DatasetManifest
+
+SCHEMA_DIR = os.path.join(OUTPUT_DIR, "schema_snapshots")
+DUMPS_DIR = os.path.join(ROOT_DIR, "neo4j", "dumps")
+
+# Written into the database under test by the benchmark itself (VectorRagSolution's embedding nodes); left out of
+# every schema a solution is shown.
+EMBEDDING_LABEL = "BenchmarkEmbedding"
+EMBEDS_RELATIONSHIP = "EMBEDS"
+BENCHMARK_LABELS = frozenset({EMBEDDING_LABEL})
+BENCHMARK_RELATIONSHIP_TYPES = frozenset({EMBEDS_RELATIONSHIP})
+# Property keys of the embedding nodes. Key tokens outlive the nodes using them, so these are dropped unless a graph
+# label or relationship type uses them too.
+BENCHMARK_PROPERTY_KEYS = frozenset({"embedding", "text", "model"})
+
+# db.schema.*TypeProperties type names -> the type names of LangChain's Neo4jGraph schema.
+PROPERTY_TYPES = {
+    "String": "STRING",
+    "Long": "INTEGER",
+    "Integer": "INTEGER",
+    "Double": "FLOAT",
+    "Float": "FLOAT",
+    "Boolean": "BOOLEAN",
+    "Date": "DATE",
+    "DateTime": "DATE_TIME",
+    "LocalDateTime": "LOCAL_DATE_TIME",
+    "Time": "TIME",
+    "LocalTime": "LOCAL_TIME",
+    "Duration": "DURATION",
+    "Point": "POINT",
+}
+
+
+def _property_type(types: Optional[List[str]]) -> str:
+    if not types:
+        return "STRING"
+    kind = types[0]
+    return "LIST" if kind.endswith("Array") else PROPERTY_TYPES.get(kind, kind.upper())
+
+
+def _quote(name: str) -> str:
+    return f"`{name.replace('`', '``')}`"
+
+
+def _is_benchmark_pattern(relationship: Dict[str, str]) -> bool:
+    return (relationship.get("type") in BENCHMARK_RELATIONSHIP_TYPES
+            or relationship.get("start") in BENCHMARK_LABELS or relationship.get("end") in BENCHMARK_LABELS)
+
+
+def without_benchmark_objects(structured_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A `Neo4jGraph.structured_schema` without the labels and relationship types the benchmark writes.
+    """
+    return {
+        **structured_schema,
+        "node_props": {label: properties for label, properties in structured_schema.get("node_props", {}).items()
+                       if label not in BENCHMARK_LABELS},
+        "rel_props": {rel_type: properties for rel_type, properties in structured_schema.get("rel_props", {}).items()
+                      if rel_type not in BENCHMARK_RELATIONSHIP_TYPES},
+        "relationships": [relationship for relationship in structured_schema.get("relationships", [])
+                          if not _is_benchmark_pattern(relationship)],
+    }
+
+
+def schema_text(structured_schema: Dict[str, Any]) -> str:
+    """
+    Renders a `Neo4jGraph.structured_schema` in the `Neo4jGraph.schema` text format.
+    """
+    def properties_text(properties: List[Dict[str, str]]) -> str:
+        return ", ".join(f"{prop['property']}: {prop['type']}" for prop in properties)
+
+    node_props = [f"{label} {{{properties_text(properties)}}}"
+                  for label, properties in structured_schema.get("node_props", {}).items() if properties]
+    rel_props = [f"{rel_type} {{{properties_text(properties)}}}"
+                 for rel_type, properties in structured_schema.get("rel_props", {}).items() if properties]
+    patterns = [f"(:{r['start']})-[:{r['type']}]->(:{r['end']})" for r in structured_schema.get("relationships", [])]
+    return "\n".join([
+        "Node properties:", *node_props,
+        "Relationship properties:", *rel_props,
+        "The relationships:", *patterns,
+    ])
+
+
+class SchemaSnapshot(BaseModel):
+    """
+    Labels, relationship types, their properties and counts, and relationship patterns of one database.
+
+    Renders to the schema text and structured schema of LangChain's `Neo4jGraph`, so solutions can be initialized
+    from a snapshot instead of running APOC/schema introspection.
+    """
+
+    database: Optional[str] = None
+    fingerprint: Optional[str] = None
+    captured_at: Optional[str] = None
+    capture_time: Optional[float] = None
+    node_labels: Dict[str, Dict[str, Any]] = {}
+    relationship_types: Dict[str, Dict[str, Any]] = {}
+    relationships: List[Dict[str, str]] = []
+    property_keys: List[str] = []
+
+    @staticmethod
+    def capture(driver, database: Optional[str] = None, fingerprint: Optional[str] = None,
+                sample_size: int = 1000) -> "SchemaSnapshot":
+        """
+        Introspects the database with built-in procedures (no APOC). Counts come from the count store;
+        relationship patterns are sampled from up to `sample_size` relationships per type. The benchmark's own
+        embedding nodes and relationships are left out, and so are property keys only they use.
+        """
+        start_time = time.time()
+        node_labels: Dict[str, Dict[str, Any]] = {}
+        relationship_types: Dict[str, Dict[str, Any]] = {}
+        relationships = []
+        with driver.session(database=database) as session:
+            for row in session.run("CALL db.schema.nodeTypeProperties()").data():
+                for label in row.get("nodeLabels") or []:
+                    if label in BENCHMARK_LABELS:
+                        continue
+                    properties = node_labels.setdefault(label, {"count": 0, "properties": {}})["properties"]
+                    if row.get("propertyName"):
+                        properties[row["propertyName"]] = _property_type(row.get("propertyTypes"))
+            for row in session.run("CALL db.schema.relTypeProperties()").data():
+                if not row.get("relType"):
+                    continue
+                rel_type = re.sub(r"^:`?|`$", "", row["relType"])
+                if rel_type in BENCHMARK_RELATIONSHIP_TYPES:
+                    continue
+                properties = relationship_types.setdefault(rel_type, {"count": 0, "properties": {}})["properties"]
+                if row.get("propertyName"):
+                    properties[row["propertyName"]] = _property_type(row.get("propertyTypes"))
+
+            for label, info in node_labels.items():
+                info["count"] = session.run(f"MATCH (n:{_quote(label)}) RETURN count(n) AS count").single()["count"]
+            for rel_type, info in relationship_types.items():
+                info["count"] = session.run(
+                    f"MATCH ()-[r:{_quote(rel_type)}]->() RETURN count(r) AS count"
+                ).single()["count"]
+                rows = session.run(
+                    f"MATCH (a)-[r:{_quote(rel_type)}]->(b) WITH a, b LIMIT $sample_size "
+                    f"UNWIND labels(a) AS start UNWIND labels(b) AS end RETURN DISTINCT start, end",
+                    sample_size=sample_size,
+                ).data()
+                relationships.extend(
+                    {"start": row["start"], "type": rel_type, "end": row["end"]}
+                    for row in rows if row.get("start") and row.get("end")
+                    and not _is_benchmark_pattern({"start": row["start"], "end": row["end"]})
+                )
+            used_keys = {name for info in [*node_labels.values(), *relationship_types.values()]
+                         for name in info["properties"]}
+            property_keys = [row["propertyKey"] for row in session.run("CALL db.propertyKeys()").data()
+                             if row.get("propertyKey")
+                             and (row["propertyKey"] in used_keys or row["propertyKey"] not in BENCHMARK_PROPERTY_KEYS)]
+
+        return SchemaSnapshot(
+            database=database,
+            fingerprint=fingerprint,
+            captured_at=datetime.now(timezone.utc).isoformat(),
+            capture_time=time.time() - start_time,
+            node_labels=node_labels,
+            relationship_types=relationship_types,
+            relationships=relationships,
+            property_keys=sorted(property_keys),
+        )
+
+    def structured_schema(self) -> Dict[str, Any]:
+        """
+        The snapshot in the `Neo4jGraph.structured_schema` format, without benchmark objects even when the snapshot
+        was stored before they were filtered out on capture.
+        """
+        return without_benchmark_objects({
+            "node_props": {
+                label: [{"property": name, "type": kind} for name, kind in info["properties"].items()]
+                for label, info in self.node_labels.items()
+            },
+            "rel_props": {
+                rel_type: [{"property": name, "type": kind} for name, kind in info["properties"].items()]
+                for rel_type, info in self.relationship_types.items()
+            },
+            "relationships": list(self.relationships),
+            "metadata": {"constraint": [], "index": []},
+        })
+
+    def to_text(self) -> str:
+        """
+        The snapshot in the `Neo4jGraph.schema` text format.
+        """
+        return schema_text(self.structured_schema())
+
+
+class SchemaStore:
+    """
+    On-disk schema snapshots under `<root>/<database>/<fingerprint>.json`.
+
+    The fingerprint is the SHA-256 of the database's dump when it is known, so a snapshot is captured once per dump
+    and reused by every later run. Without a dump a cheap live fingerprint (labels, relationship types, property
+    keys and node/relationship counts) is used instead.
+    """
+
+    def __init__(self, root: str = SCHEMA_DIR):
+        self.root = root
+        self._dumps = DatasetManifest.load(os.path.join(root, "dumps.json"))
+        self._lock = threading.Lock()
+
+    def dump_fingerprint(self, dump: str) -> Optional[str]:
+        """
+        SHA-256 of a dump given by path or by name in `neo4j/dumps`; hashes are cached by size and mtime.
+        """
+        dump_path = dump if os.path.exists(dump) else os.path.join(DUMPS_DIR, f"{dump}.dump")
+        fingerprint = self._dumps.dump_fingerprint(dump_path)
+        if fingerprint is not None:
+            with self._lock:
+                self._dumps.save()
+        return fingerprint
+
+    @staticmethod
+    def live_fingerprint(driver, database: Optional[str] = None) -> str:
+        """
+        Hash of the database's labels, relationship types, property keys and counts, ignoring the benchmark's own
+        embedding nodes so building or dropping the vector index keeps the fingerprint.
+        """
+        with driver.session(database=database) as session:
+            def count(query: str) -> int:
+                return session.run(query).single()["count"]
+
+            state = {
+                "labels": sorted(set(session.run("CALL db.labels()").value()) - BENCHMARK_LABELS),
+                "types": sorted(set(session.run("CALL db.relationshipTypes()").value()) - BENCHMARK_RELATIONSHIP_TYPES),
+                "keys": sorted(set(session.run("CALL db.propertyKeys()").value()) - BENCHMARK_PROPERTY_KEYS),
+                # Total minus benchmark counts, both answered from the count store.
+                "nodes": count("MATCH (n) RETURN count(n) AS count") - sum(
+                    count(f"MATCH (n:{_quote(label)}) RETURN count(n) AS count") for label in BENCHMARK_LABELS
+                ),
+                "relationships": count("MATCH ()-[r]->() RETURN count(r) AS count") - sum(
+                    count(f"MATCH ()-[r:{_quote(rel_type)}]->() RETURN count(r) AS count")
+                    for rel_type in BENCHMARK_RELATIONSHIP_TYPES
+                ),
+            }
+        digest = hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return f"live-{digest[:16]}"
+
+    def path(self, database: Optional[str], fingerprint: str) -> str:
+        return os.path.join(self.root, re.sub(r"[^\w.-]+", "_", database or "default"), f"{fingerprint}.json")
+
+    def load_or_capture(self, driver, database: Optional[str] = None, dump: Optional[str] = None,
+                        refresh: bool = False) -> Tuple[SchemaSnapshot, bool]:
+        """
+        Returns the stored snapshot of the database, capturing and storing it when missing or `refresh` is set.
+
+        Returns:
+            Tuple[SchemaSnapshot, bool]: The snapshot and whether it was loaded from disk.
+        """
+        fingerprint = self.dump_fingerprint(dump) if dump else None
+        fingerprint = fingerprint or SchemaStore.live_fingerprint(driver, database)
+        path = self.path(database, fingerprint)
+        if os.path.exists(path) and not refresh:
+            with open(path) as f:
+                return SchemaSnapshot(**json.load(f)), True
+
+        snapshot = SchemaSnapshot.capture(driver, database, fingerprint)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot.model_dump(), f, indent=4)
+        os.replace(tmp_path, path)
+        return snapshot, False
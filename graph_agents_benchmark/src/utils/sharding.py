@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+SHARD_FILE_PATTERN = re.compile(r"\.shard-(\d+)-of-(\d+)\.json$")
+PERCENTILES = (50, 90, 95, 99)
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parses an "i/N" shard spec (0-based index) into (index, count).
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", spec)
+    if match is None:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N (e.g. 0/4)")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{spec}', index must be in [0, {count - 1}]")
+    return index, count
+
+
+def shard_of(question: str, count: int) -> int:
+    """
+    Stable shard of a question. Hashes the whitespace-normalized text, so every machine agrees on the split
+    and repeated questions always land in the same shard.
+    """
+    key = " ".join(question.split()).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big") % count
+
+
+def filter_shard(rows: Iterable[Tuple], index: int, count: int) -> Iterator[Tuple]:
+    """
+    Lazily keeps the (question, answer[, metadata]) rows that belong to shard `index` of `count`.
+    """
+    for row in rows:
+        if shard_of(row[0], count) == index:
+            yield row
+
+
+def shard_file_name(file_name: str, index: int, count: int) -> str:
+    """
+    Per-shard variant of a results file name, e.g. fake_benchmark_results.shard-0-of-4.json.
+    """
+    root, _ = os.path.splitext(file_name)
+    return f"{root}.shard-{index}-of-{count}.json"
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate metrics of a result list. Percentiles are computed over the raw per-question times,
+    never by combining per-shard percentiles.
+    """
+    if not results:
+        return {"questions": 0}
+    times = np.array([r["time_taken"] for r in results], dtype=float)
+    summary = {
+        "questions": len(results),
+        "avg_time": float(times.mean()),
+        "total_time": float(times.sum()),
+        "avg_accuracy": sum(r["accuracy"] for r in results) / len(results),
+        "avg_bleu": sum(r["blue_score"] for r in results) / len(results),
+    }
+    for p, value in zip(PERCENTILES, np.percentile(times, PERCENTILES)):
+        summary[f"p{p}_time"] = float(value)
+    return summary
+
+
+def merge_shards(file_paths: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Combines per-shard result files into one result list and a global report.
+
+    Raises:
+        ValueError: If the files disagree on the shard count or a shard appears twice.
+    """
+    shards: Dict[int, str] = {}
+    counts = set()
+    for file_path in file_paths:
+        match = SHARD_FILE_PATTERN.search(file_path)
+        if match is None:
+            raise ValueError(f"Not a shard result file: {file_path}")
+        index, count = int(match.group(1)), int(match.group(2))
+        if index in shards:
+            raise ValueError(f"Shard {index} given twice: {shards[index]}, {file_path}")
+        shards[index] = file_path
+        counts.add(count)
+    if len(counts) > 1:
+        raise ValueError(f"Shard files come from different splits: {sorted(counts)}")
+
+    count = counts.pop() if counts else 0
+    results = []
+    shard_summaries = {}
+    for index in sorted(shards):
+        with open(shards[index]) as f:
+            shard_results = json.load(f)
+        shard_summaries[str(index)] = summarize(shard_results)
+        results.extend(shard_results)
+
+    report = summarize(results)
+    report["shard_count"] = count
+    report["missing_shards"] = [i for i in range(count) if i not in shards]
+    report["shards"] = shard_summaries
+    return results, report
@@ -0,0 +1,240 @@
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from graph_agents_benchmark.src.llm.embedding_pipeline import EmbeddingPipeline
+from graph_agents_benchmark.src.llm.embeddings import embedding_model_name
+
+# String literals and numbers of a Cypher query. Numbers inside variable-length patterns (`*1..3`) are skipped.
+CYPHER_LITERAL = re.compile(
+    r"'((?:[^'\\]|\\.)*)'|\"((?:[^\"\\]|\\.)*)\"|(?<![\w.*$])(-?\d+(?:\.\d+)?)(?![\w.])"
+)
+SLOT = re.compile(r"\{(slot\d+)\}")
+TOKEN = re.compile(r"\w+")
+TRAILING_PUNCTUATION = "?.! "
+
+
+def _normalize_question(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+def _tokens(text: str) -> set:
+    return set(TOKEN.findall(text.lower()))
+
+
+class QueryTemplate:
+    """
+    A parameterized Cypher query with the question patterns it was learned from.
+
+    Patterns are source questions whose slot values were replaced with `{slotN}`; the Cypher refers to them as
+    `$slotN` parameters.
+    """
+
+    def __init__(self, template_id: str, database: Optional[str], cypher: str, slots: Dict[str, str]):
+        self.template_id = template_id
+        self.database = database
+        self.cypher = cypher
+        self.slots = slots
+        self.patterns: List[Dict[str, Any]] = []
+
+    def add_pattern(self, question: str, pattern: str, values: Dict[str, str]) -> None:
+        literal = pattern.strip(TRAILING_PUNCTUATION)
+        parts = []
+        position = 0
+        for match in SLOT.finditer(literal):
+            prefix = literal[position:match.start()]
+            parts.append(r"\s+".join(re.escape(part) for part in re.split(r"\s+", prefix)))
+            name = match.group(1)
+            if self.slots[name] == "int":
+                parts.append(rf"(?P<{name}>-?\d+)")
+            elif self.slots[name] == "float":
+                parts.append(rf"(?P<{name}>-?\d+(?:\.\d+)?)")
+            elif prefix.endswith(("'", '"')):
+                parts.append(rf"(?P<{name}>[^'\"]+?)")
+            else:
+                # Unquoted values may span at most a few more words than the learned one.
+                words = len(values[name].split()) + 2
+                parts.append(rf"(?P<{name}>\S+(?:\s+\S+){{0,{words - 1}}}?)")
+            position = match.end()
+        parts.append(r"\s+".join(re.escape(part) for part in re.split(r"\s+", literal[position:])))
+        self.patterns.append({
+            "question": question,
+            "pattern": pattern,
+            "regex": re.compile("".join(parts), re.IGNORECASE),
+            "tokens": _tokens(SLOT.sub(" ", pattern)),
+        })
+
+    @property
+    def support(self) -> int:
+        return len({_normalize_question(p["question"]) for p in self.patterns})
+
+    def fill(self, match: re.Match) -> Dict[str, Any]:
+        """
+        Cypher parameters of a pattern match, with numeric slots converted to numbers.
+        """
+        params = {}
+        for name, kind in self.slots.items():
+            value = match.group(name)
+            params[name] = int(value) if kind == "int" else float(value) if kind == "float" else value.strip()
+        return params
+
+
+class TemplateIndex:
+    """
+    Parameterized Cypher templates learned from an enriched dataset, with a fast question classifier.
+
+    A literal of a gold Cypher query becomes a slot when its value also appears in the question; examples whose
+    Cypher is identical after that substitution share a template. Only templates learned from at least
+    `min_support` distinct questions are kept.
+
+    A question is classified by cosine similarity to the source questions (embedding classifier) or by token
+    overlap with the pattern text (lexical classifier, when no embedding model is given). The `top_k` closest
+    patterns are then matched against the question in order; the first match fills the slots, with the
+    similarity as confidence.
+    """
+
+    def __init__(self, templates: List[QueryTemplate], embed_model=None, top_k: int = 10):
+        self.templates = templates
+        self.top_k = top_k
+        self._patterns: List[Tuple[QueryTemplate, Dict[str, Any]]] = [
+            (template, pattern) for template in templates for pattern in template.patterns
+        ]
+        self._excluded: Dict[str, List[int]] = {}
+        for position, (_, pattern) in enumerate(self._patterns):
+            self._excluded.setdefault(_normalize_question(pattern["question"]), []).append(position)
+
+        self.embed_model = None
+        self._vectors = None
+        if embed_model is not None and self._patterns:
+            if not isinstance(embed_model, EmbeddingPipeline):
+                embed_model = EmbeddingPipeline(embed_model, embedding_model_name(embed_model, default=""),
+                                                cache_dir=None)
+            self.embed_model = embed_model
+            matrix = embed_model.embed([pattern["question"] for _, pattern in self._patterns])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._vectors = matrix / np.where(norms == 0, 1, norms)
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    @property
+    def classifier(self) -> str:
+        return "embedding" if self._vectors is not None else "lexical"
+
+    @staticmethod
+    def learn(dataset_path: str, min_support: int = 2) -> List[QueryTemplate]:
+        """
+        Learns the templates of an enriched dataset file (rows with "question" and "cypher").
+        """
+        templates: Dict[Tuple[Optional[str], str], QueryTemplate] = {}
+        with open(dataset_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if not row.get("question") or not row.get("cypher"):
+                    continue
+                learned = TemplateIndex.parameterize(row["question"], row["cypher"].replace("\\n", "\n"))
+                cypher, slots, pattern, values = learned
+                key = (row.get("database"), " ".join(cypher.split()))
+                if key not in templates:
+                    template_id = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=6).hexdigest()
+                    templates[key] = QueryTemplate(template_id, row.get("database"), cypher, slots)
+                templates[key].add_pattern(row["question"], pattern, values)
+        return [template for template in templates.values() if template.support >= min_support]
+
+    @staticmethod
+    def parameterize(question: str, cypher: str) -> Tuple[str, Dict[str, str], str, Dict[str, str]]:
+        """
+        Replaces the Cypher literals whose values appear in the question with slots.
+
+        Returns:
+            Tuple[str, Dict[str, str], str, Dict[str, str]]: The Cypher template, slot types, question pattern and
+            the slot values of this example.
+        """
+        slots: Dict[str, str] = {}
+        values: Dict[str, str] = {}
+        slot_of_value: Dict[str, str] = {}
+        pattern = question
+        pieces = []
+        position = 0
+        for match in CYPHER_LITERAL.finditer(cypher):
+            is_string = match.group(3) is None
+            value = match.group(1) if match.group(1) is not None else match.group(2)
+            value = value if is_string else match.group(3)
+            name = slot_of_value.get(value)
+            if name is None and value.strip():
+                # Whole words only, numbers also not as part of a decimal.
+                separators = r"\w" if is_string else r"\w."
+                prefix = rf"(?<![{separators}])" if re.match(r"\w", value) else ""
+                suffix = rf"(?![{separators}])" if re.search(r"\w$", value) else ""
+                occurrence = re.search(rf"{prefix}{re.escape(value)}{suffix}", pattern, re.IGNORECASE)
+                if occurrence is not None and "{slot" not in occurrence.group(0):
+                    name = f"slot{len(slots)}"
+                    slots[name] = "string" if is_string else "float" if "." in value else "int"
+                    values[name] = occurrence.group(0)
+                    slot_of_value[value] = name
+                    pattern = pattern[:occurrence.start()] + f"{{{name}}}" + pattern[occurrence.end():]
+            if name is None:
+                continue
+            pieces.append(cypher[position:match.start()])
+            pieces.append(f"${name}")
+            position = match.end()
+        pieces.append(cypher[position:])
+        return "".join(pieces), slots, pattern, values
+
+    @staticmethod
+    def from_dataset(dataset_path: str, embed_model=None, min_support: int = 2, top_k: int = 10) -> "TemplateIndex":
+        return TemplateIndex(TemplateIndex.learn(dataset_path, min_support), embed_model, top_k)
+
+    def _similarities(self, question: str) -> np.ndarray:
+        if self._vectors is not None:
+            vector = np.asarray(self.embed_model.embed_query(question), dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            return self._vectors @ (vector / norm if norm else vector)
+        tokens = _tokens(question)
+        return np.array([
+            len(tokens & pattern["tokens"]) / len(tokens | pattern["tokens"]) if tokens | pattern["tokens"] else 0.0
+            for _, pattern in self._patterns
+        ])
+
+    def match(self, question: str, database: Optional[str] = None,
+              exclude_question: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Returns the best template match of `question` with its filled parameters, or None.
+
+        Patterns learned from the same (case and whitespace normalized) question are skipped when
+        `exclude_question` is set, so a question under test is never answered from its own gold Cypher.
+        """
+        if not self._patterns:
+            return None
+        similarities = self._similarities(question).astype(np.float64)
+        if exclude_question:
+            excluded = self._excluded.get(_normalize_question(question), [])
+            if excluded:
+                similarities[excluded] = -np.inf
+
+        k = min(self.top_k, len(self._patterns))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        text = question.strip(TRAILING_PUNCTUATION)
+        for position in top:
+            if not np.isfinite(similarities[position]):
+                break
+            template, pattern = self._patterns[position]
+            if database is not None and template.database not in (None, database):
+                continue
+            match = pattern["regex"].fullmatch(text)
+            if match is None:
+                continue
+            return {
+                "template_id": template.template_id,
+                "cypher": template.cypher,
+                "params": template.fill(match),
+                "confidence": float(similarities[position]),
+                "source_question": pattern["question"],
+            }
+        return None
@@ -0,0 +1,77 @@
+import json
+import math
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from neo4j.graph import Node, Path, Relationship
+from neo4j.spatial import Point
+from neo4j.time import Date, DateTime, Duration, Time
+
+ORDER_BY = re.compile(r"\bORDER\s+BY\b", re.IGNORECASE)
+
+
+def to_typed(value: Any) -> Any:
+    """
+    Converts a Neo4j value into plain JSON data with explicit type tags for non-JSON types.
+
+    Maps are emitted with sorted keys; node labels are sorted and element ids are dropped, since they are not
+    stable across database loads.
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else {"$float": str(value)}
+    if isinstance(value, DateTime):
+        return {"$datetime": value.iso_format()}
+    if isinstance(value, Date):
+        return {"$date": value.iso_format()}
+    if isinstance(value, Time):
+        return {"$time": value.iso_format()}
+    if isinstance(value, Duration):
+        return {"$duration": value.iso_format()}
+    if isinstance(value, Node):
+        return {"$node": {"labels": sorted(value.labels), "properties": to_typed(dict(value.items()))}}
+    if isinstance(value, Relationship):
+        return {"$relationship": {"type": value.type, "properties": to_typed(dict(value.items()))}}
+    if isinstance(value, Path):
+        return {"$path": {"nodes": [to_typed(n) for n in value.nodes],
+                          "relationships": [to_typed(r) for r in value.relationships]}}
+    if isinstance(value, Point):
+        return {"$point": {"srid": value.srid, "coordinates": [to_typed(c) for c in value]}}
+    if isinstance(value, (bytes, bytearray)):
+        return {"$bytes": bytes(value).hex()}
+    if isinstance(value, dict):
+        return {str(k): to_typed(value[k]) for k in sorted(value, key=str)}
+    if isinstance(value, (list, tuple)):
+        return [to_typed(v) for v in value]
+    return {"$string": str(value)}
+
+
+def canonical_json(typed: Any) -> str:
+    return json.dumps(typed, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+class TypedAnswerBuilder:
+    """
+    Collects the typed rows of a result while its records are streamed to another consumer.
+
+    Rows keep the query's order when it has an ORDER BY and are sorted canonically otherwise, so the same result
+    always produces the same typed answer.
+    """
+
+    def __init__(self, query: str):
+        self.ordered = bool(ORDER_BY.search(query))
+        self._columns: Optional[List[str]] = None
+        self._rows: List[List[Any]] = []
+
+    def collect(self, records: Iterable) -> Iterator:
+        for record in records:
+            if record:
+                if self._columns is None:
+                    self._columns = list(record.keys())
+                self._rows.append([to_typed(v) for v in record.values()])
+            yield record
+
+    def build(self) -> Dict[str, Any]:
+        rows = self._rows if self.ordered else sorted(self._rows, key=canonical_json)
+        return {"columns": self._columns or [], "rows": rows, "ordered": self.ordered}
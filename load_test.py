@@ -0,0 +1,100 @@
+"""
+Open-loop load test of a solution: drives `Solution.predict` at one or more target request rates and reports
+queueing delay, service time, throughput and error rate over time, to find the solution's saturation point.
+
+    python load_test.py fake fake/lognormal:0.2:0.3 --db-url fake:// --rps 5 10 20 40 --duration 30 \
+        --dataset datasets/movies/questions_and_answers_movies_filtered.jsonl
+"""
+import argparse
+import json
+import os
+from itertools import islice
+
+from graph_agents_benchmark.src.load_generator import ARRIVALS, LoadGenerator
+from graph_agents_benchmark.src.settings import RESULTS_DIR
+from graph_agents_benchmark.src.solution_builder import NEO4J_PASSWORD, NEO4J_URL, NEO4J_USER, build_solution
+from graph_agents_benchmark.src.utils.data_loaders import FsDataLoader
+
+DEFAULT_QUESTIONS = ["What  database I have in graph db?"]
+
+
+def print_report(reports):
+    print(
+        f"\n{'rps':>8} {'offered':>8} {'thruput':>8} {'err %':>6} {'queue p95':>10} "
+        f"{'svc p50':>8} {'svc p95':>8} {'lat p95':>8}  saturated"
+    )
+    for r in reports:
+        print(
+            f"{r['target_rps']:>8.1f} {r['offered_rps']:>8.1f} {r['throughput']:>8.1f} {r['error_rate'] * 100:>6.1f} "
+            f"{r['queue_delay_p95'] or 0:>10.3f} {r['service_time_p50'] or 0:>8.3f} "
+            f"{r['service_time_p95'] or 0:>8.3f} {r['latency_p95'] or 0:>8.3f}  {'yes' if r['saturated'] else 'no'}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-loop load test of a text-to-Cypher solution.")
+    parser.add_argument("solution", choices=["langchain", "llamaindex", "vectorrag", "custom", "fake"])
+    parser.add_argument("model", help="LLM model, e.g. vertex/gemini-1.5-pro-002 or fake/lognormal:0.8:0.3.")
+    parser.add_argument("--dataset", default=None, help="Dataset the questions are sampled from.")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of questions taken from --dataset.")
+    parser.add_argument("--db-url", default=NEO4J_URL, help="Neo4j URL, fake:// for the in-process stand-in.")
+    parser.add_argument("--db-name", default="neo4j", help="Neo4j database name.")
+    parser.add_argument("--rps", type=float, nargs="+", default=[1.0], help="Target request rates, run in order.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load per request rate.")
+    parser.add_argument("--arrivals", choices=ARRIVALS, default="poisson", help="Arrival process.")
+    parser.add_argument("--concurrency", type=int, default=64, help="Requests served at the same time.")
+    parser.add_argument("--window", type=float, default=1.0, help="Time series bucket width in seconds.")
+    parser.add_argument("--warmup", type=int, default=0, help="Questions run before the first load level.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of question sampling and arrivals.")
+    parser.add_argument("--stop-on-saturation", action="store_true",
+                        help="Skip the remaining request rates once a level saturates.")
+    parser.add_argument("--output", default=None,
+                        help="Report file. Defaults to results/<provider>/<solution>_load_test.json.")
+    args = parser.parse_args()
+
+    questions = DEFAULT_QUESTIONS
+    if args.dataset:
+        qa_loader = FsDataLoader(args.dataset, file_type=FsDataLoader.infer_file_type(args.dataset))
+        questions = [question for question, _, _ in islice(qa_loader.iter_qa(), args.limit)]
+
+    solution, _, _, warmup_done = build_solution(
+        solution_name=args.solution,
+        model=args.model,
+        db_user=NEO4J_USER,
+        db_password=NEO4J_PASSWORD,
+        db_url=args.db_url,
+        db_name=args.db_name,
+    )
+    for question in questions[:args.warmup]:
+        solution.predict(question)
+    if args.warmup:
+        warmup_done()
+
+    reports = []
+    for rps in args.rps:
+        print(f"⏳ {rps} rps ({args.arrivals}) for {args.duration}s...")
+        generator = LoadGenerator(
+            solution.predict,
+            questions,
+            rps=rps,
+            duration=args.duration,
+            arrivals=args.arrivals,
+            concurrency=args.concurrency,
+            window=args.window,
+            seed=args.seed,
+        )
+        reports.append(generator.run())
+        if args.stop_on_saturation and reports[-1]["saturated"]:
+            print(f"⚠️ Saturated at {rps} rps")
+            break
+
+    print_report(reports)
+
+    output = args.output or os.path.join(RESULTS_DIR, args.model.split("/")[0], f"{args.solution}_load_test.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(reports, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
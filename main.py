@@ -1,10 +1,5 @@
 import sys
 
-from graph_agents_benchmark.src.solutions.base import Solution
-from graph_agents_benchmark.src.utils.neo4j_data_population import (
-    populate_neo4j_from_huggingface,
-)
-
 print(sys.path)
 
 import csv
@@ -12,78 +7,22 @@ import os
 import time
 import json
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from nltk.translate.bleu_score import sentence_bleu
 
 from graph_agents_benchmark.src.executor import Executor
-from graph_agents_benchmark.src.utils.benchmark_data_loader import BenchmarkDataLoader
-from graph_agents_benchmark.src.utils.neo4j_integration import Neo4jConnectionManager
-
-NEO4J_USER = "neo4j"
-# NEO4J_USER = "twitter"
-NEO4J_PASSWORD = "test_password"
-# NEO4J_PASSWORD = "twitter"
-NEO4J_URL = "bolt://0.0.0.0:7687"  # Use docker-compose service name
-
-
-# NEO4J_URL = "neo4j+s://demo.neo4jlabs.com:7687"  # Use docker-compose service name
-
-
-def get_solution(
-        solution_name: str,
-        model: str,
-        db_user: str,
-        db_password: str,
-        db_url: str,
-        db_name: str,
-) -> Solution:
-    """
-    Retrieves a solution based on the provided name.
-
-    Args:
-        solution_name (str): The name of the solution to retrieve (e.g., "langchain", "llamaindex", "custom").
-        model (str): The LLM model to use for the solution.
-        db_user (str): The database user.
-        db_password (str): The database password.
-        db_url (str): The database URL.
-        db_name (str): The database name.
-
-    Returns:
-        Solution: An instance of the requested solution.
-
-    Raises:
-        ValueError: If an unknown solution name is provided.
-    """
-    if solution_name == "langchain":
-        from graph_agents_benchmark.src.solutions.langchain import LangChainSolution
-
-        lch = LangChainSolution(
-            config={
-                "model_name": model,
-                "db_user": db_user,
-                "db_password": db_password,
-                "db_url": db_url,
-                "db_name": db_name,
-                "db_user": db_user,
-                "db_password": db_password,
-                "db_url": db_url,
-                "db_name": db_name,
-            }
-        )
-        lch.initialize()
-        return lch
-    elif solution_name == "llamaindex":
-        from graph_agents_benchmark.src.solutions.llamaindex import LlamaIndexSolution
-
-        return LlamaIndexSolution()
-
-    elif solution_name == "custom":
-        from graph_agents_benchmark.src.solutions.text2neo import Text2NeoSolution
-
-        return Text2NeoSolution(model_name="test")
-    else:
-        raise ValueError(f"Unknown solution: {solution_name}")
+from graph_agents_benchmark.src.llm.embedding_pipeline import EMBEDDING_CACHE_DIR
+from graph_agents_benchmark.src.settings import RESULTS_DIR
+from graph_agents_benchmark.src.solution_builder import (
+    NEO4J_DATABASE,
+    NEO4J_PASSWORD,
+    NEO4J_URL,
+    NEO4J_USER,
+    build_solution,
+    build_worker,
+)
+from graph_agents_benchmark.src.utils.run_store import RUNS_DIR, RunStore
 
 
 def calculate_accuracy(question, expected, actual):
@@ -109,6 +48,26 @@ def benchmark_solutions(
         db_password: str,
         db_url: str,
         db_name: str,
+        batch_size: int = 1,
+        semantic_cache_threshold: Optional[float] = None,
+        few_shot_dataset: Optional[str] = None,
+        few_shot_k: int = 3,
+        cypher_gate_mode: Optional[str] = None,
+        max_estimated_rows: Optional[float] = None,
+        workers: int = 1,
+        warmup: int = 0,
+        query_profile_mode: Optional[str] = None,
+        metrics=None,
+        verbose: bool = True,
+        embedding_cache_dir: Optional[str] = EMBEDDING_CACHE_DIR,
+        template_dataset: Optional[str] = None,
+        template_threshold: float = 0.8,
+        template_min_support: int = 2,
+        template_database: Optional[str] = None,
+        reset_between_questions: bool = False,
+        memory_profiler=None,
+        schema=None,
+        keep_vector_index: bool = False,
 ):
     """
     Benchmarks a given solution.
@@ -121,40 +80,144 @@ def benchmark_solutions(
         db_password (str): The database password.
         db_url (str): The database URL.
         db_name (str): The database name.
+        batch_size (int): The micro-batch size passed to `Solution.predict_batch`. 1 runs questions one at a time.
+        semantic_cache_threshold (Optional[float]): Enables the semantic question cache with this cosine similarity threshold.
+        few_shot_dataset (Optional[str]): Enriched dataset file whose examples are added to every question as few-shot prompts.
+        few_shot_k (int): The number of few-shot examples per question.
+        cypher_gate_mode (Optional[str]): Enables EXPLAIN pre-validation of generated Cypher ("flag" or "reject").
+        max_estimated_rows (Optional[float]): Planner row estimate above which the Cypher gate flags a query.
+        workers (int): The number of worker processes, each with its own solution instance. 1 runs in-process.
+        warmup (int): The number of leading questions additionally run unscored after building the solution (per worker).
+        query_profile_mode (Optional[str]): Adds the cost of each question's Cypher to its result row ("summary" or "profile").
+        metrics (Optional[RunMetrics]): Live run metrics updated while the benchmark runs.
+        verbose (bool): Print every question with its expected and actual answer.
+        embedding_cache_dir (Optional[str]): Persistent vector cache of the solution's embedding model. None disables it.
+        template_dataset (Optional[str]): Enriched dataset file Cypher templates are learned from; matching questions skip the LLM.
+        template_threshold (float): The minimal template classifier confidence for skipping the LLM.
+        template_min_support (int): The minimal number of distinct questions a template is learned from.
+        template_database (Optional[str]): Only answer from templates learned for this dataset database (e.g. "movies").
+        reset_between_questions (bool): Clear the solution's conversational state (e.g. agent chat memory) after every question.
+        memory_profiler (Optional[MemoryProfiler]): Adds the process memory after every question to its result row. Worker
+            processes sample their own memory in the same mode.
+        schema (Optional[SchemaSnapshot]): Stored database schema shared by the solution instances of all workers.
+        keep_vector_index (bool): Leave the vector index and embedding nodes of the vectorrag solution in the
+            database after the run instead of removing them.
 
     Returns:
-        List[Dict[str, Any]]: A list of dictionaries containing the benchmark results.
+        Tuple[List[Dict[str, Any]], Dict[str, Any]]: The benchmark results and the latency report with
+        initialization, cold-start and steady-state latency (see `Executor.latency_report`).
     """
     print(f"Benchmarking solution: {solution_name}")
 
+    solution_kwargs = dict(
+        solution_name=solution_name,
+        model=model,
+        db_user=db_user,
+        db_password=db_password,
+        db_url=db_url,
+        db_name=db_name,
+        semantic_cache_threshold=semantic_cache_threshold,
+        few_shot_dataset=few_shot_dataset,
+        few_shot_k=few_shot_k,
+        cypher_gate_mode=cypher_gate_mode,
+        max_estimated_rows=max_estimated_rows,
+        query_profile_mode=query_profile_mode,
+        embedding_cache_dir=embedding_cache_dir,
+        template_dataset=template_dataset,
+        template_threshold=template_threshold,
+        template_min_support=template_min_support,
+        template_database=template_database,
+        reset_between_questions=reset_between_questions,
+        schema=schema,
+    )
     results = []
+    latency_report = {}
 
     try:
-        solution = get_solution(
-            solution_name=solution_name,
-            model=model,
-            db_user=db_user,
-            db_password=db_password,
-            db_url=db_url,
-            db_name=db_name,
+        if workers > 1:
+            from functools import partial
+            from graph_agents_benchmark.src.process_executor import ProcessExecutor
+
+            if memory_profiler is not None:
+                solution_kwargs.update(
+                    memory_profile_mode=memory_profiler.mode, memory_sample_every=memory_profiler.sample_every
+                )
+            executor = ProcessExecutor(
+                partial(build_worker, **solution_kwargs),
+                qa_pairs,
+                workers=workers,
+                warmup=warmup,
+                metrics=metrics,
+                verbose=verbose,
+            )
+            results = executor.execute(calculate_accuracy)
+            return results, executor.latency_report(results)
+
+        start_time = time.time()
+        solution, metadata_provider, cypher_gate, warmup_done = build_solution(
+            **solution_kwargs, memory_profiler=memory_profiler
         )
+        init_time = time.time() - start_time
+        if metrics is not None and cypher_gate is not None:
+            metrics.add_source("cypher_gate", lambda: cypher_gate.stats)
 
         # solution.populate(benchmark_data_file)
 
         def predictor(question):
             return solution.predict(question)
 
-        executor = Executor(predictor, qa_pairs)
+        def batch_predictor(questions):
+            if reset_between_questions and not solution.concurrent_predict:
+                # A stateful solution answers a batch one question at a time; each one starts from a clean state
+                # as in unbatched runs, instead of the batch sharing one conversation until the reset after it.
+                answers = []
+                for question in questions:
+                    answers.append(solution.predict(question))
+                    solution.reset()
+                return answers
+            return solution.predict_batch(questions, max_concurrency=batch_size)
+
+        executor = Executor(
+            predictor,
+            qa_pairs,
+            batch_predictor=batch_predictor,
+            batch_size=batch_size,
+            metadata_provider=metadata_provider,
+            warmup=warmup,
+            metrics=metrics,
+            verbose=verbose,
+            warmup_done=warmup_done,
+        )
         results = executor.execute(calculate_accuracy)
+        latency_report = Executor.latency_report(results, init_time, executor.warmup_times, executor.run_time)
+
+        # Index build time of retrieval solutions, kept apart from per-question latency (part of init_time).
+        base_solution = solution
+        while hasattr(base_solution, "solution"):
+            base_solution = base_solution.solution
+        if getattr(base_solution, "index_report", None) is not None:
+            latency_report["index_build"] = base_solution.index_report
+
+        if cypher_gate is not None:
+            print(f"Cypher gate stats: {cypher_gate.stats}")
     except Exception as e:
         print(f"Error during benchmarking: {repr(e)}")
-        return []  # Return empty list on error
+        return [], {}  # Return empty results on error
 
-    # finally:
-    # if neo4j_conn:
-    # neo4j_conn.close()
+    finally:
+        # The embedding nodes would otherwise stay in the database under test for every later run.
+        if solution_name == "vectorrag" and not keep_vector_index:
+            from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+            from graph_agents_benchmark.src.solutions.vector_rag import VectorRagSolution
 
-    return results
+            try:
+                driver = Neo4jDriverRegistry.get(db_url, db_user, db_password, db_name)
+                removed = VectorRagSolution.drop_embeddings(driver, db_name)
+                print(f"🧹 Vector index dropped ({removed} embedding nodes removed)")
+            except Exception as e:
+                print(f"⚠️ Could not drop the vector index: {repr(e)}")
+
+    return results, latency_report
 
 
 def create_file_if_not_exists(file_path):
@@ -210,25 +273,341 @@ def main():
     )
     parser.add_argument(
         "solution",
-        choices=["langchain", "llamaindex", "custom"],
+        choices=["langchain", "llamaindex", "vectorrag", "custom", "fake"],
         help="The solution to benchmark.",
     )
 
     parser.add_argument(
         "model",
-        help="LLM model to use for benchmark. [vertex/gemini-1.5-pro-002, ollama/deepseek-r1:32b, etc]",
+        help="LLM model to use for benchmark. [vertex/gemini-1.5-pro-002, ollama/deepseek-r1:32b, fake/lognormal:0.8:0.3, etc]",
+    )
+    parser.add_argument(
+        "--dataset",
+        default=None,
+        help="Question/answer dataset streamed into the benchmark (.jsonl[.gz], .parquet, .arrow, .csv, .json).",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum number of questions taken from --dataset.",
+    )
+    parser.add_argument(
+        "--sample",
+        type=float,
+        default=None,
+        help="Run a deterministic stratified sample of this fraction of --dataset (e.g. 0.05), stratified by database, Cypher hops/aggregations and answer size.",
+    )
+    parser.add_argument(
+        "--sample-seed",
+        type=int,
+        default=0,
+        help="Seed of --sample; the same seed always selects the same questions.",
+    )
+    parser.add_argument(
+        "--sample-min-per-stratum",
+        type=int,
+        default=1,
+        help="Minimum number of sampled questions per stratum (2 gives every stratum its own variance estimate). "
+             "The questions it adds are taken from the largest strata; the effective fraction is reported.",
+    )
+    parser.add_argument(
+        "--shard",
+        default=None,
+        help="Run only shard i of N (0-based, e.g. 0/4). Questions are split by a stable hash; merge with merge_results.py.",
+    )
+    parser.add_argument(
+        "--db-url",
+        default=NEO4J_URL,
+        help="Neo4j URL. Use fake://[<distribution>[:<mean>[:<spread>]]] for the in-process stand-in.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Number of questions sent to the solution per micro-batch. 1 disables batching.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes, each building its own solution once. 1 runs in-process.",
+    )
+    parser.add_argument(
+        "--profile-queries",
+        choices=["summary", "profile"],
+        default=None,
+        help="Record Neo4j cost of each question's Cypher: result summary timings, or full PROFILE with db hits.",
+    )
+    parser.add_argument(
+        "--embedding-cache-dir",
+        default=EMBEDDING_CACHE_DIR,
+        help="Persistent vector cache, so every text is embedded once per embedding model across runs.",
+    )
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Always call the embedding model.",
+    )
+    parser.add_argument(
+        "--keep-vector-index",
+        action="store_true",
+        help="Keep the vectorrag embedding nodes and vector index in the database after the run, so later runs reuse them.",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        choices=["rss", "tracemalloc"],
+        default=None,
+        help="Record process memory after each question and report its growth; tracemalloc also finds growing allocation sites (in-process runs only) but slows the run.",
+    )
+    parser.add_argument(
+        "--memory-sample-every",
+        type=int,
+        default=1,
+        help="Sample memory after every n-th question only.",
+    )
+    parser.add_argument(
+        "--reset-between-questions",
+        action="store_true",
+        help="Clear the solution's conversational state (e.g. LlamaIndex ReActAgent chat memory) after every question.",
+    )
+    parser.add_argument(
+        "--schema-dump",
+        default=None,
+        help="Neo4j dump (name in neo4j/dumps or path) the database was loaded from; keys the schema snapshot by its hash.",
+    )
+    parser.add_argument(
+        "--schema-dir",
+        default=None,
+        help="Directory of the stored schema snapshots (default: schema_snapshots/).",
+    )
+    parser.add_argument(
+        "--refresh-schema",
+        action="store_true",
+        help="Capture the schema snapshot again even if one is stored for the database.",
+    )
+    parser.add_argument(
+        "--no-schema-snapshot",
+        action="store_true",
+        help="Let every solution introspect the schema itself (APOC/Neo4jGraph) instead of sharing a stored snapshot.",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print every question with its expected and actual answer.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Periodically rewrite live run metrics (Prometheus text format) to this file and print progress.",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live run metrics for Prometheus at http://<metrics-host>:<port>/metrics.",
+    )
+    parser.add_argument(
+        "--metrics-host",
+        default="127.0.0.1",
+        help="Interface --metrics-port listens on; use 0.0.0.0 to expose the metrics beyond this machine.",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between --metrics-file updates.",
+    )
+    parser.add_argument(
+        "--runs-dir",
+        default=RUNS_DIR,
+        help="Directory keeping every run with its metadata, for compare_runs.py.",
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Do not keep this run in --runs-dir.",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=0,
+        help="Number of leading questions first run unscored (and answered again in the measured run) to exclude model loading and connection setup from the results.",
+    )
+    parser.add_argument(
+        "--semantic-cache-threshold",
+        type=float,
+        default=None,
+        help="Reuse answers of previous questions at least this cosine-similar (e.g. 0.95). Disabled by default.",
+    )
+    parser.add_argument(
+        "--few-shot-dataset",
+        default=None,
+        help="Enriched dataset JSONL used as few-shot example index, e.g. datasets/movies/questions_and_answers_movies_filtered.jsonl.",
+    )
+    parser.add_argument(
+        "--few-shot-k",
+        type=int,
+        default=3,
+        help="Number of few-shot examples added to each question.",
+    )
+    parser.add_argument(
+        "--template-dataset",
+        default=None,
+        help="Enriched dataset JSONL Cypher templates are learned from; matching questions are answered without the LLM.",
+    )
+    parser.add_argument(
+        "--template-threshold",
+        type=float,
+        default=0.8,
+        help="Minimal template classifier confidence for skipping the LLM.",
+    )
+    parser.add_argument(
+        "--template-min-support",
+        type=int,
+        default=2,
+        help="Minimal number of distinct questions a Cypher template is learned from.",
+    )
+    parser.add_argument(
+        "--template-database",
+        default=None,
+        help="Only answer from templates learned for this dataset database (default: the database of the first --dataset row).",
+    )
+    parser.add_argument(
+        "--cypher-gate",
+        choices=["flag", "reject"],
+        default=None,
+        help="Validate generated Cypher with EXPLAIN before execution; 'reject' also blocks runaway queries.",
+    )
+    parser.add_argument(
+        "--max-estimated-rows",
+        type=float,
+        default=1_000_000,
+        help="Planner row estimate above which the Cypher gate treats a query as runaway.",
     )
     args = parser.parse_args()
 
-    results = benchmark_solutions(
+    qa_pairs = [("What  database I have in graph db?", "The answer")]
+    total = None
+    stratum_index = None
+    if args.sample is not None and not args.dataset:
+        parser.error("--sample requires --dataset")
+    if args.dataset:
+        from itertools import islice
+        from graph_agents_benchmark.src.utils.data_loaders import FsDataLoader
+
+        qa_loader = FsDataLoader(args.dataset, file_type=FsDataLoader.infer_file_type(args.dataset))
+        qa_pairs = qa_loader.iter_qa(metadata_columns=["database", "cypher"])
+        total = args.limit
+        if args.sample is not None:
+            from graph_agents_benchmark.src.utils.sampling import StratumIndex, filter_sample
+
+            stratum_index = StratumIndex.load_or_build(args.dataset)
+            sampled = stratum_index.sample(args.sample, seed=args.sample_seed,
+                                           min_per_stratum=args.sample_min_per_stratum)
+            effective_fraction = len(sampled) / len(stratum_index) if len(stratum_index) else 0.0
+            print(f"Sampled {len(sampled)} of {len(stratum_index)} questions from {len(stratum_index.strata)} strata "
+                  f"(fraction {args.sample}, effective {effective_fraction:.2%}, seed {args.sample_seed})")
+            if effective_fraction > args.sample * 1.1:
+                print(f"⚠️ The per-stratum minimum of {args.sample_min_per_stratum} raises the sample from "
+                      f"{args.sample:.2%} to {effective_fraction:.2%} of the questions")
+            qa_pairs = filter_sample(qa_pairs, sampled)
+            total = min(len(sampled), args.limit) if args.limit is not None else len(sampled)
+        qa_pairs = islice(qa_pairs, args.limit)
+
+    shard = None
+    if args.shard:
+        from graph_agents_benchmark.src.utils.sharding import filter_shard, parse_shard
+
+        shard = parse_shard(args.shard)
+        qa_pairs = filter_shard(qa_pairs, *shard)
+        print(f"Running shard {shard[0]} of {shard[1]}")
+
+    metrics = None
+    metrics_surfaces = []
+    if args.metrics_file or args.metrics_port is not None:
+        from graph_agents_benchmark.src.utils.run_metrics import MetricsFileWriter, MetricsServer, RunMetrics
+
+        metrics = RunMetrics(total=len(qa_pairs) if isinstance(qa_pairs, list) else total)
+        if args.metrics_file:
+            metrics_surfaces.append(
+                MetricsFileWriter(metrics, args.metrics_file, interval=args.metrics_interval, progress=True).start()
+            )
+        if args.metrics_port is not None:
+            metrics_surfaces.append(MetricsServer(metrics, args.metrics_port, host=args.metrics_host).start())
+            print(f"🟢 Serving metrics at http://{args.metrics_host}:{args.metrics_port}/metrics")
+
+    memory_profiler = None
+    if args.profile_memory is not None:
+        from graph_agents_benchmark.src.utils.memory_profiler import MemoryProfiler
+
+        memory_profiler = MemoryProfiler(args.profile_memory, sample_every=args.memory_sample_every)
+        if args.profile_memory == "tracemalloc":
+            print("⚠️ tracemalloc slows down every allocation, latencies of this run are not comparable")
+
+    schema = None
+    schema_report = None
+    if not args.no_schema_snapshot and args.solution != "custom":
+        from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+        from graph_agents_benchmark.src.utils.schema_snapshot import SCHEMA_DIR, SchemaStore
+
+        start_time = time.time()
+        schema, loaded = SchemaStore(args.schema_dir or SCHEMA_DIR).load_or_capture(
+            Neo4jDriverRegistry.get(args.db_url, NEO4J_USER, NEO4J_PASSWORD, NEO4J_DATABASE),
+            database=NEO4J_DATABASE,
+            dump=args.schema_dump,
+            refresh=args.refresh_schema,
+        )
+        schema_report = {
+            "fingerprint": schema.fingerprint,
+            "loaded_from_disk": loaded,
+            "time": time.time() - start_time,
+            "capture_time": schema.capture_time,
+        }
+        print(f"✅ Schema snapshot {schema.fingerprint} {'loaded' if loaded else 'captured'} "
+              f"in {schema_report['time']:.2f}s ({len(schema.node_labels)} labels, "
+              f"{len(schema.relationship_types)} relationship types)")
+
+    # Templates are learned per dataset database; only those of the benchmarked one may answer its questions.
+    template_database = args.template_database
+    if args.template_dataset is not None and template_database is None and args.dataset:
+        first_row = next(iter(FsDataLoader(args.dataset, file_type=FsDataLoader.infer_file_type(args.dataset))
+                              .iter_qa(metadata_columns=["database"])), None)
+        template_database = first_row[2].get("database") if first_row is not None else None
+
+    results, latency_report = benchmark_solutions(
         solution_name=args.solution,
-        qa_pairs=[("What  database I have in graph db?", "The answer")],
+        qa_pairs=qa_pairs,
         model=args.model,
         db_user=NEO4J_USER,
         db_password=NEO4J_PASSWORD,
-        db_url=NEO4J_URL,
-        db_name="neo4j",
+        db_url=args.db_url,
+        db_name=NEO4J_DATABASE,
+        batch_size=args.batch_size,
+        semantic_cache_threshold=args.semantic_cache_threshold,
+        few_shot_dataset=args.few_shot_dataset,
+        few_shot_k=args.few_shot_k,
+        cypher_gate_mode=args.cypher_gate,
+        max_estimated_rows=args.max_estimated_rows,
+        workers=args.workers,
+        warmup=args.warmup,
+        query_profile_mode=args.profile_queries,
+        metrics=metrics,
+        verbose=not args.quiet,
+        embedding_cache_dir=None if args.no_embedding_cache else args.embedding_cache_dir,
+        template_dataset=args.template_dataset,
+        template_threshold=args.template_threshold,
+        template_min_support=args.template_min_support,
+        template_database=template_database,
+        reset_between_questions=args.reset_between_questions,
+        memory_profiler=memory_profiler,
+        schema=schema,
+        keep_vector_index=args.keep_vector_index,
     )
+    if latency_report and schema_report is not None:
+        latency_report["schema"] = schema_report
+    for surface in metrics_surfaces:
+        surface.stop()
 
     # Aggregate and print results
     if results:
@@ -240,17 +619,162 @@ def main():
         print(f"Avg time: {avg_time:.4f}s")
         print(f"Avg accuracy: {avg_accuracy:.2f}")
         print(f"Avg BLEU score: {avg_bleu:.2f}")
+        if latency_report:
+            print(f"Init time: {latency_report['init_time']:.4f}s")
+            if latency_report.get("schema"):
+                print(f"Schema snapshot: {latency_report['schema']['time']:.4f}s "
+                      f"({'loaded' if latency_report['schema']['loaded_from_disk'] else 'captured'})")
+            if latency_report.get("index_build"):
+                print(f"Index build time: {latency_report['index_build']['index_build_time']:.4f}s "
+                      f"({latency_report['index_build']['embedded_nodes']} nodes embedded)")
+            if latency_report["cold_start_time"] is not None:
+                print(f"Cold start: {latency_report['cold_start_time']:.4f}s")
+            if latency_report["steady_state_avg_time"] is not None:
+                print(
+                    f"Steady state: avg {latency_report['steady_state_avg_time']:.4f}s, "
+                    f"p50 {latency_report['steady_state_p50_time']:.4f}s, "
+                    f"p95 {latency_report['steady_state_p95_time']:.4f}s"
+                )
+            if latency_report.get("throughput_qps") is not None:
+                print(f"Throughput: {latency_report['throughput_qps']:.2f} questions/s")
 
         provider = args.model.split("/")[0]
-        file_name = f"results/{provider}/{args.solution}_benchmark_results.json"
-
-        create_dir_if_not_exists(f"results/{provider}/")
+        file_name = f"{RESULTS_DIR}/{provider}/{args.solution}_benchmark_results.json"
+        cache_report_file_name = f"{RESULTS_DIR}/{provider}/{args.solution}_semantic_cache_report.json"
+        latency_report_file_name = f"{RESULTS_DIR}/{provider}/{args.solution}_latency_report.json"
+        profile_report_file_name = f"{RESULTS_DIR}/{provider}/{args.solution}_query_profile_report.json"
+        template_report_file_name = f"{RESULTS_DIR}/{provider}/{args.solution}_template_report.json"
+        memory_report_file_name = f"{RESULTS_DIR}/{provider}/{args.solution}_memory_report.json"
+        sampling_report_file_name = f"{RESULTS_DIR}/{provider}/{args.solution}_sampling_report.json"
+        if shard is not None:
+            from graph_agents_benchmark.src.utils.sharding import shard_file_name
+
+            file_name = shard_file_name(file_name, *shard)
+            cache_report_file_name = shard_file_name(cache_report_file_name, *shard)
+            latency_report_file_name = shard_file_name(latency_report_file_name, *shard)
+            profile_report_file_name = shard_file_name(profile_report_file_name, *shard)
+            template_report_file_name = shard_file_name(template_report_file_name, *shard)
+            memory_report_file_name = shard_file_name(memory_report_file_name, *shard)
+            sampling_report_file_name = shard_file_name(sampling_report_file_name, *shard)
+
+        create_dir_if_not_exists(f"{RESULTS_DIR}/{provider}/")
         create_file_if_not_exists(file_name)
 
-        with open(
-                f"results/{provider}/{args.solution}_benchmark_results.json", "w"
-        ) as f:
+        with open(file_name, "w") as f:
             json.dump(results, f, indent=4)
+        with open(latency_report_file_name, "w") as f:
+            json.dump(latency_report, f, indent=4)
+        reports = {"latency_report": latency_report}
+
+        if stratum_index is not None:
+            sampling_report = stratum_index.report(results, args.sample, args.sample_seed)
+            print(f"\nStratified estimates ({sampling_report['sample_size']} of {sampling_report['population']} questions, "
+                  f"{sampling_report['strata_sampled']}/{sampling_report['strata']} strata, 95% CI):")
+            for metric in ("time_taken", "accuracy", "blue_score"):
+                estimate = sampling_report[metric]
+                if estimate is not None:
+                    print(f"{metric}: {estimate['mean']:.4f} [{estimate['ci95_low']:.4f}, {estimate['ci95_high']:.4f}]")
+
+            with open(sampling_report_file_name, "w") as f:
+                json.dump(sampling_report, f, indent=4)
+            reports["sampling_report"] = sampling_report
+
+        if args.profile_queries is not None:
+            from graph_agents_benchmark.src.utils.query_profiler import QueryProfiler
+
+            profile_report = QueryProfiler.report(results)
+            db_times = [r["db_time_ms"] for r in results if r.get("db_time_ms") is not None]
+            if db_times:
+                print(f"\nAvg Neo4j time: {sum(db_times) / len(db_times):.1f}ms of {avg_time * 1000:.1f}ms per question")
+            for database, stats in profile_report["databases"].items():
+                print(f"[{database}] {stats['queries']} queries, {stats['db_hits']} db hits, {stats['db_time_ms']}ms")
+                for expensive in stats["most_expensive"]:
+                    print(f"  ⚠️ {expensive['db_hits']} db hits, {expensive['db_time_ms']}ms: {expensive['question']}")
+
+            with open(profile_report_file_name, "w") as f:
+                json.dump(profile_report, f, indent=4)
+            reports["query_profile_report"] = profile_report
+
+        if args.template_dataset is not None:
+            from graph_agents_benchmark.src.solutions.template import TemplateSolution
+
+            template_report = TemplateSolution.report(results)
+            print(f"\nTemplate fast path (threshold {args.template_threshold}):")
+            print(f"Hit rate: {template_report['hit_rate']:.2%} ({template_report['hits']}/{template_report['questions']}), "
+                  f"{template_report['llm_calls_saved']} LLM calls saved")
+            print(f"Avg time hits / fallbacks: {template_report['avg_time_hits']} / {template_report['avg_time_fallbacks']}")
+            print(f"Avg accuracy hits / fallbacks: {template_report['avg_accuracy_hits']} / {template_report['avg_accuracy_fallbacks']}")
+
+            with open(template_report_file_name, "w") as f:
+                json.dump(template_report, f, indent=4)
+            reports["template_report"] = template_report
+
+        if memory_profiler is not None:
+            from graph_agents_benchmark.src.utils.memory_profiler import MemoryProfiler
+
+            memory_report = MemoryProfiler.report(results, args.solution)
+            # Worker processes trace their own allocations; their growth sites are not sent back to the parent.
+            memory_report["growth_sites"] = memory_profiler.growth_sites() if args.workers <= 1 else None
+            memory_profiler.stop()
+            print(f"\nMemory ({args.profile_memory}):")
+            for worker, worker_report in memory_report["workers"].items():
+                rss = worker_report["rss"]
+                per_question = rss["growth_per_question_kb"]
+                print(f"[worker {worker}] RSS {rss['start_mb']:.1f}MB -> {rss['end_mb']:.1f}MB "
+                      f"(peak {rss['peak_mb']:.1f}MB, {per_question if per_question is not None else 0:+.1f}KB/question)")
+            for site in memory_report["growth_sites"] or []:
+                print(f"  ⚠️ +{site['size_diff_mb']:.2f}MB ({site['count_diff']:+d} blocks) at {site['location']}")
+            if args.profile_memory == "tracemalloc" and args.workers > 1:
+                print("  Allocation growth sites are only collected in-process, rerun with --workers 1 to find them")
+
+            with open(memory_report_file_name, "w") as f:
+                json.dump(memory_report, f, indent=4)
+            reports["memory_report"] = memory_report
+
+        if args.semantic_cache_threshold is not None:
+            from graph_agents_benchmark.src.solutions.semantic_cache import CachedSolution
+
+            cache_report = CachedSolution.report(results)
+            print(f"\nSemantic cache (threshold {args.semantic_cache_threshold}):")
+            print(f"Hit rate: {cache_report['hit_rate']:.2%} ({cache_report['hits']}/{cache_report['questions']})")
+            print(f"Saved time: {cache_report['total_saved_time']:.4f}s")
+            print(f"Avg accuracy on hits / misses: {cache_report['avg_accuracy_hits']} / {cache_report['avg_accuracy_misses']}")
+
+            with open(cache_report_file_name, "w") as f:
+                json.dump(cache_report, f, indent=4)
+            reports["semantic_cache_report"] = cache_report
+
+        if not args.no_store:
+            run_dir = RunStore(args.runs_dir).save(
+                args.solution,
+                results,
+                metadata={
+                    "model": args.model,
+                    "dataset": args.dataset,
+                    "limit": args.limit,
+                    "sample": args.sample,
+                    "sample_seed": args.sample_seed,
+                    "shard": args.shard,
+                    "db_url": args.db_url,
+                    "batch_size": args.batch_size,
+                    "workers": args.workers,
+                    "warmup": args.warmup,
+                    "semantic_cache_threshold": args.semantic_cache_threshold,
+                    "few_shot_dataset": args.few_shot_dataset,
+                    "few_shot_k": args.few_shot_k,
+                    "template_dataset": args.template_dataset,
+                    "template_threshold": args.template_threshold,
+                    "template_min_support": args.template_min_support,
+                    "template_database": template_database,
+                    "profile_memory": args.profile_memory,
+                    "reset_between_questions": args.reset_between_questions,
+                    "schema_fingerprint": schema.fingerprint if schema is not None else None,
+                    "cypher_gate": args.cypher_gate,
+                    "profile_queries": args.profile_queries,
+                },
+                reports=reports,
+            )
+            print(f"\n✅ Run stored in {run_dir}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+"""
+Merges per-shard benchmark results written by `main.py --shard i/N` into one result file and report.
+
+    python merge_results.py results/fake/fake_benchmark_results.shard-*.json
+
+Percentiles in the report are recomputed over all questions, so they are the true global values.
+"""
+import argparse
+import json
+import sys
+
+from graph_agents_benchmark.src.utils.sharding import PERCENTILES, SHARD_FILE_PATTERN, merge_shards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge sharded benchmark results.")
+    parser.add_argument("shard_files", nargs="+", help="Shard result files (*.shard-<i>-of-<N>.json).")
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Merged results file. Defaults to the shard file name without the shard suffix.",
+    )
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="Merge even if some shards of the split are missing.",
+    )
+    args = parser.parse_args()
+
+    results, report = merge_shards(args.shard_files)
+    if report["missing_shards"]:
+        print(f"⚠️ Missing shards: {report['missing_shards']} of {report['shard_count']}")
+        if not args.allow_missing:
+            sys.exit(1)
+
+    output = args.output or SHARD_FILE_PATTERN.sub(".json", args.shard_files[0])
+    report_file = output.removesuffix(".json") + "_report.json"
+    with open(output, "w") as f:
+        json.dump(results, f, indent=4)
+    with open(report_file, "w") as f:
+        json.dump(report, f, indent=4)
+
+    if report["questions"]:
+        print(f"Merged {report['questions']} results from {len(report['shards'])} shards into {output}")
+        print(f"Avg time: {report['avg_time']:.4f}s")
+        print(" ".join(f"p{p}: {report[f'p{p}_time']:.4f}s" for p in PERCENTILES))
+        print(f"Avg accuracy: {report['avg_accuracy']:.2f}")
+        print(f"Avg BLEU score: {report['avg_bleu']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import pytest
+
+from graph_agents_benchmark.src.infrastucture.driver_registry import Neo4jDriverRegistry
+from graph_agents_benchmark.src.infrastucture.fake_neo4j import FAKE_URI_SCHEME, FakeNeo4jDriver
+
+DB_USER = "neo4j"
+DB_PASSWORD = "neo4j_test_password"
+DB_NAME = "test"
+
+
+@pytest.fixture
+def fake_neo4j():
+    """
+    Registers FakeNeo4jDriver instances under fake:// for the duration of a test, e.g.
+    `fake_neo4j(results={cypher: rows})`, and closes them afterwards.
+    """
+
+    def register(**kwargs) -> FakeNeo4jDriver:
+        driver = FakeNeo4jDriver(**kwargs)
+        Neo4jDriverRegistry.register(FAKE_URI_SCHEME, DB_USER, DB_PASSWORD, DB_NAME, driver)
+        return driver
+
+    yield register
+    Neo4jDriverRegistry.close(FAKE_URI_SCHEME)
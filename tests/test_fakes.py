@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from conftest import DB_NAME, DB_PASSWORD, DB_USER
+from graph_agents_benchmark.src.infrastucture.fake_neo4j import FAKE_URI_SCHEME
+from graph_agents_benchmark.src.llm.fake_llm import FakeEmbedding, FakeLLM
+from graph_agents_benchmark.src.solutions.fake import FakeSolution
+from graph_agents_benchmark.src.utils.latency import LatencyModel
+
+CYPHER = "MATCH (m:Movie) RETURN m.title AS title"
+ROWS = [{"title": "The Matrix"}, {"title": "Cloud Atlas"}]
+
+
+def test_latency_model_parse():
+    model = LatencyModel.parse("uniform:0.5:0.1")
+    assert (model.distribution, model.mean, model.spread) == ("uniform", 0.5, 0.1)
+    assert LatencyModel.parse("").sample() == 0.0
+    with pytest.raises(ValueError):
+        LatencyModel.parse("gamma:1")
+
+
+def test_latency_model_is_deterministic_for_a_seed():
+    first = [LatencyModel.parse("lognormal:0.8:0.3", seed=7).sample() for _ in range(3)]
+    second = [LatencyModel.parse("lognormal:0.8:0.3", seed=7).sample() for _ in range(3)]
+    assert first == second
+
+
+def test_fake_llm_answers_canned_prompts():
+    llm = FakeLLM(responses={" Which movies? ": CYPHER})
+    assert llm.invoke("Which movies?") == CYPHER
+    assert llm.complete("Anything else?") == llm.default_response
+    assert llm.batch(["Which movies?"]) == [CYPHER]
+    assert llm.calls == 3
+
+
+def test_fake_embedding_is_normalized_and_word_based():
+    embedding = FakeEmbedding(dimensions=16)
+    vector = embedding.embed_query("movies released in 1999")
+    assert len(vector) == 16
+    assert sum(v * v for v in vector) == pytest.approx(1.0)
+    assert embedding.embed_documents(["movies released in 1999"]) == [vector]
+
+
+def test_fake_driver_answers_by_normalized_query(fake_neo4j):
+    driver = fake_neo4j(results={CYPHER: ROWS})
+    with driver.session(database=DB_NAME) as session:
+        assert session.run(f"  {CYPHER}\n").data() == ROWS
+        assert session.run("MATCH (n) RETURN count(n) AS count").data() == [{"count": 0}]
+        assert session.run("CALL db.propertyKeys()").value() == ["title"]
+        profiled = session.run(f"PROFILE {CYPHER}")
+        assert profiled.consume().profile["rows"] == len(ROWS)
+
+
+def test_fake_solution_runs_offline(fake_neo4j):
+    fake_neo4j(results={CYPHER: ROWS})
+    solution = FakeSolution("fake/constant:0", DB_USER, DB_PASSWORD, FAKE_URI_SCHEME, DB_NAME)
+    solution.llm.responses["Which movies?"] = CYPHER
+    assert json.loads(solution.predict("Which movies?")) == ROWS
@@ -0,0 +1,45 @@
+from neo4j.time import Date, DateTime
+
+from conftest import DB_NAME, DB_PASSWORD, DB_USER
+from graph_agents_benchmark.src.infrastucture.fake_neo4j import FAKE_URI_SCHEME
+from graph_agents_benchmark.src.utils.qa_enricher import QAEnricher
+
+CYPHER = "MATCH (m:Movie)<-[:DIRECTED]-(p:Person) RETURN m.title, p.name"
+
+
+def enrich(fake_neo4j, rows, canonical=False):
+    fake_neo4j(results={CYPHER: rows}, property_keys=["title", "name"])
+    enricher = QAEnricher(DB_NAME, neo4j_uri=FAKE_URI_SCHEME, neo4j_user=DB_USER, neo4j_password=DB_PASSWORD,
+                          canonical=canonical)
+    return list(enricher.enrich([{"question": "q", "cypher": CYPHER}]))[0]["answer"]
+
+
+def test_records_keep_the_historical_serialization(fake_neo4j):
+    # Keys are stripped to their property name and emitted in reverse order, as the old pairwise merge did.
+    answer = enrich(fake_neo4j, [{"m.title": "The Matrix", "p.name": "Lana Wachowski"},
+                                 {"m.title": "Cloud Atlas", "p.name": "Tom Tykwer"}])
+    assert answer == ('{"name": "Lana Wachowski", "title": "The Matrix"}\n'
+                      '{"name": "Tom Tykwer", "title": "Cloud Atlas"}')
+
+
+def test_first_occurrence_of_a_duplicate_key_wins(fake_neo4j):
+    answer = enrich(fake_neo4j, [{"m.title": "The Matrix", "n.title": "Speed Racer", "m.released": 1999}])
+    assert answer == '{"released": "1999", "title": "The Matrix"}'
+
+
+def test_values_are_stringified(fake_neo4j):
+    answer = enrich(fake_neo4j, [{"born": Date(1965, 6, 21), "updated": DateTime(2024, 1, 2, 3, 4, 5),
+                                  "genres": ["Action", "Sci-Fi"], "rating": 8.7}])
+    assert answer == ('{"rating": "8.7", "genres": "[\'Action\',\'Sci-Fi\']", '
+                      '"updated": "2024-01-02T03:04:05.000000000", "born": "1965-06-21"}')
+
+
+def test_canonical_sorts_keys(fake_neo4j):
+    rows = [{"p.name": "Lana Wachowski", "m.title": "The Matrix", "m.released": 1999}]
+    assert enrich(fake_neo4j, rows, canonical=True) == (
+        '{"name": "Lana Wachowski", "released": "1999", "title": "The Matrix"}'
+    )
+
+
+def test_empty_results_have_no_answer(fake_neo4j):
+    assert enrich(fake_neo4j, []) is None
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from graph_agents_benchmark.src.utils.run_store import bootstrap_delta, compare_runs
+
+
+def run(times, accuracy=1.0):
+    return [{"time_taken": t, "accuracy": accuracy, "blue_score": 0.5} for t in times]
+
+
+def test_bootstrap_delta_is_seeded_and_brackets_the_delta():
+    rng = np.random.default_rng(1)
+    baseline = rng.normal(1.0, 0.1, 200)
+    candidate = rng.normal(1.5, 0.1, 200)
+    delta, low, high = bootstrap_delta(baseline, candidate, np.mean, resamples=500)
+    assert low < delta < high
+    assert low > 0.4 and high < 0.6
+    assert bootstrap_delta(baseline, candidate, np.mean, resamples=500) == (delta, low, high)
+
+
+def test_identical_runs_do_not_regress():
+    times = np.random.default_rng(2).lognormal(0.0, 0.3, 100).tolist()
+    comparison = compare_runs(run(times), run(times), resamples=500)
+    assert comparison["regressions"] == []
+    assert comparison["metrics"]["avg_time"]["delta"] == pytest.approx(0.0)
+    assert comparison["metrics"]["avg_time"]["ci_low"] <= 0.0 <= comparison["metrics"]["avg_time"]["ci_high"]
+
+
+def test_slower_and_less_accurate_candidate_regresses():
+    rng = np.random.default_rng(3)
+    baseline = run(rng.normal(1.0, 0.05, 100).tolist(), accuracy=1.0)
+    candidate = run(rng.normal(2.0, 0.05, 100).tolist(), accuracy=0.5)
+    comparison = compare_runs(baseline, candidate, resamples=500)
+    assert {"avg_time", "p50_time", "p95_time", "accuracy"} <= set(comparison["regressions"])
+    assert comparison["metrics"]["avg_time"]["relative_delta"] == pytest.approx(1.0, abs=0.05)
+    assert compare_runs(candidate, baseline, resamples=500)["metrics"]["avg_time"]["improved"]
+
+
+def test_latency_within_tolerance_is_not_a_regression():
+    baseline = run([1.0] * 50)
+    candidate = run([1.02] * 50)
+    assert compare_runs(baseline, candidate, resamples=200, latency_tolerance=0.05)["regressions"] == []
+    assert "avg_time" in compare_runs(baseline, candidate, resamples=200, latency_tolerance=0.0)["regressions"]
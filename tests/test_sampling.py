@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from graph_agents_benchmark.src.utils.sampling import (
+    StratumIndex,
+    answer_size,
+    filter_sample,
+    query_complexity,
+    stratum_of,
+)
+
+
+def index_of(sizes):
+    strata, position = {}, 0
+    for key, size in sizes.items():
+        strata[key] = {"positions": list(range(position, position + size)),
+                       "keys": [f"{key}-{i}" for i in range(size)]}
+        position += size
+    return StratumIndex("dataset.jsonl", strata)
+
+
+def test_query_complexity_counts_hops_and_aggregations():
+    assert query_complexity("MATCH (p:Person)-[:ACTED_IN]->(m)<-[:DIRECTED]-(d) RETURN count(m)") == (2, 1)
+    assert query_complexity("MATCH (a)-[*1..4]-(b) RETURN a") == (4, 0)
+    assert query_complexity("MATCH (a)-[*]-(b) RETURN collect(b), avg(b.x)") == (3, 2)
+    assert query_complexity(None) == (0, 0)
+
+
+def test_stratum_of_buckets_answer_sizes():
+    row = {"database": "movies", "cypher": "MATCH (m:Movie) RETURN m.title", "answer": "a\nb\nc"}
+    assert answer_size(row["answer"]) == 3
+    assert stratum_of(row) == "movies/hops=0/aggs=0/rows=2-10"
+
+
+def test_sample_is_proportional_and_deterministic():
+    index = index_of({"a": 600, "b": 300, "c": 100})
+    sampled = index.sample(0.1, seed=3)
+    assert len(sampled) == 100
+    assert sum(stratum == "a" for stratum in sampled.values()) == 60
+    assert index.sample(0.1, seed=3) == sampled
+    assert index.sample(0.1, seed=4) != sampled
+
+
+def test_stratum_minimums_do_not_inflate_the_sample():
+    # 20 single-question strata would add 20 questions on top of a proportional 5% sample.
+    index = index_of({"big": 980} | {f"small{i}": 1 for i in range(20)})
+    sampled = index.sample(0.05, min_per_stratum=1)
+    assert len(sampled) == 50
+    assert set(sampled.values()) == set(index.strata)
+
+
+def test_minimums_beyond_the_sample_size_are_kept():
+    index = index_of({f"s{i}": 10 for i in range(10)})
+    assert len(index.sample(0.01, min_per_stratum=1)) == 10
+    with pytest.raises(ValueError):
+        index.sample(0)
+
+
+def test_report_estimates_with_effective_fraction():
+    index = index_of({"a": 50, "b": 50})
+    sampled = index.sample(0.2)
+    rows = [(f"q{i}", "answer", {}) for i in range(100)]
+    results = [{"metadata": metadata, "time_taken": 1.0 if metadata["stratum"] == "a" else 3.0,
+                "accuracy": 1.0, "blue_score": 0.5} for _, _, metadata in filter_sample(iter(rows), sampled)]
+
+    report = index.report(results, 0.2, seed=0)
+
+    assert report["sample_size"] == 20
+    assert report["effective_fraction"] == pytest.approx(0.2)
+    assert report["time_taken"]["mean"] == pytest.approx(2.0)
+    assert report["time_taken"]["stderr"] == pytest.approx(0.0)
+    assert json.dumps(report)
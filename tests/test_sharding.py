@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+import pytest
+
+from graph_agents_benchmark.src.utils.sharding import (
+    PERCENTILES,
+    filter_shard,
+    merge_shards,
+    parse_shard,
+    shard_file_name,
+    shard_of,
+)
+
+
+def result(question, time_taken):
+    return {"question": question, "time_taken": time_taken, "accuracy": 1.0, "blue_score": 0.5}
+
+
+def test_parse_shard():
+    assert parse_shard(" 1 / 4 ") == (1, 4)
+    for spec in ("4/4", "1", "-1/2", "0/0"):
+        with pytest.raises(ValueError):
+            parse_shard(spec)
+
+
+def test_shards_partition_the_questions():
+    rows = [(f"Question {i}?", "answer") for i in range(200)]
+    shards = [list(filter_shard(rows, index, 3)) for index in range(3)]
+    assert sorted(row for shard in shards for row in shard) == sorted(rows)
+    assert all(shard for shard in shards)
+    assert shard_of("Which  movies?", 3) == shard_of(" Which movies? ", 3)
+
+
+def test_merge_recomputes_global_percentiles(tmp_path):
+    rng = np.random.default_rng(0)
+    times = {index: rng.lognormal(0.0, 1.0 + index, 50).tolist() for index in range(3)}
+    paths = []
+    for index, shard_times in times.items():
+        path = tmp_path / shard_file_name("fake_benchmark_results.json", index, 3)
+        path.write_text(json.dumps([result(f"q{index}-{i}", t) for i, t in enumerate(shard_times)]))
+        paths.append(str(path))
+
+    results, report = merge_shards(paths)
+
+    all_times = [t for shard_times in times.values() for t in shard_times]
+    assert len(results) == report["questions"] == 150
+    assert report["missing_shards"] == []
+    for p, expected in zip(PERCENTILES, np.percentile(all_times, PERCENTILES)):
+        assert report[f"p{p}_time"] == pytest.approx(expected)
+    assert report["shards"]["0"]["questions"] == 50
+
+
+def test_merge_reports_missing_and_rejects_mixed_splits(tmp_path):
+    first = tmp_path / "r.shard-0-of-3.json"
+    first.write_text(json.dumps([result("q", 1.0)]))
+    assert merge_shards([str(first)])[1]["missing_shards"] == [1, 2]
+
+    other = tmp_path / "r.shard-1-of-2.json"
+    other.write_text("[]")
+    with pytest.raises(ValueError):
+        merge_shards([str(first), str(other)])
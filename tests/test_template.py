@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from conftest import DB_NAME, DB_PASSWORD, DB_USER
+from graph_agents_benchmark.src.infrastucture.fake_neo4j import FAKE_URI_SCHEME
+from graph_agents_benchmark.src.models import Frameworks
+from graph_agents_benchmark.src.solutions.base import Solution
+from graph_agents_benchmark.src.solutions.template import TemplateSolution
+from graph_agents_benchmark.src.utils.qa_enricher import QAEnricher
+from graph_agents_benchmark.src.utils.template_index import TemplateIndex
+
+TAGLINE = "MATCH (m:Movie {{title: '{title}'}}) RETURN m.tagline"
+
+
+class EchoSolution(Solution):
+    def get_name(self) -> Frameworks:
+        return Frameworks.FAKE
+
+    def predict(self, question: str) -> str:
+        return f"llm: {question}"
+
+
+def test_parameterize_replaces_literals_found_in_the_question():
+    cypher, slots, pattern, values = TemplateIndex.parameterize(
+        "Which movies with 'Keanu Reeves' were released after 1999?",
+        "MATCH (p:Person {name: 'Keanu Reeves'})-[:ACTED_IN]->(m:Movie) WHERE m.released > 1999 RETURN m.title",
+    )
+    assert cypher == "MATCH (p:Person {name: $slot0})-[:ACTED_IN]->(m:Movie) WHERE m.released > $slot1 RETURN m.title"
+    assert slots == {"slot0": "string", "slot1": "int"}
+    assert pattern == "Which movies with '{slot0}' were released after {slot1}?"
+    assert values == {"slot0": "Keanu Reeves", "slot1": "1999"}
+
+
+def test_parameterize_keeps_literals_missing_from_the_question():
+    cypher, slots, _, _ = TemplateIndex.parameterize(
+        "List the first 3 movies.", "MATCH (m:Movie) WHERE m.released > 1990 RETURN m.title LIMIT 3"
+    )
+    assert cypher == "MATCH (m:Movie) WHERE m.released > 1990 RETURN m.title LIMIT $slot0"
+    assert slots == {"slot0": "int"}
+
+
+def test_variable_length_bounds_are_not_slots():
+    cypher, slots, _, _ = TemplateIndex.parameterize(
+        "Who is within 2 hops of Tom?", "MATCH (p {name: 'Tom'})-[*1..2]-(o) RETURN o.name"
+    )
+    assert cypher == "MATCH (p {name: $slot0})-[*1..2]-(o) RETURN o.name"
+
+
+@pytest.fixture
+def template_index(tmp_path):
+    dataset = tmp_path / "questions.jsonl"
+    with open(dataset, "w") as f:
+        for title in ("The Matrix", "Cloud Atlas", "Speed Racer"):
+            row = {"database": "movies", "question": f"What is the tagline of the movie '{title}'?",
+                   "cypher": TAGLINE.format(title=title)}
+            f.write(json.dumps(row) + "\n")
+    return TemplateIndex.from_dataset(str(dataset))
+
+
+def test_learned_template_fills_new_values(template_index):
+    assert len(template_index) == 1
+    match = template_index.match("What is the tagline of the movie 'V for Vendetta'?", database="movies")
+    assert match["params"] == {"slot0": "V for Vendetta"}
+    assert match["cypher"] == "MATCH (m:Movie {title: $slot0}) RETURN m.tagline"
+    assert template_index.match("What is the tagline of the movie 'V for Vendetta'?", database="twitch") is None
+
+
+def test_template_hits_are_formatted_like_gold_answers(fake_neo4j, template_index):
+    rows = [{"m.tagline": "Freedom! Forever!"}]
+    driver = fake_neo4j(default_rows=rows, property_keys=["title", "tagline"])
+    gold = list(QAEnricher(DB_NAME, neo4j_uri=FAKE_URI_SCHEME, neo4j_user=DB_USER, neo4j_password=DB_PASSWORD)
+                .enrich([{"cypher": TAGLINE.format(title="V for Vendetta")}]))[0]["answer"]
+    solution = TemplateSolution(EchoSolution(), template_index, driver, db_name=DB_NAME, threshold=0.5,
+                                template_database="movies")
+
+    question = "What is the tagline of the movie 'V for Vendetta'?"
+    assert solution.predict(question) == gold == '{"tagline": "Freedom! Forever!"}'
+    assert solution.lookup_info(question)["template_hit"] is True
+    assert solution.predict("Who directed Speed Racer?") == "llm: Who directed Speed Racer?"
+    assert solution.lookup_info("Who directed Speed Racer?")["template_hit"] is False
+    assert solution.lookup_info("Who directed Speed Racer?") == {}
+
+
+def test_report_counts_hits_and_fallbacks():
+    results = [
+        {"template_hit": True, "template_lookup_time": 0.001, "time_taken": 0.01, "accuracy": 1.0},
+        {"template_hit": False, "template_lookup_time": 0.003, "time_taken": 1.01, "accuracy": 0.5},
+        {"template_hit": False, "template_lookup_time": 0.002, "time_taken": 1.01, "accuracy": 0.0,
+         "template_error": "SyntaxError"},
+    ]
+    report = TemplateSolution.report(results)
+    assert report["hits"] == report["llm_calls_saved"] == 1
+    assert report["hit_rate"] == pytest.approx(1 / 3)
+    assert report["errors"] == 1
+    assert report["estimated_saved_time"] == pytest.approx(1.0)
+    assert report["avg_lookup_time"] == pytest.approx(0.002)
+    assert report["avg_accuracy_fallbacks"] == pytest.approx(0.25)
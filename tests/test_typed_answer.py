@@ -0,0 +1,40 @@
+import math
+
+from neo4j import Record
+from neo4j.time import Date, DateTime, Duration
+
+from graph_agents_benchmark.src.utils.typed_answer import TypedAnswerBuilder, canonical_json, to_typed
+
+
+def test_scalars_stay_plain_json():
+    assert [to_typed(v) for v in (None, True, 3, "x", 1.5)] == [None, True, 3, "x", 1.5]
+
+
+def test_non_json_values_are_tagged():
+    assert to_typed(Date(1999, 3, 31)) == {"$date": "1999-03-31"}
+    assert to_typed(DateTime(2024, 1, 2, 3, 4, 5)) == {"$datetime": "2024-01-02T03:04:05.000000000"}
+    assert to_typed(Duration(days=2)) == {"$duration": "P2D"}
+    assert to_typed(math.inf) == {"$float": "inf"}
+    assert to_typed(b"\x01\xff") == {"$bytes": "01ff"}
+
+
+def test_maps_are_sorted_and_nested_values_converted():
+    typed = to_typed({"b": [Date(2000, 1, 1)], "a": (1, 2)})
+    assert list(typed) == ["a", "b"]
+    assert typed == {"a": [1, 2], "b": [{"$date": "2000-01-01"}]}
+    assert canonical_json(typed) == '{"a":[1,2],"b":[{"$date":"2000-01-01"}]}'
+
+
+def test_unordered_results_are_sorted_canonically():
+    records = [Record({"title": "Speed Racer"}), Record({"title": "Cloud Atlas"})]
+    builder = TypedAnswerBuilder("MATCH (m:Movie) RETURN m.title AS title")
+    assert list(builder.collect(records)) == records
+    assert builder.build() == {"columns": ["title"], "rows": [["Cloud Atlas"], ["Speed Racer"]], "ordered": False}
+
+
+def test_ordered_results_keep_their_order():
+    records = [Record({"title": "Speed Racer"}), Record({"title": "Cloud Atlas"})]
+    builder = TypedAnswerBuilder("MATCH (m:Movie) RETURN m.title AS title ORDER BY m.released DESC")
+    list(builder.collect(records))
+    assert builder.build()["rows"] == [["Speed Racer"], ["Cloud Atlas"]]
+    assert builder.build()["ordered"] is True